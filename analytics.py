@@ -0,0 +1,150 @@
+"""
+Колоночный снимок клиентов для отчетов.
+
+Даты регистрации разбираются один раз при построении снимка и хранятся
+числами в array; признаки наличия телефона, email и отчества - байтовыми
+колонками. Группировки считаются по колонкам целиком: через NumPy,
+если он установлен, иначе через collections.Counter.
+"""
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import compress
+
+try:
+    import numpy
+except ImportError:  # NumPy необязателен
+    numpy = None
+
+# Значение колонки для отсутствующей даты регистрации или филиала
+MISSING = -1
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Множитель составного ключа месяц + филиал (ID филиала меньше 2**31)
+_BRANCH_FACTOR = 2 ** 32
+FLAGS = ("phone", "email", "patronymic")
+
+
+def _count(keys, mask: bytearray = None) -> dict:
+    """Считает количество каждого значения колонки (с учетом маски)."""
+    if numpy is not None:
+        values = keys if isinstance(keys, numpy.ndarray) else numpy.frombuffer(keys, dtype=numpy.int64)
+        if mask is not None:
+            values = values[numpy.frombuffer(mask, dtype=numpy.bool_)]
+        unique, counts = numpy.unique(values, return_counts=True)
+        return dict(zip(unique.tolist(), counts.tolist()))
+    if mask is not None:
+        return Counter(compress(keys, mask))
+    return Counter(keys)
+
+
+class ClientSnapshot:
+    """
+    Колоночный снимок коллекции клиентов.
+    registration_days - дни с 1970-01-01, registration_months - год * 12 + месяц - 1,
+    MISSING (-1) для клиентов без даты регистрации.
+    """
+
+    __slots__ = ('client_ids', 'registration_days', 'registration_months', 'branch_ids',
+                 'has_phone', 'has_email', 'has_patronymic')
+
+    def __init__(self):
+        """
+        Инициализирует пустой снимок. Для заполнения используйте from_clients.
+        """
+        self.client_ids = array('q')
+        self.registration_days = array('q')
+        self.registration_months = array('q')
+        self.branch_ids = array('q')
+        self.has_phone = bytearray()
+        self.has_email = bytearray()
+        self.has_patronymic = bytearray()
+
+    @classmethod
+    def from_clients(cls, clients, branches: dict = None):
+        """
+        Строит снимок из клиентов.
+        branches - необязательный словарь ID клиента -> ID филиала.
+        """
+        snapshot = cls()
+        # Даты сильно повторяются, поэтому каждая строка разбирается один раз
+        parsed_dates = {None: (MISSING, MISSING)}
+        branches = branches or {}
+
+        for client in clients:
+            registration_date = client.registration_date
+            parsed = parsed_dates.get(registration_date)
+            if parsed is None:
+                day = date.fromisoformat(registration_date)
+                parsed = parsed_dates[registration_date] = (
+                    day.toordinal() - _EPOCH_ORDINAL, day.year * 12 + day.month - 1)
+            snapshot.client_ids.append(client.client_id)
+            snapshot.registration_days.append(parsed[0])
+            snapshot.registration_months.append(parsed[1])
+            snapshot.branch_ids.append(branches.get(client.client_id, MISSING))
+            snapshot.has_phone.append(client.phone is not None)
+            snapshot.has_email.append(client.email is not None)
+            snapshot.has_patronymic.append(client.patronymic is not None)
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.client_ids)
+
+    # ОТЧЕТЫ
+
+    def count_by_month(self, where: str = None) -> dict:
+        """
+        Возвращает число новых клиентов по месяцам {"ГГГГ-ММ": количество}.
+        where - учитывать только клиентов с указанным полем ("phone", "email", "patronymic").
+        """
+        counts = _count(self.registration_months, self._mask(where))
+        return {f"{month // 12:04d}-{month % 12 + 1:02d}": count
+                for month, count in sorted(counts.items()) if month != MISSING}
+
+    def count_by_branch(self, where: str = None) -> dict:
+        """Возвращает число клиентов по филиалам {ID филиала: количество}."""
+        counts = _count(self.branch_ids, self._mask(where))
+        return {branch_id: count for branch_id, count in sorted(counts.items())
+                if branch_id != MISSING}
+
+    def count_by_month_and_branch(self, where: str = None) -> dict:
+        """Возвращает число новых клиентов {("ГГГГ-ММ", ID филиала): количество}."""
+        mask = self._mask(where)
+        if numpy is not None:
+            # Составной ключ месяц * _BRANCH_FACTOR + (филиал + 1)
+            months = numpy.frombuffer(self.registration_months, dtype=numpy.int64)
+            branch_ids = numpy.frombuffer(self.branch_ids, dtype=numpy.int64)
+            keys = months * _BRANCH_FACTOR + (branch_ids + 1)
+            counts = {}
+            for key, count in _count(keys, mask).items():
+                month, branch = divmod(key, _BRANCH_FACTOR)
+                counts[month, branch - 1] = count
+        else:
+            pairs = zip(self.registration_months, self.branch_ids)
+            counts = Counter(compress(pairs, mask) if mask is not None else pairs)
+        return {(f"{month // 12:04d}-{month % 12 + 1:02d}", branch_id): count
+                for (month, branch_id), count in sorted(counts.items())
+                if month != MISSING and branch_id != MISSING}
+
+    def share(self, field: str) -> float:
+        """Возвращает долю клиентов с указанным полем ("phone", "email", "patronymic")."""
+        mask = self._mask(field)
+        if not mask:
+            return 0.0
+        return mask.count(1) / len(mask)
+
+    def registered_between(self, start: date, end: date) -> int:
+        """Возвращает число клиентов, зарегистрированных с start по end включительно."""
+        first = start.toordinal() - _EPOCH_ORDINAL
+        last = end.toordinal() - _EPOCH_ORDINAL
+        if numpy is not None:
+            days = numpy.frombuffer(self.registration_days, dtype=numpy.int64)
+            return int(numpy.count_nonzero((days >= first) & (days <= last)))
+        return sum(1 for day in self.registration_days if first <= day <= last)
+
+    def _mask(self, field: str) -> bytearray:
+        if field is None:
+            return None
+        if field not in FLAGS:
+            raise ValueError(f"Неизвестное поле: {field}")
+        return getattr(self, f"has_{field}")
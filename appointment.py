@@ -0,0 +1,130 @@
+from datetime import datetime
+
+import validation
+
+
+class Appointment:
+    """
+    Запись клиента к мастеру на интервал времени [start, end).
+    Связана с клиентом через client_id.
+    """
+
+    __slots__ = ('_appointment_id', '_client_id', '_barber_id', '_branch_id', '_start', '_end')
+
+    _check_appointment_id = staticmethod(validation.positive_int("ID записи"))
+    _check_client_id = staticmethod(validation.positive_int("ID клиента"))
+    _check_barber_id = staticmethod(validation.positive_int("ID мастера"))
+    _check_branch_id = staticmethod(validation.positive_int("ID филиала"))
+
+    def __init__(self, appointment_id: int, client_id: int, barber_id: int, branch_id: int,
+                 start: datetime, end: datetime):
+        """
+        Инициализирует запись.
+        """
+        if not isinstance(start, datetime) or not isinstance(end, datetime):
+            raise ValueError("Начало и конец записи должны быть datetime")
+        if start >= end:
+            raise ValueError("Начало записи должно быть раньше конца")
+
+        self._appointment_id = self._check_appointment_id(appointment_id)
+        self._client_id = self._check_client_id(client_id)
+        self._barber_id = self._check_barber_id(barber_id)
+        self._branch_id = self._check_branch_id(branch_id)
+        self._start = start
+        self._end = end
+
+    # СВОЙСТВА (геттеры)
+
+    @property
+    def appointment_id(self) -> int:
+        """Возвращает ID записи."""
+        return self._appointment_id
+
+    @property
+    def client_id(self) -> int:
+        """Возвращает ID клиента."""
+        return self._client_id
+
+    @property
+    def barber_id(self) -> int:
+        """Возвращает ID мастера."""
+        return self._barber_id
+
+    @property
+    def branch_id(self) -> int:
+        """Возвращает ID филиала."""
+        return self._branch_id
+
+    @property
+    def start(self) -> datetime:
+        """Возвращает начало записи."""
+        return self._start
+
+    @property
+    def end(self) -> datetime:
+        """Возвращает конец записи."""
+        return self._end
+
+    @property
+    def duration(self):
+        """Возвращает длительность записи."""
+        return self._end - self._start
+
+    # МЕТОДЫ ПРЕОБРАЗОВАНИЯ
+
+    def moved(self, start: datetime, barber_id: int = None, branch_id: int = None):
+        """Возвращает копию записи, перенесенную на start (длительность сохраняется)."""
+        return Appointment(self._appointment_id, self._client_id,
+                           barber_id or self._barber_id, branch_id or self._branch_id,
+                           start, start + self.duration)
+
+    def to_dict(self) -> dict:
+        """
+        Преобразует запись в словарь (даты в формате ISO).
+        """
+        return {
+            "appointment_id": self.appointment_id,
+            "client_id": self.client_id,
+            "barber_id": self.barber_id,
+            "branch_id": self.branch_id,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Создает запись из словаря.
+        """
+        for field in ("appointment_id", "client_id", "barber_id", "branch_id", "start", "end"):
+            if field not in data:
+                raise ValueError(f"Отсутствует обязательное поле: {field}")
+        try:
+            start = datetime.fromisoformat(data["start"])
+            end = datetime.fromisoformat(data["end"])
+        except (TypeError, ValueError):
+            raise ValueError("Начало и конец записи должны быть датой и временем в формате ISO")
+        return cls(data["appointment_id"], data["client_id"], data["barber_id"],
+                   data["branch_id"], start, end)
+
+    # МЕТОДЫ ВЫВОДА И СРАВНЕНИЯ
+
+    def __repr__(self) -> str:
+        """Формальное строковое представление."""
+        return (f"Appointment(appointment_id={self.appointment_id}, client_id={self.client_id}, "
+                f"barber_id={self.barber_id}, start='{self.start}', end='{self.end}')")
+
+    def __eq__(self, other) -> bool:
+        """Сравнивает две записи на равенство."""
+        if not isinstance(other, Appointment):
+            return False
+        return (self.appointment_id == other.appointment_id and
+                self.client_id == other.client_id and
+                self.barber_id == other.barber_id and
+                self.branch_id == other.branch_id and
+                self.start == other.start and
+                self.end == other.end)
+
+    def __hash__(self) -> int:
+        """Возвращает хеш-значение объекта."""
+        return hash((self.appointment_id, self.client_id, self.barber_id, self.start, self.end))
@@ -0,0 +1,264 @@
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from client import Client
+
+FIELDS = ("client_id", "last_name", "first_name", "patronymic",
+          "phone", "email", "registration_date")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS clients (
+    client_id INTEGER PRIMARY KEY,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    patronymic TEXT,
+    phone TEXT,
+    email TEXT,
+    registration_date TEXT
+)
+"""
+_UPSERT = (f"INSERT INTO clients ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))}) "
+           f"ON CONFLICT(client_id) DO UPDATE SET "
+           + ', '.join(f"{field} = excluded.{field}" for field in FIELDS[1:]))
+_DELETE = "DELETE FROM clients WHERE client_id = ?"
+_SELECT = f"SELECT {', '.join(FIELDS)} FROM clients"
+
+# Максимальное число параметров в одном запросе IN (...)
+_SELECT_CHUNK = 500
+
+
+class AsyncClientStore:
+    """
+    Асинхронное хранилище клиентов в SQLite.
+    Записи выполняет один поток-писатель: накопившиеся операции
+    фиксируются одной транзакцией (group commit). Чтения идут параллельно
+    через ограниченный пул потоков, у каждого свое соединение (режим WAL).
+    """
+
+    def __init__(self, path: str, readers: int = 4, max_batch: int = 512):
+        """
+        Инициализирует хранилище. Соединения открываются в open().
+        """
+        if not isinstance(readers, int) or readers <= 0:
+            raise ValueError("Число читателей должно быть положительным целым числом")
+        if not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError("Размер пачки должен быть положительным целым числом")
+
+        self._path = path
+        self._readers = readers
+        self._max_batch = max_batch
+        self._reader_pool = None
+        self._writer_pool = None
+        self._writer_task = None
+        self._queue = None
+        self._closing = False
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    # ОТКРЫТИЕ И ЗАКРЫТИЕ
+
+    async def open(self):
+        """Открывает соединения и запускает поток-писатель."""
+        if self._writer_task is not None:
+            raise ValueError("Хранилище уже открыто")
+
+        self._writer_pool = ThreadPoolExecutor(1, thread_name_prefix="client-store-writer")
+        self._reader_pool = ThreadPoolExecutor(self._readers, thread_name_prefix="client-store-reader")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._writer_pool, self._create_schema)
+
+        self._queue = asyncio.Queue()
+        self._closing = False
+        self._writer_task = asyncio.create_task(self._write_loop())
+        return self
+
+    async def close(self):
+        """Дожидается записи очереди и закрывает все соединения."""
+        if self._writer_task is None or self._closing:
+            return
+        # Новые записи отклоняются сразу, иначе они встали бы за маркером конца
+        self._closing = True
+        await self._queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+
+        self._reader_pool.shutdown(wait=True)
+        self._writer_pool.shutdown(wait=True)
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    # ЗАПИСЬ
+
+    async def save(self, client: Client):
+        """Сохраняет клиента (вставка или замена по client_id)."""
+        if not isinstance(client, Client):
+            raise ValueError("Сохранить можно только объект Client")
+        await self._submit(_UPSERT, [self._row(client)])
+
+    async def save_many(self, clients) -> int:
+        """Сохраняет несколько клиентов одной операцией. Возвращает их число."""
+        rows = []
+        for client in clients:
+            if not isinstance(client, Client):
+                raise ValueError("Сохранить можно только объект Client")
+            rows.append(self._row(client))
+        if rows:
+            await self._submit(_UPSERT, rows)
+        return len(rows)
+
+    async def delete(self, client_id: int) -> bool:
+        """Удаляет клиента по ID. Возвращает True, если клиент был удален."""
+        return await self._submit(_DELETE, [(client_id,)]) > 0
+
+    # ЧТЕНИЕ
+
+    async def get(self, client_id: int) -> Client:
+        """Возвращает клиента по ID или None."""
+        rows = await self._read(f"{_SELECT} WHERE client_id = ?", (client_id,))
+        return self._client(rows[0]) if rows else None
+
+    async def get_many(self, client_ids) -> dict:
+        """Возвращает словарь ID -> Client для найденных клиентов."""
+        client_ids = list(client_ids)
+        result = {}
+        for start in range(0, len(client_ids), _SELECT_CHUNK):
+            chunk = client_ids[start:start + _SELECT_CHUNK]
+            query = f"{_SELECT} WHERE client_id IN ({', '.join('?' * len(chunk))})"
+            for row in await self._read(query, chunk):
+                result[row[0]] = self._client(row)
+        return result
+
+    async def count(self) -> int:
+        """Возвращает количество клиентов."""
+        rows = await self._read("SELECT COUNT(*) FROM clients", ())
+        return rows[0][0]
+
+    # ВНУТРЕННИЕ МЕТОДЫ
+
+    @staticmethod
+    def _row(client: Client) -> tuple:
+        data = client.to_dict()
+        return tuple(data[field] for field in FIELDS)
+
+    @staticmethod
+    def _client(row) -> Client:
+        # Данные записаны из проверенных объектов Client
+        return Client.from_dict(dict(zip(FIELDS, row)), trusted=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Открывает соединение для текущего потока."""
+        connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _create_schema(self):
+        self._thread_connection().execute(_CREATE_TABLE)
+
+    async def _read(self, query: str, params) -> list:
+        if self._writer_task is None:
+            raise ValueError("Хранилище не открыто")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_pool, self._execute_read, query, params)
+
+    def _execute_read(self, query: str, params) -> list:
+        return self._thread_connection().execute(query, params).fetchall()
+
+    async def _submit(self, query: str, rows: list) -> int:
+        """Ставит операцию в очередь писателя и ждет фиксации ее транзакции."""
+        if self._writer_task is None:
+            raise ValueError("Хранилище не открыто")
+        if self._closing:
+            raise ValueError("Хранилище закрывается")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, rows, future))
+        return await future
+
+    async def _write_loop(self):
+        """Забирает накопившиеся операции и фиксирует их одной транзакцией."""
+        loop = asyncio.get_running_loop()
+        running = True
+        while running:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            operations = [(query, rows) for query, rows, _ in batch]
+            try:
+                counts = await loop.run_in_executor(self._writer_pool, self._commit, operations)
+            except Exception as e:
+                if len(batch) == 1:
+                    self._settle(batch[0][2], error=e)
+                    continue
+                # Транзакция откачена целиком: повторяем операции по одной,
+                # чтобы ошибку получила только та, что ее вызвала
+                for query, rows, future in batch:
+                    try:
+                        count, = await loop.run_in_executor(
+                            self._writer_pool, self._commit, [(query, rows)])
+                    except Exception as error:
+                        self._settle(future, error=error)
+                    else:
+                        self._settle(future, count)
+            else:
+                for (_, _, future), count in zip(batch, counts):
+                    self._settle(future, count)
+
+        # Операции за маркером конца уже не будут записаны
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                self._settle(item[2], error=ValueError("Хранилище закрыто"))
+
+    @staticmethod
+    def _settle(future: asyncio.Future, count: int = None, error: Exception = None):
+        """Передает результат операции ожидающему, если тот еще ждет."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(count)
+
+    def _commit(self, operations: list) -> list:
+        """Выполняет операции в одной транзакции и возвращает число затронутых строк."""
+        connection = self._thread_connection()
+        counts = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for query, rows in operations:
+                counts.append(connection.executemany(query, rows).rowcount)
+            connection.execute("COMMIT")
+        except Exception:
+            # Иначе соединение осталось бы в открытой транзакции
+            # и следующий BEGIN IMMEDIATE завершился бы ошибкой
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        return counts
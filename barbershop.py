@@ -0,0 +1,263 @@
+"""
+Командная строка для работы с выгрузками клиентов.
+
+    python -m barbershop validate clients.jsonl
+    python -m barbershop convert clients.json clients.csv
+    python -m barbershop dedupe clients.jsonl -o unique.jsonl
+    python -m barbershop search clients.jsonl "Иванов Ив"
+    python -m barbershop stats clients.csv
+
+Формат определяется по расширению (.json, .jsonl/.ndjson, .csv) или
+параметрами --from/--to; "-" означает stdin/stdout (по умолчанию JSONL).
+Ввод читается потоково (кроме JSON-массива), модули команд
+импортируются только при их вызове - так search запускается быстрее.
+
+Результаты пишутся в stdout: клиенты - в выбранном формате,
+отчеты validate и stats - одним JSON объектом. Ошибки пишутся в stderr
+по одной JSON записи в строке: {"error": код, "line": номер, "message": текст}.
+Непредвиденные исключения тоже сообщаются так (код "internal").
+"""
+import argparse
+import json
+import sys
+
+# Коды завершения
+EXIT_OK = 0
+EXIT_INVALID_DATA = 1  # в данных есть ошибочные записи (корректные обработаны)
+EXIT_USAGE = 2         # неверные аргументы
+EXIT_IO = 3            # файл не найден или не читается/не пишется
+EXIT_INTERNAL = 4      # непредвиденная ошибка программы
+
+FORMATS = ("json", "jsonl", "csv")
+_EXTENSIONS = {".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+FIELDS = ("client_id", "last_name", "first_name", "patronymic",
+          "phone", "email", "registration_date")
+
+
+class UsageError(Exception):
+    """Ошибка в аргументах командной строки."""
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Парсер, сообщающий об ошибках аргументов в формате JSON."""
+
+    def error(self, message: str):
+        raise UsageError(message)
+
+
+def report_error(code: str, message: str, line: int = None):
+    """Пишет ошибку в stderr одной строкой JSON."""
+    error = {"error": code, "message": message}
+    if line is not None:
+        error["line"] = line
+    sys.stderr.write(json.dumps(error, ensure_ascii=False) + "\n")
+
+
+def detect_format(path: str, explicit: str = None) -> str:
+    """Возвращает формат файла: явно заданный или по расширению."""
+    if explicit:
+        return explicit
+    if path == "-":
+        return "jsonl"
+    for extension, file_format in _EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return file_format
+    raise UsageError(f"Не удалось определить формат файла {path}, укажите --from/--to")
+
+
+# ЧТЕНИЕ И ЗАПИСЬ
+
+def read_clients(path: str, file_format: str, errors: list):
+    """
+    Потоково читает клиентов. Ошибочные записи не прерывают чтение:
+    в errors добавляются пары (номер строки или элемента, сообщение).
+    """
+    from client import Client
+
+    source = sys.stdin if path == "-" else path
+    if file_format == "jsonl":
+        yield from Client.iter_from_jsonl(source, errors)
+    elif file_format == "json":
+        clients, load_errors = Client.load_many(source, format="json")
+        errors.extend(load_errors)
+        yield from clients
+    else:
+        yield from _read_csv(source, errors)
+
+
+def _read_csv(source, errors: list):
+    import csv
+
+    import client_io
+    from client import Client
+
+    # newline='' - переводы строк внутри кавычек разбирает сам csv
+    with client_io.open_source(source, newline='') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            data = {field: value or None for field, value in row.items()}
+            client_id = data.get("client_id")
+            if isinstance(client_id, str) and client_id.strip().isdigit():
+                data["client_id"] = int(client_id)
+            try:
+                yield Client.from_dict(data)
+            except ValueError as e:
+                errors.append((reader.line_num, str(e)))
+
+
+def write_clients(clients, path: str, file_format: str) -> int:
+    """Записывает клиентов потоково, возвращает их число."""
+    from client import Client
+
+    target = sys.stdout if path == "-" else path
+    if file_format in ("json", "jsonl"):
+        return Client.dump_many(clients, target, format=file_format)
+
+    import csv
+
+    import client_io
+
+    count = 0
+    with client_io.open_source(target, 'w', newline='') as file:
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(FIELDS)
+        for client in clients:
+            writer.writerow(["" if value is None else value for value in client.to_dict().values()])
+            count += 1
+    return count
+
+
+def _finish(errors: list) -> int:
+    for line, message in errors:
+        report_error("invalid_record", message, line)
+    return EXIT_INVALID_DATA if errors else EXIT_OK
+
+
+# КОМАНДЫ
+
+def command_validate(args) -> int:
+    errors = []
+    valid = sum(1 for _ in read_clients(args.input, detect_format(args.input, args.source_format), errors))
+    print(json.dumps({"valid": valid, "invalid": len(errors)}))
+    return _finish(errors)
+
+
+def command_convert(args) -> int:
+    source_format = detect_format(args.input, args.source_format)
+    target_format = detect_format(args.output, args.target_format)
+    errors = []
+    write_clients(read_clients(args.input, source_format, errors), args.output, target_format)
+    return _finish(errors)
+
+
+def command_dedupe(args) -> int:
+    from dedup import find_duplicates
+
+    errors = []
+    clients = list(read_clients(args.input, detect_format(args.input, args.source_format), errors))
+    clusters = find_duplicates(clients)
+    target_format = detect_format(args.output, args.target_format)
+
+    if args.clusters:
+        import client_io
+
+        with client_io.open_source(sys.stdout if args.output == "-" else args.output, 'w') as file:
+            for cluster in clusters:
+                file.write(json.dumps({"client_ids": [client.client_id for client in cluster.clients],
+                                       "merged": cluster.merged.to_dict()}, ensure_ascii=False) + "\n")
+        return _finish(errors)
+
+    # Объединенный клиент выводится один раз - на месте первого из группы
+    cluster_of = {id(client): cluster for cluster in clusters for client in cluster.clients}
+    written = set()
+
+    def unique_clients():
+        for client in clients:
+            cluster = cluster_of.get(id(client))
+            if cluster is None:
+                yield client
+            elif id(cluster) not in written:
+                written.add(id(cluster))
+                yield cluster.merged
+
+    write_clients(unique_clients(), args.output, target_format)
+    return _finish(errors)
+
+
+def command_search(args) -> int:
+    from name_search import search_clients
+
+    # Для одного запроса индекс не строится: клиенты ранжируются по мере чтения
+    errors = []
+    found = search_clients(read_clients(args.input, detect_format(args.input, args.source_format), errors),
+                           args.query, limit=args.limit, max_typos=args.typos)
+    write_clients(found, "-", args.target_format or "jsonl")
+    return _finish(errors)
+
+
+def command_stats(args) -> int:
+    from analytics import ClientSnapshot
+
+    errors = []
+    snapshot = ClientSnapshot.from_clients(
+        read_clients(args.input, detect_format(args.input, args.source_format), errors))
+    report = {
+        "clients": len(snapshot),
+        "invalid": len(errors),
+        "share": {field: round(snapshot.share(field), 4) for field in ("phone", "email", "patronymic")},
+        "by_month": snapshot.count_by_month(),
+    }
+    print(json.dumps(report, ensure_ascii=False))
+    return _finish(errors)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = _ArgumentParser(prog="barbershop", description="Операции с выгрузками клиентов")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_command(name: str, handler, help_text: str, output: bool = False):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("input", help="входной файл или - для stdin")
+        command.add_argument("--from", dest="source_format", choices=FORMATS, help="формат входа")
+        if output:
+            command.add_argument("--to", dest="target_format", choices=FORMATS, help="формат выхода")
+        command.set_defaults(handler=handler)
+        return command
+
+    add_command("validate", command_validate, "проверить записи")
+    convert = add_command("convert", command_convert, "преобразовать формат", output=True)
+    convert.add_argument("output", help="выходной файл или - для stdout")
+    dedupe = add_command("dedupe", command_dedupe, "объединить дубликаты", output=True)
+    dedupe.add_argument("-o", "--output", default="-", help="выходной файл (по умолчанию stdout)")
+    dedupe.add_argument("--clusters", action="store_true", help="вывести группы дубликатов в JSONL")
+    search = add_command("search", command_search, "найти клиентов по ФИО", output=True)
+    search.add_argument("query", help="начало фамилии, имени и/или отчества")
+    search.add_argument("--limit", type=int, default=10, help="максимум результатов")
+    search.add_argument("--typos", type=int, help="допустимое число опечаток")
+    add_command("stats", command_stats, "статистика по клиентам")
+    return parser
+
+
+def main(argv=None) -> int:
+    """Точка входа. Возвращает код завершения."""
+    try:
+        args = build_parser().parse_args(argv)
+        return args.handler(args)
+    except UsageError as e:
+        report_error("usage", str(e))
+        return EXIT_USAGE
+    except OSError as e:
+        report_error("io", f"{e.strerror or e}: {e.filename}" if e.filename else str(e))
+        return EXIT_IO
+    except ValueError as e:
+        # Невосстановимая ошибка данных (например, невалидный JSON-массив)
+        report_error("invalid_input", str(e))
+        return EXIT_INVALID_DATA
+    except Exception as e:
+        # Ошибка в самой программе: сообщение в том же формате вместо трассировки
+        report_error("internal", f"{type(e).__name__}: {e}")
+        return EXIT_INTERNAL
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Бенчмарк отчетов: цикл по объектам Client против колоночного снимка.
+Запуск из корня проекта: python -m bench.analytics [количество]
+"""
+import sys
+import time
+from datetime import date
+
+import analytics
+from analytics import ClientSnapshot
+from bench.data import make_clients
+
+
+def loop_reports(clients: list, branches: dict) -> tuple:
+    """Те же отчеты простым циклом с разбором дат."""
+    by_month, by_month_and_branch = {}, {}
+    with_email = 0
+    for client in clients:
+        if client.email is not None:
+            with_email += 1
+        if client.registration_date is None:
+            continue
+        day = date.fromisoformat(client.registration_date)
+        month = f"{day.year:04d}-{day.month:02d}"
+        by_month[month] = by_month.get(month, 0) + 1
+        key = (month, branches.get(client.client_id))
+        by_month_and_branch[key] = by_month_and_branch.get(key, 0) + 1
+    return by_month, by_month_and_branch, with_email / len(clients)
+
+
+def snapshot_reports(snapshot: ClientSnapshot) -> tuple:
+    return (snapshot.count_by_month(), snapshot.count_by_month_and_branch(),
+            snapshot.share("email"))
+
+
+def main(count: int = 1_000_000):
+    clients = make_clients(count)
+    branches = {client.client_id: client.client_id % 10 + 1 for client in clients}
+
+    start = time.perf_counter()
+    loop_result = loop_reports(clients, branches)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot = ClientSnapshot.from_clients(clients, branches)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot_result = snapshot_reports(snapshot)
+    snapshot_time = time.perf_counter() - start
+    assert snapshot_result == loop_result
+
+    backend = "NumPy" if analytics.numpy is not None else "Counter (NumPy не установлен)"
+    print(f"🚀 Отчеты по {count} клиентам ({backend}):")
+    print(f"   цикл по Client:          {loop_time * 1000:10.1f} мс")
+    print(f"   построение снимка:       {build_time * 1000:10.1f} мс (один раз)")
+    print(f"   отчеты по снимку:        {snapshot_time * 1000:10.1f} мс  "
+          f"ускорение x{loop_time / snapshot_time:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,60 @@
+"""
+Нагрузочный тест AsyncClientStore: задержки p50/p99 при конкурентных корутинах.
+Запуск из корня проекта: python -m bench.async_store [корутин] [операций на корутину]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from async_store import AsyncClientStore
+from bench.data import make_clients
+
+
+def percentile(values: list, share: float) -> float:
+    """Возвращает перцентиль отсортированного списка в миллисекундах."""
+    return values[min(len(values) - 1, int(len(values) * share))] * 1000
+
+
+async def worker(store: AsyncClientStore, clients: list, operations: int,
+                 reads: list, writes: list, rng: random.Random):
+    for _ in range(operations):
+        client = rng.choice(clients)
+        start = time.perf_counter()
+        if rng.random() < 0.8:
+            await store.get(client.client_id)
+            reads.append(time.perf_counter() - start)
+        else:
+            await store.save(client)
+            writes.append(time.perf_counter() - start)
+
+
+async def run(coroutines: int, operations: int, path: str):
+    clients = make_clients(10_000)
+    async with AsyncClientStore(path, readers=8) as store:
+        await store.save_many(clients)
+
+        reads, writes = [], []
+        rng = random.Random(1)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(store, clients, operations, reads, writes, rng)
+                               for _ in range(coroutines)))
+        elapsed = time.perf_counter() - start
+
+    print(f"🚀 {coroutines} корутин x {operations} операций за {elapsed:.2f} с "
+          f"({coroutines * operations / elapsed:,.0f} операций/с)")
+    for name, latencies in (("чтение", reads), ("запись", writes)):
+        latencies.sort()
+        print(f"   {name:7} p50 {percentile(latencies, 0.5):8.2f} мс   "
+              f"p99 {percentile(latencies, 0.99):8.2f} мс   ({len(latencies)} операций)")
+
+
+def main(coroutines: int = 1000, operations: int = 20):
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(coroutines, operations, os.path.join(directory, "clients.db")))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,51 @@
+"""
+Бенчмарк холодного старта: загрузка JSONL против открытия двоичного файла.
+Запуск из корня проекта: python -m bench.binary_store [количество]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bench.data import make_clients
+from binary_store import BinaryClientFile, write_binary
+from client import Client
+
+LOOKUPS = 10_000
+
+
+def main(count: int = 500_000):
+    clients = make_clients(count)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "clients.jsonl")
+        binary_path = os.path.join(directory, "clients.bin")
+        Client.dump_many(clients, json_path)
+        write_binary(clients, binary_path)
+
+        start = time.perf_counter()
+        loaded, _ = Client.load_many(json_path)
+        by_id = {client.client_id: client for client in loaded}
+        json_start = time.perf_counter() - start
+
+        start = time.perf_counter()
+        binary = BinaryClientFile(binary_path)
+        binary_start = time.perf_counter() - start
+
+        ids = [random.randrange(1, count + 1) for _ in range(LOOKUPS)]
+        start = time.perf_counter()
+        for client_id in ids:
+            binary.get(client_id)
+        lookup = (time.perf_counter() - start) / LOOKUPS
+        binary.close()
+
+        print(f"🚀 Холодный старт для {count} клиентов:")
+        print(f"   JSONL ({os.path.getsize(json_path) / 2 ** 20:.1f} МБ), load_many + словарь: "
+              f"{json_start * 1000:10.1f} мс ({len(by_id)} клиентов)")
+        print(f"   двоичный ({os.path.getsize(binary_path) / 2 ** 20:.1f} МБ), открытие:        "
+              f"{binary_start * 1000:10.3f} мс")
+        print(f"   двоичный, поиск по ID:                    {lookup * 1e6:10.1f} мкс")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,53 @@
+"""
+Бенчмарк кеша клиентов перед SQLite.
+Обращения распределены неравномерно (постоянные клиенты читаются чаще):
+сравнивается чтение из базы с from_dict на каждый запрос и через ClientCache.
+Запуск из корня проекта: python -m bench.client_cache [количество]
+"""
+import random
+import sqlite3
+import sys
+import time
+
+from bench.data import make_records
+from client import Client
+from client_cache import ClientCache
+
+FIELDS = ("client_id", "last_name", "first_name", "patronymic", "phone", "email", "registration_date")
+REQUESTS = 200_000
+
+
+def main(count: int = 100_000):
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute(f"CREATE TABLE clients ({', '.join(FIELDS)}, PRIMARY KEY (client_id))")
+    connection.executemany(f"INSERT INTO clients VALUES ({', '.join('?' * len(FIELDS))})",
+                           [tuple(record[field] for field in FIELDS) for record in make_records(count)])
+
+    def load(client_id):
+        row = connection.execute("SELECT * FROM clients WHERE client_id = ?", (client_id,)).fetchone()
+        return dict(zip(FIELDS, row)) if row else None
+
+    # Распределение Парето: небольшая доля клиентов дает большую часть обращений
+    rng = random.Random(42)
+    requests = [min(count, int(rng.paretovariate(0.3))) for _ in range(REQUESTS)]
+
+    start = time.perf_counter()
+    for client_id in requests:
+        Client.from_dict(load(client_id))
+    direct = time.perf_counter() - start
+
+    print(f"🚀 {count} клиентов в базе, {REQUESTS} чтений:")
+    print(f"   без кеша                  {direct / REQUESTS * 1e6:7.2f} мкс на чтение")
+    for max_entries in (1_000, 10_000):
+        cache = ClientCache(load, max_entries=max_entries)
+        start = time.perf_counter()
+        for client_id in requests:
+            cache.get(client_id)
+        cached = time.perf_counter() - start
+        stats = cache.stats()
+        print(f"   кеш на {max_entries:6} записей   {cached / REQUESTS * 1e6:7.2f} мкс на чтение   "
+              f"попаданий {stats['hit_ratio']:.1%}   {stats['bytes'] / 1024:.0f} КБ")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,32 @@
+"""
+Микробенчмарк стоимости создания одного клиента.
+Запуск из корня проекта: python -m bench.construction
+"""
+import timeit
+
+from client import Client
+from short_client import ShortClient
+
+FULL = (1, " Иванов ", "Иван", "Иванович", "+7 (916) 123-45-67", "ivanov@mail.ru", "2024-01-15")
+RECORD = dict(zip(("client_id", "last_name", "first_name", "patronymic",
+                   "phone", "email", "registration_date"), FULL))
+NUMBER = 200_000
+
+
+def main():
+    cases = {
+        "ShortClient(...)": lambda: ShortClient(*FULL[:4]),
+        "Client(...)": lambda: Client(*FULL),
+        "Client.from_dict": lambda: Client.from_dict(RECORD),
+        "Client.from_dict(trusted=True)": lambda: Client.from_dict(RECORD, trusted=True),
+        "Client._from_validated": lambda: Client._from_validated(*FULL),
+    }
+
+    print("🚀 Стоимость создания объекта:")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=3))
+        print(f"   {name:32} {seconds / NUMBER * 1e9:8.0f} нс")
+
+
+if __name__ == "__main__":
+    main()
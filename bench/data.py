@@ -0,0 +1,104 @@
+"""
+Генерация воспроизводимых наборов данных для бенчмарков.
+Фамилии и отчества согласуются с полом, один seed - один и тот же набор.
+"""
+import random
+
+from client import Client
+
+LAST_NAMES = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Васильев",
+              "Соколов", "Михайлов", "Новиков", "Федоров", "Морозов", "Волков", "Алексеев",
+              "Лебедев", "Семенов", "Егоров", "Павлов", "Козлов", "Степанов", "Николаев",
+              "Орлов", "Андреев", "Макаров", "Никитин", "Захаров", "Зайцев", "Соловьев",
+              "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьев", "Сергеев", "Фролов",
+              "Александров", "Дмитриев", "Королев", "Гусев", "Киселев", "Ильин", "Максимов",
+              "Поляков", "Сорокин", "Виноградов", "Ковалев", "Белов", "Медведев", "Антонов",
+              "Тарасов", "Жуков", "Баранов", "Филиппов", "Комаров", "Давыдов", "Беляев",
+              "Герасимов", "Богданов", "Осипов", "Сидоренко", "Шевченко", "Ким", "Цой",
+              "Вишневский", "Ковальский", "Римский-Корсаков"]
+MALE_NAMES = ["Иван", "Петр", "Алексей", "Сергей", "Андрей", "Дмитрий", "Михаил", "Николай",
+              "Александр", "Владимир", "Максим", "Артем", "Егор", "Кирилл", "Олег", "Павел",
+              "Роман", "Денис", "Евгений", "Юрий", "Илья", "Тимур", "Григорий", "Федор"]
+FEMALE_NAMES = ["Мария", "Анна", "Елена", "Ольга", "Наталья", "Татьяна", "Екатерина", "Ирина",
+                "Светлана", "Юлия", "Дарья", "Полина", "Алина", "Ксения", "Виктория", "Софья",
+                "Анастасия", "Марина", "Людмила", "Вера"]
+# Отчества (мужское, женское) по имени отца
+PATRONYMICS = [("Иванович", "Ивановна"), ("Петрович", "Петровна"), ("Алексеевич", "Алексеевна"),
+               ("Сергеевич", "Сергеевна"), ("Андреевич", "Андреевна"), ("Дмитриевич", "Дмитриевна"),
+               ("Михайлович", "Михайловна"), ("Николаевич", "Николаевна"),
+               ("Александрович", "Александровна"), ("Владимирович", "Владимировна"),
+               ("Олегович", "Олеговна"), ("Юрьевич", "Юрьевна"), ("Ильич", "Ильинична")]
+DOMAINS = ["mail.ru", "yandex.ru", "gmail.com", "bk.ru", "inbox.ru", "rambler.ru"]
+# Доли клиентов с необязательными полями
+PATRONYMIC_SHARE = 0.85
+PHONE_SHARE = 0.9
+EMAIL_SHARE = 0.6
+
+
+def feminine_last_name(last_name: str) -> str:
+    """Возвращает женскую форму фамилии (несклоняемые не меняются)."""
+    if '-' in last_name:
+        return '-'.join(feminine_last_name(part) for part in last_name.split('-'))
+    if last_name.endswith(("ов", "ев", "ин")):
+        return last_name + 'а'
+    if last_name.endswith("ский"):
+        return last_name[:-2] + "ая"
+    return last_name
+
+
+def make_record(client_id: int, rng: random.Random) -> dict:
+    """Создает словарь клиента в формате Client.to_dict."""
+    female = rng.random() < 0.5
+    last_name = rng.choice(LAST_NAMES)
+    if female:
+        last_name = feminine_last_name(last_name)
+    first_name = rng.choice(FEMALE_NAMES if female else MALE_NAMES)
+    patronymic = None
+    if rng.random() < PATRONYMIC_SHARE:
+        patronymic = rng.choice(PATRONYMICS)[1 if female else 0]
+    return {
+        "client_id": client_id,
+        "last_name": last_name,
+        "first_name": first_name,
+        "patronymic": patronymic,
+        # Уникальный номер: 7919 взаимно просто с 10 ** 9
+        "phone": f"+79{client_id * 7919 % 10 ** 9:09d}" if rng.random() < PHONE_SHARE else None,
+        "email": f"client{client_id}@{rng.choice(DOMAINS)}" if rng.random() < EMAIL_SHARE else None,
+        "registration_date": f"20{rng.randint(18, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    }
+
+
+def make_records(count: int, seed: int = 42) -> list:
+    """Создает список словарей клиентов."""
+    rng = random.Random(seed)
+    return [make_record(client_id, rng) for client_id in range(1, count + 1)]
+
+
+def make_clients(count: int, seed: int = 42) -> list:
+    """Создает список объектов Client."""
+    return [Client.from_dict(record) for record in make_records(count, seed)]
+
+
+def make_full_name_lines(count: int, seed: int = 42) -> list:
+    """Создает строки "Фамилия Имя Отчество" с лишними пробелами в части строк."""
+    rng = random.Random(seed)
+    lines = []
+    for client_id in range(1, count + 1):
+        record = make_record(client_id, rng)
+        parts = [record["last_name"], record["first_name"], record["patronymic"]]
+        separator = "  " if rng.random() < 0.1 else " "
+        lines.append(separator.join(part for part in parts if part))
+    return lines
+
+
+def make_invalid_records(count: int, seed: int = 42) -> list:
+    """Создает записи, каждая из которых не проходит одну из проверок."""
+    rng = random.Random(seed)
+    breakages = [("client_id", 0), ("client_id", "1"), ("last_name", "И"), ("first_name", "   "),
+                 ("patronymic", ""), ("phone", "позвонить"), ("email", "ivanov.mail.ru"),
+                 ("email", "ivanov@mail"), ("registration_date", "2024-02-30")]
+    records = []
+    for client_id in range(1, count + 1):
+        field, value = breakages[client_id % len(breakages)]
+        records.append(dict(make_record(client_id, rng), **{field: value}))
+    return records
@@ -0,0 +1,41 @@
+"""
+Бенчмарк поиска дубликатов на наборе с внедренными повторами.
+Запуск из корня проекта: python -m bench.dedup [количество]
+"""
+import random
+import sys
+import time
+
+from bench.data import make_records
+from client import Client
+from dedup import find_duplicates
+
+# Доля клиентов, повторно зарегистрированных в другом филиале
+DUPLICATE_SHARE = 0.05
+
+
+def main(count: int = 1_000_000):
+    rng = random.Random(7)
+    records = make_records(count)
+    next_id = count + 1
+    for record in rng.sample(records, int(count * DUPLICATE_SHARE)):
+        duplicate = dict(record, client_id=next_id, last_name=record["last_name"].upper())
+        if duplicate["phone"]:
+            digits = duplicate["phone"][2:]
+            duplicate["phone"] = f"8 ({digits[:3]}) {digits[3:6]}-{digits[6:8]}-{digits[8:]}"
+        if duplicate["email"]:
+            duplicate["email"] = duplicate["email"].upper()
+        records.append(duplicate)
+        next_id += 1
+    clients = [Client.from_dict(record, trusted=True) for record in records]
+
+    start = time.perf_counter()
+    clusters = find_duplicates(clients)
+    elapsed = time.perf_counter() - start
+
+    print(f"🚀 {len(clients)} клиентов: найдено {len(clusters)} групп дубликатов "
+          f"за {elapsed:.1f} с ({len(clients) / elapsed:,.0f} клиентов/с)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,42 @@
+"""
+Бенчмарк записи клиентов: цикл to_json против Client.dump_many.
+Запуск из корня проекта: python -m bench.dumping [количество]
+"""
+import io
+import sys
+import time
+
+from bench.data import make_clients
+from client import Client
+
+
+def timed(dump) -> float:
+    """Возвращает время выполнения функции в секундах."""
+    start = time.perf_counter()
+    dump()
+    return time.perf_counter() - start
+
+
+def to_json_loop(clients: list, buffer: io.StringIO):
+    """Прежний способ: to_json для каждого клиента."""
+    for client in clients:
+        buffer.write(client.to_json())
+        buffer.write('\n')
+
+
+def main(count: int = 200_000):
+    clients = make_clients(count)
+
+    results = {
+        "цикл Client.to_json": timed(lambda: to_json_loop(clients, io.StringIO())),
+        "Client.dump_many(jsonl)": timed(lambda: Client.dump_many(clients, io.StringIO())),
+        "Client.dump_many(json)": timed(lambda: Client.dump_many(clients, io.StringIO(), format="json")),
+    }
+
+    print(f"🚀 Запись {count} клиентов:")
+    for name, seconds in results.items():
+        print(f"   {name:30} {count / seconds:12,.0f} записей/с")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
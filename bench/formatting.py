@@ -0,0 +1,43 @@
+"""
+Бенчмарк форматирования имен и работы с множествами.
+Холодный замер - новые объекты (кеш пуст), теплый - повторные вызовы.
+Запуск из корня проекта: python -m bench.formatting [количество]
+"""
+import sys
+import time
+
+from bench.data import make_records
+from client import Client
+
+
+def timed(action, repeats: int = 5) -> float:
+    """Возвращает время выполнения функции в секундах."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        action()
+    return (time.perf_counter() - start) / repeats
+
+
+def main(count: int = 100_000):
+    records = make_records(count)
+    fresh = lambda: [Client.from_dict(record, trusted=True) for record in records]
+
+    operations = {
+        "get_full_name": lambda clients: [client.get_full_name() for client in clients],
+        "str(client)": lambda clients: [str(client) for client in clients],
+        "short_info": lambda clients: [client.short_info() for client in clients],
+        "множество и проверка in": lambda clients: len(set(clients)) + sum(map(set(clients[:1000]).__contains__, clients)),
+    }
+
+    print(f"🚀 {count} клиентов, нс на клиента:")
+    for name, operation in operations.items():
+        cold_clients = [fresh() for _ in range(5)]
+        cold = timed(lambda: operation(cold_clients.pop()))
+        warm_clients = fresh()
+        operation(warm_clients)
+        warm = timed(lambda: operation(warm_clients))
+        print(f"   {name:25} холодный {cold / count * 1e9:7.0f}   теплый {warm / count * 1e9:7.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
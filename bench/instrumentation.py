@@ -0,0 +1,35 @@
+"""
+Накладные расходы инструментирования: до включения, после выключения и во время работы.
+Запуск из корня проекта: python -m bench.instrumentation
+"""
+import timeit
+
+import instrumentation
+from client import Client
+
+RECORD = {"client_id": 1, "last_name": "Иванов", "first_name": "Иван", "patronymic": "Иванович",
+          "phone": "+79161234567", "email": "ivanov@mail.ru", "registration_date": "2024-01-15"}
+NUMBER = 100_000
+
+
+def measure() -> float:
+    """Возвращает стоимость from_dict + to_json в наносекундах."""
+    case = lambda: Client.from_dict(RECORD).to_json()
+    return min(timeit.repeat(case, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    before = measure()
+    instrumentation.enable()
+    enabled = measure()
+    instrumentation.disable()
+    disabled = measure()
+
+    print("🚀 Client.from_dict(...).to_json():")
+    print(f"   до включения:     {before:8.0f} нс")
+    print(f"   включено:         {enabled:8.0f} нс  ({enabled / before - 1:+.1%})")
+    print(f"   после выключения: {disabled:8.0f} нс  ({disabled / before - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Бенчмарк загрузки клиентов из JSONL (записей в секунду).
+Запуск из корня проекта: python -m bench.loading [количество]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench.data import make_records
+from client import Client
+
+
+def timed(load) -> float:
+    """Возвращает время выполнения функции в секундах."""
+    start = time.perf_counter()
+    load()
+    return time.perf_counter() - start
+
+
+def from_json_loop(path: str):
+    """Прежний способ: from_json для каждой строки."""
+    with open(path, encoding='utf-8') as file:
+        return [Client.from_json(line) for line in file]
+
+
+def main(count: int = 200_000):
+    with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8', delete=False) as file:
+        for record in make_records(count):
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        path = file.name
+
+    try:
+        results = {
+            "цикл Client.from_json": timed(lambda: from_json_loop(path)),
+            "Client.load_many": timed(lambda: Client.load_many(path)),
+            "Client.load_many(trusted=True)": timed(lambda: Client.load_many(path, trusted=True)),
+        }
+    finally:
+        os.remove(path)
+
+    print(f"🚀 Загрузка {count} клиентов из JSONL:")
+    for name, seconds in results.items():
+        print(f"   {name:35} {count / seconds:12,.0f} записей/с")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
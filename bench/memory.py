@@ -0,0 +1,55 @@
+"""
+Бенчмарк памяти: байт на клиента.
+Запуск из корня проекта: python -m bench.memory [количество]
+"""
+import sys
+import tracemalloc
+
+from bench.data import make_records
+from client import Client
+from client_table import ClientTable
+
+
+class DictClient:
+    """Клиент без __slots__ с теми же 7 атрибутами, что у прежнего Client."""
+
+    def __init__(self, client_id, last_name, first_name, patronymic=None,
+                 phone=None, email=None, registration_date=None):
+        self._client_id = client_id
+        self._last_name = last_name
+        self._first_name = first_name
+        self._patronymic = patronymic
+        self._phone = phone
+        self._email = email
+        self._registration_date = registration_date
+
+
+def measure(build) -> int:
+    """Возвращает количество байт, выделенных при построении коллекции."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count: int = 100_000):
+    records = make_records(count)
+
+    results = {
+        "класс с __dict__ (прежний Client)": measure(
+            lambda: [DictClient(*Client.from_dict(record).to_dict().values()) for record in records]),
+        "Client со __slots__": measure(
+            lambda: [Client.from_dict(record) for record in records]),
+        "ClientTable": measure(
+            lambda: ClientTable(Client.from_dict(record) for record in records)),
+    }
+
+    print(f"🚀 Память на {count} клиентов:")
+    for name, size in results.items():
+        print(f"   {name:40} {size / count:8.1f} байт/клиент")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,42 @@
+"""
+Бенчмарк поиска по ФИО в NameSearchIndex.
+Запуск из корня проекта: python -m bench.name_search [количество]
+"""
+import sys
+import time
+
+from bench.data import make_clients
+from name_search import NameSearchIndex
+from short_client import ShortClient
+
+QUERIES = ["Ива", "Иванов", "Петр", "Смир", "Кузнецова Анна", "Иванов Иван Ив",
+           "Смирнв", "Кузницов", "Сем Олег", "а а а", "и и и и"]
+REPEATS = 200
+ADDS = 2000
+
+
+def main(count: int = 1_000_000):
+    clients = make_clients(count)
+    start = time.perf_counter()
+    index = NameSearchIndex(clients)
+    print(f"🚀 Индекс на {count} клиентов построен за {time.perf_counter() - start:.1f} с")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            results = index.search(query)
+        elapsed = (time.perf_counter() - start) / REPEATS * 1000
+        print(f"   {query!r:22} {elapsed:8.3f} мс, найдено {len(results)}")
+
+    # Добавление клиента с новой фамилией и сразу точный поиск по ней
+    start = time.perf_counter()
+    for number in range(1, ADDS + 1):
+        surname = "Нов" + "".join(chr(0x430 + int(digit)) for digit in str(number))
+        index.add(ShortClient(count + number, surname, "Иван"))
+        index.search(surname, max_typos=0)
+    elapsed = (time.perf_counter() - start) / ADDS * 1000
+    print(f"   {'add + search':22} {elapsed:8.3f} мс")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,32 @@
+"""
+Кривая масштабирования parallel_import для 1, 2, 4 и 8 процессов.
+Запуск из корня проекта: python -m bench.parallel_import [количество]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from bench.data import make_clients
+from client import Client
+from parallel_import import parallel_import
+
+
+def main(count: int = 500_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.jsonl")
+        Client.dump_many(make_clients(count), path)
+
+        print(f"🚀 Импорт {count} клиентов (ядер: {os.cpu_count()}):")
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            clients, _ = parallel_import(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"   {workers} процесс(ов): {elapsed:6.2f} с  "
+                  f"{len(clients) / elapsed:10,.0f} записей/с  ускорение x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
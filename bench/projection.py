@@ -0,0 +1,44 @@
+"""
+Бенчмарк проекции списка Client в ShortClient.
+Сравнивает создание новых ShortClient (с валидацией) с ShortClient.from_client
+и ленивым project_short.
+Запуск из корня проекта: python -m bench.projection [количество]
+"""
+import sys
+import time
+
+from bench.data import make_clients
+from short_client import ShortClient, project_short
+
+
+def timed(action, repeats: int = 5) -> float:
+    """Возвращает лучшее время выполнения функции в секундах."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(count: int = 200_000):
+    clients = make_clients(count)
+
+    cases = {
+        "ShortClient(...)": lambda: [ShortClient(client.client_id, client.last_name,
+                                                 client.first_name, client.patronymic)
+                                     for client in clients],
+        "ShortClient.from_client": lambda: [ShortClient.from_client(client) for client in clients],
+        "project_short().to_list()": lambda: project_short(clients).to_list(),
+        "project_short() без обхода": lambda: project_short(clients),
+    }
+
+    print(f"🚀 {count} клиентов:")
+    for name, case in cases.items():
+        seconds = timed(case)
+        print(f"   {name:28} {seconds * 1000:8.1f} мс   {seconds / count * 1e9:7.0f} нс на клиента")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,70 @@
+"""
+Бенчмарк пропускной способности реестра клиентов из нескольких потоков.
+Сравнивает словарь под одной общей блокировкой с ClientRegistry
+(шарды с отдельными блокировками, чтение без блокировок).
+Смесь операций: 90% чтений, 10% регистраций.
+Запуск из корня проекта: python -m bench.registry [операций на поток]
+"""
+import sys
+import threading
+import time
+
+from client import Client
+from client_ids import IdAllocator
+from client_registry import ClientRegistry
+
+PRELOADED = 10_000
+
+
+class GlobalLockRegistry:
+    """Словарь под одной блокировкой - для сравнения."""
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def register(self, last_name: str, first_name: str) -> Client:
+        with self._lock:
+            client = Client(self._next_id, last_name, first_name)
+            self._next_id += 1
+            self._clients[client.client_id] = client
+        return client
+
+    def get(self, client_id: int) -> Client:
+        with self._lock:
+            return self._clients.get(client_id)
+
+
+def throughput(registry, threads: int, operations: int) -> float:
+    """Возвращает число операций в секунду."""
+    def worker():
+        for step in range(operations):
+            if step % 10 == 0:
+                registry.register("Иванов", "Иван")
+            else:
+                registry.get(step % PRELOADED + 1)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * operations / (time.perf_counter() - start)
+
+
+def main(operations: int = 50_000):
+    print(f"🚀 {operations} операций на поток, тысяч операций в секунду:")
+    for threads in (1, 4, 8):
+        results = []
+        for make in (GlobalLockRegistry, lambda: ClientRegistry(allocator=IdAllocator())):
+            registry = make()
+            for _ in range(PRELOADED):
+                registry.register("Петров", "Петр")
+            results.append(throughput(registry, threads, operations) / 1000)
+        print(f"   потоков {threads}:  общая блокировка {results[0]:7.0f}   ClientRegistry {results[1]:7.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,61 @@
+"""
+Бенчмарк задержки поиска и изменения в ClientRepository.
+Запуск из корня проекта: python -m bench.repository [размер ...]
+"""
+import random
+import sys
+import time
+
+from bench.data import make_clients
+from client import Client
+from client_repository import ClientRepository
+
+LOOKUPS = 10_000
+
+
+def latency(lookup, keys: list) -> float:
+    """Возвращает среднюю задержку одного поиска в микросекундах."""
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    rng = random.Random(1)
+    for size in sizes:
+        clients = make_clients(size)
+        repository = ClientRepository(clients)
+        sample = [rng.choice(clients) for _ in range(LOOKUPS)]
+
+        phones = [client.phone.replace('+7', '8') for client in sample if client.phone]
+        emails = [client.email.upper() for client in sample if client.email]
+        prefixes = [client.last_name[:3] for client in sample]
+
+        print(f"🚀 {size} клиентов (мкс на операцию):")
+        print(f"   get:              {latency(repository.get, [c.client_id for c in sample]):8.2f}")
+        print(f"   find_by_phone:    {latency(repository.find_by_phone, phones):8.2f}")
+        print(f"   find_by_email:    {latency(repository.find_by_email, emails):8.2f}")
+        print(f"   search_last_name: "
+              f"{latency(lambda prefix: repository.search_last_name(prefix, limit=20), prefixes):8.2f}")
+
+        # Изменения: смена email, смена фамилии, вставка вперемешку с поиском, удаление
+        unique = list({client.client_id: client for client in sample}.values())
+        email_updates = [Client(c.client_id, c.last_name, c.first_name, c.patronymic, c.phone,
+                                f"new{c.client_id}@mail.ru", c.registration_date) for c in unique]
+        name_updates = [Client(c.client_id, c.last_name + "ов", c.first_name, c.patronymic, c.phone,
+                               c.email, c.registration_date) for c in unique]
+        inserts = [Client(size + number, "Новиков", "Иван") for number in range(1, LOOKUPS + 1)]
+
+        def add_and_search(client):
+            repository.add(client)
+            repository.search_last_name("Нов", limit=20)
+
+        print(f"   update (email):   {latency(repository.update, email_updates):8.2f}")
+        print(f"   update (фамилия): {latency(repository.update, name_updates):8.2f}")
+        print(f"   add + search:     {latency(add_and_search, inserts):8.2f}")
+        print(f"   remove:           {latency(repository.remove, [c.client_id for c in unique]):8.2f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or (10_000, 100_000, 1_000_000))
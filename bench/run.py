@@ -0,0 +1,209 @@
+"""
+Воспроизводимый набор бенчмарков модели клиента.
+
+Каждый сценарий прогоняется на сгенерированном наборе данных (bench.data,
+фиксированный seed); в результат идет лучшее из нескольких повторений
+время на одну операцию в наносекундах. Результаты сохраняются в JSON,
+при сравнении с предыдущим запуском замедления больше порога считаются
+регрессиями, и процесс завершается с кодом 1.
+
+Запуск из корня проекта:
+    python -m bench.run --output results.json
+    python -m bench.run --compare results.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+from bench.data import make_full_name_lines, make_invalid_records, make_records
+from client import Client
+from short_client import ShortClient
+
+FORMAT_VERSION = 1
+SHORT_FIELDS = ("client_id", "last_name", "first_name", "patronymic")
+FIELDS = SHORT_FIELDS + ("phone", "email", "registration_date")
+
+
+def _construct_invalid(records: list):
+    for record in records:
+        try:
+            Client.from_dict(record)
+        except ValueError:
+            pass
+
+
+def _fresh_clients(dataset: dict) -> list:
+    return [Client.from_dict(record, trusted=True) for record in dataset["records"]]
+
+
+# Сценарии: имя -> (подготовка входа, замеряемое действие).
+# Подготовка вызывается перед каждым повторением и в замер не входит,
+# поэтому кеши объектов (имена, хеш) в каждом повторении холодные.
+CASES = {
+    "ShortClient(...)": (
+        lambda dataset: [tuple(record[field] for field in SHORT_FIELDS) for record in dataset["records"]],
+        lambda rows: [ShortClient(*row) for row in rows]),
+    "Client(...)": (
+        lambda dataset: [tuple(record[field] for field in FIELDS) for record in dataset["records"]],
+        lambda rows: [Client(*row) for row in rows]),
+    "Client(...) с ошибкой валидации": (
+        lambda dataset: dataset["invalid"],
+        _construct_invalid),
+    "ShortClient.from_full_name_string": (
+        lambda dataset: dataset["full_names"],
+        lambda lines: [ShortClient.from_full_name_string(line, number)
+                       for number, line in enumerate(lines, 1)]),
+    "ShortClient.parse_names": (
+        lambda dataset: dataset["full_names"],
+        lambda lines: list(ShortClient.parse_names(lines))),
+    "Client.from_dict": (
+        lambda dataset: dataset["records"],
+        lambda records: [Client.from_dict(record) for record in records]),
+    "Client.from_json": (
+        lambda dataset: dataset["json"],
+        lambda documents: [Client.from_json(document) for document in documents]),
+    "ShortClient.from_client": (
+        _fresh_clients,
+        lambda clients: [ShortClient.from_client(client) for client in clients]),
+    "Client.to_dict": (
+        _fresh_clients,
+        lambda clients: [client.to_dict() for client in clients]),
+    "Client.to_json": (
+        _fresh_clients,
+        lambda clients: [client.to_json() for client in clients]),
+    "hash(Client)": (
+        _fresh_clients,
+        lambda clients: [hash(client) for client in clients]),
+    "set(Client)": (
+        _fresh_clients,
+        set),
+    "dict[Client] поиск": (
+        lambda dataset: (dict.fromkeys(_fresh_clients(dataset)), _fresh_clients(dataset)),
+        lambda prepared: [client in prepared[0] for client in prepared[1]]),
+    "Client == ShortClient": (
+        lambda dataset: [(client, ShortClient(client.client_id, client.last_name,
+                                              client.first_name, client.patronymic))
+                         for client in _fresh_clients(dataset)],
+        lambda pairs: [client == short_client for client, short_client in pairs]),
+    "ShortClient == Client": (
+        lambda dataset: [(ShortClient(client.client_id, client.last_name,
+                                      client.first_name, client.patronymic), client)
+                         for client in _fresh_clients(dataset)],
+        lambda pairs: [short_client == client for short_client, client in pairs]),
+}
+
+
+def make_dataset(size: int, seed: int) -> dict:
+    """Готовит входные данные всех сценариев."""
+    records = make_records(size, seed)
+    return {
+        "records": records,
+        "json": [Client.from_dict(record).to_json() for record in records],
+        "invalid": make_invalid_records(size, seed),
+        "full_names": make_full_name_lines(size, seed),
+    }
+
+
+def measure(prepare, action, dataset: dict, repeats: int) -> float:
+    """Возвращает лучшее время одной операции в наносекундах."""
+    size = len(dataset["records"])
+    best = None
+    for _ in range(repeats):
+        prepared = prepare(dataset)
+        start = time.perf_counter()
+        action(prepared)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / size * 1e9
+
+
+def run(size: int = 20_000, seed: int = 42, repeats: int = 5, only: str = None) -> dict:
+    """Прогоняет сценарии и возвращает результаты в виде словаря."""
+    dataset = make_dataset(size, seed)
+    results = {}
+    for name, (prepare, action) in CASES.items():
+        if only and only.lower() not in name.lower():
+            continue
+        results[name] = round(measure(prepare, action, dataset, repeats), 1)
+    return {
+        "format": FORMAT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "size": size,
+        "seed": seed,
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Сравнивает два запуска. Возвращает строки (имя, было, стало, изменение),
+    изменение - относительное (0.1 = на 10% медленнее).
+    Сценарии, которых нет в одном из запусков, пропускаются.
+    """
+    rows = []
+    for name, value in current["results"].items():
+        before = baseline["results"].get(name)
+        if before:
+            rows.append((name, before, value, value / before - 1))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки модели клиента")
+    parser.add_argument("--size", type=int, default=20_000, help="число клиентов в наборе")
+    parser.add_argument("--seed", type=int, default=42, help="seed генератора данных")
+    parser.add_argument("--repeats", type=int, default=5, help="число повторений сценария")
+    parser.add_argument("--filter", dest="only", help="запускать сценарии, содержащие подстроку")
+    parser.add_argument("--output", help="файл для сохранения результатов (JSON)")
+    parser.add_argument("--compare", help="файл с результатами предыдущего запуска")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="допустимое замедление (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("size") != args.size or baseline.get("seed") != args.seed:
+            print(f"⚠️ Базовый запуск сделан на другом наборе "
+                  f"(size={baseline.get('size')}, seed={baseline.get('seed')})")
+
+    report = run(args.size, args.seed, args.repeats, args.only)
+    print(f"🚀 {args.size} клиентов, Python {report['python']}, нс на операцию:")
+    for name, value in report["results"].items():
+        print(f"   {name:36} {value:10.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"💾 Результаты сохранены: {args.output}")
+
+    if baseline is None:
+        return 0
+    regressions = 0
+    print(f"\n📊 Сравнение с {args.compare} (порог {args.threshold:.0%}):")
+    for name, before, after, change in compare(baseline, report):
+        mark = "  "
+        if change > args.threshold:
+            mark = "❌"
+            regressions += 1
+        elif change < -args.threshold:
+            mark = "✅"
+        print(f"{mark} {name:36} {before:10.1f} -> {after:10.1f} ({change:+.1%})")
+    if regressions:
+        print(f"❌ Регрессий: {regressions}")
+        return 1
+    print("✅ Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
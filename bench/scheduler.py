@@ -0,0 +1,76 @@
+"""
+Бенчмарк расписания: месяц записей для 200 мастеров.
+Запуск из корня проекта: python -m bench.scheduler [мастеров]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from appointment import Appointment
+from scheduler import Scheduler
+
+BRANCHES = 10
+DAYS = 30
+REPEATS = 50
+
+
+def build(barbers: int) -> Scheduler:
+    rng = random.Random(3)
+    scheduler = Scheduler()
+    appointment_id = 1
+    for barber_id in range(1, barbers + 1):
+        branch_id = barber_id % BRANCHES + 1
+        scheduler.add_barber(barber_id, branch_id)
+        for day in range(DAYS):
+            cursor = datetime(2024, 3, 1, 10) + timedelta(days=day)
+            closing = cursor.replace(hour=21)
+            while True:
+                cursor += timedelta(minutes=rng.choice((0, 0, 15, 30, 60)))
+                end = cursor + timedelta(minutes=rng.choice((30, 45, 60)))
+                if end > closing:
+                    break
+                scheduler.book(Appointment(appointment_id, rng.randint(1, 100_000),
+                                           barber_id, branch_id, cursor, end))
+                appointment_id += 1
+                cursor = end
+    return scheduler
+
+
+def timed(query) -> tuple:
+    """Возвращает (среднее время в мс, результат)."""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = query()
+    return (time.perf_counter() - start) / REPEATS * 1000, result
+
+
+def main(barbers: int = 200):
+    start = time.perf_counter()
+    scheduler = build(barbers)
+    print(f"🚀 {barbers} мастеров, {DAYS} дней: {len(scheduler._appointments)} записей "
+          f"за {time.perf_counter() - start:.1f} с")
+
+    month_start, month_end = datetime(2024, 3, 1), datetime(2024, 3, 31)
+    hour = timedelta(hours=1)
+    queries = {
+        "20 ближайших окон, все мастера": lambda: scheduler.find_free_slots(
+            month_start, month_end, hour, limit=20),
+        "20 ближайших окон с 15 марта, филиал": lambda: scheduler.find_free_slots(
+            datetime(2024, 3, 15), month_end, hour, branch_id=1, limit=20),
+        "все окна месяца, один мастер": lambda: scheduler.find_free_slots(
+            month_start, month_end, hour, barber_ids=[1]),
+        "все окна месяца, филиал": lambda: scheduler.find_free_slots(
+            month_start, month_end, hour, branch_id=1),
+        "все окна месяца, все мастера": lambda: scheduler.find_free_slots(
+            month_start, month_end, hour),
+        "проверка конфликта": lambda: scheduler.conflicts(
+            7, datetime(2024, 3, 20, 14), datetime(2024, 3, 20, 15)),
+    }
+    for name, query in queries.items():
+        elapsed, result = timed(query)
+        print(f"   {name:40} {elapsed:8.3f} мс  ({len(result)} результатов)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,176 @@
+"""
+Двоичный формат файла клиентов с произвольным доступом через mmap.
+
+Структура файла (все числа little-endian):
+    заголовок  - сигнатура, версия, число записей, смещения индекса и кучи строк;
+    индекс     - записи фиксированной ширины, отсортированные по client_id:
+                 client_id и шесть ссылок (смещение, длина) на строки в куче;
+    куча строк - строки в UTF-8, одинаковые значения хранятся один раз.
+Открытие файла читает только заголовок, поиск по ID - двоичный по индексу.
+"""
+import mmap
+import struct
+
+from client import Client
+
+MAGIC = b'BSCL'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHxxQQQ')
+_ENTRY = struct.Struct('<q' + 'QI' * 6)
+_ID = struct.Struct('<q')
+# Длина строки, обозначающая отсутствующее значение (None)
+_NONE_LENGTH = 0xFFFFFFFF
+
+STRING_FIELDS = ("last_name", "first_name", "patronymic", "phone", "email", "registration_date")
+
+
+def write_binary(clients, path: str) -> int:
+    """
+    Записывает клиентов в двоичный файл. ID должны быть уникальными.
+    Возвращает число записей.
+    """
+    clients = sorted(clients, key=lambda client: client.client_id)
+    for previous, current in zip(clients, clients[1:]):
+        if previous.client_id == current.client_id:
+            raise ValueError(f"Клиент с ID {current.client_id} встречается несколько раз")
+
+    index_offset = _HEADER.size
+    heap_offset = index_offset + _ENTRY.size * len(clients)
+    heap = bytearray()
+    refs = {}
+    index = bytearray()
+
+    for client in clients:
+        values = [client.client_id]
+        for field in STRING_FIELDS:
+            value = getattr(client, field)
+            if value is None:
+                values.extend((0, _NONE_LENGTH))
+                continue
+            ref = refs.get(value)
+            if ref is None:
+                encoded = value.encode('utf-8')
+                ref = refs[value] = (len(heap), len(encoded))
+                heap += encoded
+            values.extend(ref)
+        index += _ENTRY.pack(*values)
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(clients), index_offset, heap_offset))
+        file.write(index)
+        file.write(heap)
+    return len(clients)
+
+
+class BinaryClientFile:
+    """
+    Файл клиентов в двоичном формате, открытый через mmap.
+    Объект Client декодируется только для запрошенной записи.
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает файл и читает заголовок.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Файл клиентов пуст")
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError("Файл клиентов поврежден: нет заголовка")
+        magic, version, count, index_offset, heap_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Файл не является файлом клиентов")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Неподдерживаемая версия файла клиентов: {version}")
+        # Проверка за O(1): индекс и начало кучи строк умещаются в файл
+        if not (_HEADER.size <= index_offset
+                and index_offset + count * _ENTRY.size <= heap_offset <= len(self._map)):
+            self.close()
+            raise ValueError("Файл клиентов поврежден")
+
+        self._count = count
+        self._index_offset = index_offset
+        self._heap_offset = heap_offset
+
+    def close(self):
+        """Закрывает файл."""
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ДОСТУП
+
+    def get(self, client_id: int) -> Client:
+        """Возвращает клиента по ID или None (двоичный поиск по индексу)."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (current,) = _ID.unpack_from(self._map, self._index_offset + middle * _ENTRY.size)
+            if current < client_id:
+                low = middle + 1
+            elif current > client_id:
+                high = middle
+            else:
+                return self._decode(middle)
+        return None
+
+    def __contains__(self, client_id: int) -> bool:
+        return self.get(client_id) is not None
+
+    def __getitem__(self, position: int) -> Client:
+        """Возвращает клиента по позиции в порядке возрастания ID."""
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("Индекс клиента вне диапазона")
+        return self._decode(position)
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self._decode(position)
+
+    def _decode(self, position: int) -> Client:
+        values = _ENTRY.unpack_from(self._map, self._index_offset + position * _ENTRY.size)
+        strings = []
+        for offset, length in zip(values[1::2], values[2::2]):
+            if length == _NONE_LENGTH:
+                strings.append(None)
+            else:
+                start = self._heap_offset + offset
+                strings.append(self._map[start:start + length].decode('utf-8'))
+        # Данные записаны из проверенных объектов Client
+        return Client._from_validated(values[0], *strings)
+
+
+# КОНВЕРТЕРЫ
+
+def json_to_binary(source, target: str, format: str = "jsonl") -> tuple:
+    """
+    Конвертирует JSONL/JSON (формат Client.to_dict) в двоичный файл.
+    Возвращает (число записанных клиентов, ошибки загрузки).
+    """
+    clients, errors = Client.load_many(source, format=format)
+    return write_binary(clients, target), errors
+
+
+def binary_to_json(source: str, target, format: str = "jsonl") -> int:
+    """Конвертирует двоичный файл в JSONL/JSON. Возвращает число записей."""
+    with BinaryClientFile(source) as binary:
+        return Client.dump_many(binary, target, format=format)
@@ -1,6 +1,15 @@
 import json
+from json.encoder import encode_basestring
+
+import client_ids
+import client_io
+import validation
 from short_client import ShortClient
 
+# Шаблон компактной JSON записи клиента (ключи и порядок как в to_dict)
+_COMPACT_JSON = ('{"client_id":%d,"last_name":%s,"first_name":%s,"patronymic":%s,'
+                 '"phone":%s,"email":%s,"registration_date":%s}')
+
 
 class Client(ShortClient):
     """
@@ -8,6 +17,15 @@ class Client(ShortClient):
     Наследует от ShortClient и добавляет дополнительные поля.
     """
 
+    __slots__ = ('_phone', '_email', '_registration_date', '_cached_short_info')
+
+    _field_rules = {
+        **ShortClient._field_rules,
+        "phone": validation.phone("Телефон"),
+        "email": validation.email("Email"),
+        "registration_date": validation.iso_date("Дата регистрации"),
+    }
+
     def __init__(self, client_id: int, last_name: str, first_name: str,
                  patronymic: str = None, phone: str = None,
                  email: str = None, registration_date: str = None):
@@ -17,15 +35,11 @@ class Client(ShortClient):
         # ВЫЗЫВАЕМ КОНСТРУКТОР РОДИТЕЛЬСКОГО КЛАССА (убираем дублирование)
         super().__init__(client_id, last_name, first_name, patronymic)
 
-        # ДОБАВЛЯЕМ ВАЛИДАЦИЮ НОВЫХ ПОЛЕЙ (только для новых полей)
-        self._validate_optional_string(phone, "Телефон")
-        self._validate_email(email)
-        self._validate_optional_string(registration_date, "Дата регистрации")
-
-        # ДОБАВЛЯЕМ НОВЫЕ ПОЛЯ
-        self._phone = phone.strip() if phone else None
-        self._email = email.strip() if email else None
-        self._registration_date = registration_date.strip() if registration_date else None
+        # ДОБАВЛЯЕМ НОВЫЕ ПОЛЯ (проверка и очистка по правилам)
+        rules = self._field_rules
+        self._phone = rules["phone"](phone)
+        self._email = rules["email"](email)
+        self._registration_date = rules["registration_date"](registration_date)
 
     # region ДОПОЛНИТЕЛЬНЫЕ СВОЙСТВА (только новые поля)
 
@@ -46,6 +60,14 @@ class Client(ShortClient):
 
     # ПЕРЕОПРЕДЕЛЕННЫЕ МЕТОДЫ (дополняем родительские)
 
+    def _clear_cached(self):
+        """Сбрасывает кешированные производные значения (включая short_info)."""
+        self._cached_initials = None
+        self._cached_full_name = None
+        self._cached_full_name_with_initials = None
+        self._cached_hash = None
+        self._cached_short_info = None
+
     def full_info(self) -> str:
         """
         Возвращает полную информацию о клиенте.
@@ -71,7 +93,10 @@ class Client(ShortClient):
         Возвращает краткую информацию о клиенте.
         Использует унаследованные методы.
         """
-        return f"{self.get_full_name()} (ID: {self.client_id})"
+        if self._cached_short_info is not None:
+            return self._cached_short_info
+        self._cached_short_info = f"{self.get_full_name()} (ID: {self.client_id})"
+        return self._cached_short_info
 
     def __eq__(self, other) -> bool:
         """
@@ -90,26 +115,15 @@ class Client(ShortClient):
                 self.email == other.email and
                 self.registration_date == other.registration_date)
 
+    # Равные Client равны и по полям ShortClient, поэтому хеш родителя подходит.
+    # Без явного присваивания переопределенный __eq__ делает класс нехешируемым.
+    __hash__ = ShortClient.__hash__
+
     def __repr__(self) -> str:
         """Формальное строковое представление."""
         return (f"Client(client_id={self.client_id}, last_name='{self.last_name}', "
                 f"first_name='{self.first_name}', patronymic='{self.patronymic}')")
 
-    # УНИКАЛЬНЫЕ МЕТОДЫ Client (не дублируются)
-
-    @staticmethod
-    def _validate_email(value: str):
-        """Проверка корректности email адреса."""
-        if value is not None:
-            if not isinstance(value, str):
-                raise ValueError("Email должен быть строкой")
-            value_stripped = value.strip()
-            if value_stripped:
-                if '@' not in value_stripped:
-                    raise ValueError("Email должен содержать символ @")
-                if '.' not in value_stripped.split('@')[-1]:
-                    raise ValueError("Email должен содержать домен с точкой")
-
     # АЛЬТЕРНАТИВНЫЕ КОНСТРУКТОРЫ (уникальные для Client)
 
     @classmethod
@@ -125,9 +139,10 @@ class Client(ShortClient):
         return cls.from_dict(data)
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, trusted: bool = False):
         """
         Создает клиента из словаря.
+        trusted=True пропускает валидацию значений (для уже проверенных данных).
         """
         # Обязательные поля
         if "client_id" not in data:
@@ -146,13 +161,106 @@ class Client(ShortClient):
         email = data.get("email")
         registration_date = data.get("registration_date")
 
+        if trusted:
+            return cls._from_validated(client_id, last_name, first_name, patronymic,
+                                       phone, email, registration_date)
         return cls(client_id, last_name, first_name, patronymic, phone, email, registration_date)
 
     @classmethod
-    def from_name_and_phone(cls, last_name: str, first_name: str, phone: str, client_id: int = 1):
+    def iter_from_jsonl(cls, source, errors: list = None, trusted: bool = False,
+                        batch_size: int = 1000):
+        """
+        Потоково создает клиентов из JSONL файла (путь или файловый объект).
+        Строки разбираются и проверяются пачками по batch_size.
+        Если передан список errors, ошибочные строки добавляются в него
+        парами (номер строки, сообщение), иначе выбрасывается ValueError.
+        trusted=True отключает повторную валидацию для доверенных источников.
+        """
+        batch_errors = []
+        for batch in client_io.iter_line_batches(source, batch_size):
+            rows = cls._from_rows(client_io.parse_batch(batch), batch_errors, trusted)
+            if batch_errors and errors is None:
+                line_number, message = batch_errors[0]
+                yield from (client for number, client in rows if number < line_number)
+                raise ValueError(f"Строка {line_number}: {message}")
+            if errors is not None:
+                errors.extend(batch_errors)
+                batch_errors.clear()
+            yield from (client for _, client in rows)
+
+    @classmethod
+    def load_many(cls, source, trusted: bool = False, batch_size: int = 1000,
+                  format: str = "jsonl"):
+        """
+        Загружает клиентов из JSONL (format="jsonl") или JSON массива (format="json").
+        Возвращает пару (список клиентов, список ошибок).
+        Ошибка - пара (номер строки для JSONL или записи для JSON, сообщение).
+        """
+        errors = []
+        if format == "jsonl":
+            clients = list(cls.iter_from_jsonl(source, errors, trusted, batch_size))
+        elif format == "json":
+            with client_io.open_source(source) as file:
+                try:
+                    data = json.load(file)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Невалидный JSON: {e}")
+            if not isinstance(data, list):
+                raise ValueError("JSON должен содержать массив клиентов")
+            rows = cls._from_rows(enumerate(data, start=1), errors, trusted)
+            clients = [client for _, client in rows]
+        else:
+            raise ValueError(f"Неизвестный формат: {format}")
+
+        return clients, errors
+
+    @classmethod
+    def _from_rows(cls, rows, errors: list, trusted: bool = False) -> list:
+        """
+        Создает клиентов из пар (номер, данные или исключение).
+        Возвращает пары (номер, клиент), ошибки добавляет в errors.
+        """
+        clients = []
+        for number, data in rows:
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                if not isinstance(data, dict):
+                    raise ValueError("Запись клиента должна быть JSON объектом")
+                client = cls.from_dict(data, trusted)
+            except ValueError as e:
+                errors.append((number, str(e)))
+            else:
+                clients.append((number, client))
+        return clients
+
+    @classmethod
+    def _from_validated(cls, client_id: int, last_name: str, first_name: str,
+                        patronymic: str = None, phone: str = None,
+                        email: str = None, registration_date: str = None):
+        """
+        Создает клиента из уже проверенных и очищенных значений.
+        Валидация не выполняется - только для доверенных источников.
+        """
+        client = cls.__new__(cls)
+        client._client_id = client_id
+        client._last_name = last_name
+        client._first_name = first_name
+        client._patronymic = patronymic
+        client._phone = phone
+        client._email = email
+        client._registration_date = registration_date
+        client._clear_cached()
+        return client
+
+    @classmethod
+    def from_name_and_phone(cls, last_name: str, first_name: str, phone: str, client_id: int = None):
         """
         Создает клиента только с именем и телефоном.
+        Если client_id не передан, выдается новый ID (client_ids.default_allocator).
         """
+        if client_id is None:
+            client_id = client_ids.default_allocator.allocate()
         return cls(client_id, last_name, first_name, phone=phone)
 
     # МЕТОДЫ ПРЕОБРАЗОВАНИЯ
@@ -171,8 +279,72 @@ class Client(ShortClient):
             "registration_date": self.registration_date
         }
 
+    def changed_fields(self, other: "Client") -> list:
+        """
+        Возвращает имена полей, значения которых отличаются от other.
+        """
+        if not isinstance(other, Client):
+            raise ValueError("Сравнивать можно только с объектом Client")
+        data = self.to_dict()
+        other_data = other.to_dict()
+        return [field for field, value in data.items() if other_data[field] != value]
+
     def to_json(self) -> str:
         """
         Преобразует объект в JSON строку.
         """
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def _to_compact_json(self) -> str:
+        """
+        Возвращает компактную JSON строку без промежуточного словаря.
+        Результат совпадает с json.dumps(self.to_dict(), ensure_ascii=False,
+        separators=(',', ':')).
+        """
+        return _COMPACT_JSON % (
+            self._client_id,
+            encode_basestring(self._last_name),
+            encode_basestring(self._first_name),
+            'null' if self._patronymic is None else encode_basestring(self._patronymic),
+            'null' if self._phone is None else encode_basestring(self._phone),
+            'null' if self._email is None else encode_basestring(self._email),
+            'null' if self._registration_date is None else encode_basestring(self._registration_date)
+        )
+
+    @staticmethod
+    def dump_many(clients, target, format: str = "jsonl", chunk_size: int = 1000) -> int:
+        """
+        Записывает клиентов в файл (путь или файловый объект) без форматирования.
+        format="jsonl" - по записи в строке, format="json" - компактный массив.
+        Запись идет пачками по chunk_size клиентов. Возвращает число записей.
+        """
+        if format not in ("jsonl", "json"):
+            raise ValueError(f"Неизвестный формат: {format}")
+        if chunk_size <= 0:
+            raise ValueError("Размер пачки должен быть положительным целым числом")
+
+        separator = '\n' if format == "jsonl" else ','
+        count = 0
+
+        with client_io.open_source(target, 'w') as file:
+            def flush(chunk: list):
+                if format == "json" and count > len(chunk):
+                    file.write(',')
+                file.write(separator.join(chunk))
+                if format == "jsonl":
+                    file.write('\n')
+
+            if format == "json":
+                file.write('[')
+            chunk = []
+            for client in clients:
+                chunk.append(client._to_compact_json())
+                count += 1
+                if len(chunk) >= chunk_size:
+                    flush(chunk)
+                    chunk = []
+            if chunk:
+                flush(chunk)
+            if format == "json":
+                file.write(']')
+        return count
@@ -0,0 +1,212 @@
+"""
+Кеш клиентов со сквозным чтением перед медленным хранилищем.
+
+Кеш хранит готовые объекты Client по client_id, вытесняет давно не
+использованных (LRU) при превышении числа записей или бюджета памяти,
+а записи старше ttl считает устаревшими. Одновременные промахи по
+одному ID выполняют одну загрузку: первый поток загружает клиента,
+остальные ждут его результата.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from client import Client
+
+_STRING_SLOTS = ('_last_name', '_first_name', '_patronymic', '_phone', '_email', '_registration_date')
+
+
+def client_size(client: Client) -> int:
+    """Оценивает память, занимаемую клиентом и его строками, в байтах."""
+    size = sys.getsizeof(client)
+    for slot in _STRING_SLOTS:
+        value = getattr(client, slot, None)
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size
+
+
+class _Loading:
+    """Загрузка клиента, которую ждут одновременные запросы."""
+
+    __slots__ = ('done', 'client', 'error', 'stale')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.client = None
+        self.error = None
+        # Клиент изменился во время загрузки - результат не кешируется
+        self.stale = False
+
+
+class ClientCache:
+    """
+    Потокобезопасный LRU/TTL кеш клиентов.
+    load(client_id) возвращает Client, словарь в формате Client.to_dict
+    или None, если клиента нет. Необязательный save(client) записывает
+    клиента в хранилище при update.
+    """
+
+    def __init__(self, load, save=None, max_entries: int = 10_000, max_bytes: int = None,
+                 ttl: float = None, clock=time.monotonic):
+        """
+        Инициализирует кеш.
+        max_bytes - бюджет памяти (оценка client_size), ttl - время жизни записи в секундах.
+        """
+        if max_entries <= 0:
+            raise ValueError("Размер кеша должен быть положительным целым числом")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("Бюджет памяти должен быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Время жизни записи должно быть положительным")
+        self._load = load
+        self._save = save
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # ID -> (клиент, момент устаревания или None, размер); порядок - от старых к новым
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._bytes = 0
+        self._stats = dict.fromkeys(("hits", "misses", "loads", "load_failures",
+                                     "coalesced", "evictions", "expirations"), 0)
+
+    # ЧТЕНИЕ
+
+    def get(self, client_id: int) -> Client:
+        """Возвращает клиента по ID (из кеша или хранилища) или None."""
+        with self._lock:
+            entry = self._entries.get(client_id)
+            if entry is not None:
+                if entry[1] is None or entry[1] > self._clock():
+                    self._entries.move_to_end(client_id)
+                    self._stats["hits"] += 1
+                    return entry[0]
+                self._drop(client_id)
+                self._stats["expirations"] += 1
+
+            self._stats["misses"] += 1
+            loading = self._loading.get(client_id)
+            if loading is not None:
+                self._stats["coalesced"] += 1
+                owner = False
+            else:
+                loading = self._loading[client_id] = _Loading()
+                owner = True
+
+        if not owner:
+            loading.done.wait()
+            if loading.error is not None:
+                raise loading.error
+            return loading.client
+        return self._load_entry(client_id, loading)
+
+    def __contains__(self, client_id: int) -> bool:
+        """Проверяет, есть ли в кеше неустаревшая запись (без загрузки)."""
+        with self._lock:
+            entry = self._entries.get(client_id)
+            return entry is not None and (entry[1] is None or entry[1] > self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Возвращает оценку памяти, занятой кешированными клиентами."""
+        return self._bytes
+
+    # ИЗМЕНЕНИЕ
+
+    def update(self, client: Client):
+        """Записывает клиента в хранилище (если задан save) и обновляет кеш."""
+        if not isinstance(client, Client):
+            raise ValueError("В кеш можно добавить только объект Client")
+        if self._save is not None:
+            self._save(client)
+        with self._lock:
+            self._forget(client.client_id)
+            self._store(client.client_id, client)
+
+    def invalidate(self, client_id: int) -> bool:
+        """Удаляет клиента из кеша. Возвращает True, если запись была."""
+        with self._lock:
+            return self._forget(client_id)
+
+    def clear(self):
+        """Очищает кеш (статистика сохраняется)."""
+        with self._lock:
+            for loading in self._loading.values():
+                loading.stale = True
+            self._entries.clear()
+            self._bytes = 0
+
+    # СТАТИСТИКА
+
+    def stats(self) -> dict:
+        """Возвращает счетчики кеша и долю попаданий hit_ratio."""
+        with self._lock:
+            stats = dict(self._stats, entries=len(self._entries), bytes=self._bytes)
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / requests if requests else 0.0
+        return stats
+
+    def reset_stats(self):
+        """Обнуляет счетчики."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    # ВНУТРЕННИЕ МЕТОДЫ
+
+    def _load_entry(self, client_id: int, loading: _Loading) -> Client:
+        """Загружает клиента и будит ожидающие потоки."""
+        try:
+            data = self._load(client_id)
+            if data is not None and not isinstance(data, Client):
+                data = Client.from_dict(data)
+        except Exception as e:
+            loading.error = e
+            with self._lock:
+                self._stats["load_failures"] += 1
+                del self._loading[client_id]
+            loading.done.set()
+            raise
+
+        loading.client = data
+        with self._lock:
+            self._stats["loads"] += 1
+            del self._loading[client_id]
+            if data is not None and not loading.stale:
+                self._store(client_id, data)
+        loading.done.set()
+        return data
+
+    def _store(self, client_id: int, client: Client):
+        """Добавляет запись и вытесняет старые сверх лимитов (под блокировкой)."""
+        size = client_size(client)
+        expires = self._clock() + self._ttl if self._ttl is not None else None
+        self._entries[client_id] = (client, expires, size)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self._max_entries or
+                                 (self._max_bytes is not None and self._bytes > self._max_bytes)):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._stats["evictions"] += 1
+
+    def _forget(self, client_id: int) -> bool:
+        """Удаляет запись и помечает идущую загрузку устаревшей (под блокировкой)."""
+        loading = self._loading.get(client_id)
+        if loading is not None:
+            loading.stale = True
+        if client_id not in self._entries:
+            return False
+        self._drop(client_id)
+        return True
+
+    def _drop(self, client_id: int):
+        _, _, size = self._entries.pop(client_id)
+        self._bytes -= size
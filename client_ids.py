@@ -0,0 +1,50 @@
+"""
+Потокобезопасная выдача ID клиентов.
+default_allocator используется альтернативными конструкторами, если
+client_id не передан, и ClientRegistry по умолчанию, поэтому ID,
+выданные в разных местах процесса, не повторяются.
+"""
+import threading
+
+
+class IdAllocator:
+    """Счетчик ID: каждый вызов allocate возвращает новый ID."""
+
+    def __init__(self, start: int = 1):
+        """
+        Инициализирует счетчик, первый выданный ID равен start.
+        """
+        if not isinstance(start, int) or start <= 0:
+            raise ValueError("Начальный ID должен быть положительным целым числом")
+        self._next = start
+        self._lock = threading.Lock()
+
+    @property
+    def next_id(self) -> int:
+        """Возвращает ID, который будет выдан следующим."""
+        return self._next
+
+    def allocate(self) -> int:
+        """Выдает следующий ID."""
+        with self._lock:
+            client_id = self._next
+            self._next += 1
+        return client_id
+
+    def allocate_many(self, count: int) -> range:
+        """Выдает сразу count подряд идущих ID (одно взятие блокировки)."""
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("Количество ID должно быть неотрицательным целым числом")
+        with self._lock:
+            start = self._next
+            self._next += count
+        return range(start, start + count)
+
+    def reserve(self, client_id: int):
+        """Отмечает ID занятым: следующие выданные ID будут больше него."""
+        with self._lock:
+            if client_id >= self._next:
+                self._next = client_id + 1
+
+
+default_allocator = IdAllocator()
@@ -0,0 +1,83 @@
+"""
+Вспомогательные функции потокового чтения и записи записей клиентов.
+"""
+import json
+import os
+from contextlib import contextmanager
+
+_decode = json.JSONDecoder().decode
+
+
+@contextmanager
+def open_source(source, mode: str = 'r', newline: str = None):
+    """
+    Открывает путь к файлу или возвращает уже открытый файловый объект.
+    Переданный файловый объект не закрывается.
+    newline передается в open (для CSV нужен newline='').
+    """
+    if isinstance(source, (str, os.PathLike)):
+        encoding = None if 'b' in mode else 'utf-8'
+        with open(source, mode, encoding=encoding, newline=newline) as file:
+            yield file
+    else:
+        yield source
+
+
+def decode_line(line):
+    """
+    Декодирует строку JSONL из UTF-8 (строки str не меняются) и убирает
+    пробелы по краям. Если байты не декодируются, возвращает ValueError:
+    ошибка относится только к этой строке, а не ко всему файлу.
+    """
+    if isinstance(line, bytes):
+        try:
+            line = line.decode('utf-8')
+        except UnicodeDecodeError as e:
+            return ValueError(f"Строка не в кодировке UTF-8: {e}")
+    return line.strip()
+
+
+def iter_line_batches(source, batch_size: int = 1000):
+    """
+    Читает JSONL построчно и возвращает пачки пар (номер строки, строка).
+    Путь к файлу читается в двоичном режиме, и строка с неверной
+    кодировкой попадает в пачку как ValueError (см. decode_line).
+    Пустые строки пропускаются, в памяти держится только одна пачка.
+    """
+    if batch_size <= 0:
+        raise ValueError("Размер пачки должен быть положительным целым числом")
+
+    with open_source(source, 'rb') as file:
+        batch = []
+        for line_number, line in enumerate(file, start=1):
+            line = decode_line(line)
+            if not line:
+                continue
+            batch.append((line_number, line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def parse_batch(batch: list) -> list:
+    """
+    Разбирает пачку строк JSONL, каждую строку отдельно.
+    Возвращает пары (номер строки, данные или исключение);
+    ошибки декодирования из decode_line передаются как есть.
+    Строки не склеиваются в один массив: иначе некорректные строки
+    (два объекта в строке, объект на двух строках) могут дать нужное
+    число значений со сдвигом и пройти как корректные.
+    """
+    parsed = []
+    for line_number, line in batch:
+        if isinstance(line, ValueError):
+            parsed.append((line_number, line))
+            continue
+        try:
+            parsed.append((line_number, _decode(line)))
+        except json.JSONDecodeError as e:
+            parsed.append((line_number, ValueError(f"Невалидный JSON: {e}")))
+    return parsed
+
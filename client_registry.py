@@ -0,0 +1,115 @@
+"""
+Потокобезопасный реестр клиентов для многопоточного сервиса записи.
+
+Клиенты разложены по шардам по client_id, у каждого шарда своя
+блокировка, поэтому изменения разных шардов не ждут друг друга.
+Объекты Client неизменяемы: изменение заменяет объект целиком, а чтение
+берет готовый снимок из словаря шарда без блокировок.
+"""
+import threading
+
+import client_ids
+from client import Client
+
+
+class ClientRegistry:
+    """
+    Реестр клиентов с шардированием по ID.
+    Число шардов округляется вверх до степени двойки.
+    """
+
+    def __init__(self, shards: int = 16, allocator: client_ids.IdAllocator = None):
+        """
+        Инициализирует пустой реестр.
+        allocator выдает ID при register (по умолчанию общий для процесса).
+        """
+        if not isinstance(shards, int) or shards <= 0:
+            raise ValueError("Число шардов должно быть положительным целым числом")
+        size = 1
+        while size < shards:
+            size *= 2
+        self._mask = size - 1
+        self._shards = [{} for _ in range(size)]
+        self._locks = [threading.Lock() for _ in range(size)]
+        self._allocator = allocator or client_ids.default_allocator
+
+    # ЧТЕНИЕ (без блокировок)
+
+    def get(self, client_id: int) -> Client:
+        """Возвращает клиента по ID или None."""
+        return self._shards[client_id & self._mask].get(client_id)
+
+    def __contains__(self, client_id: int) -> bool:
+        return client_id in self._shards[client_id & self._mask]
+
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+
+    def snapshot(self) -> list:
+        """
+        Возвращает список всех клиентов.
+        Каждый шард копируется целиком, но разные шарды могут отражать
+        разные моменты времени.
+        """
+        clients = []
+        for shard in self._shards:
+            clients.extend(shard.copy().values())
+        return clients
+
+    # ИЗМЕНЕНИЕ
+
+    def register(self, last_name: str, first_name: str, patronymic: str = None,
+                 phone: str = None, email: str = None, registration_date: str = None) -> Client:
+        """Создает клиента с новым ID и добавляет его в реестр."""
+        fields = (last_name, first_name, patronymic, phone, email, registration_date)
+        while True:
+            client = Client(self._allocator.allocate(), *fields)
+            index = client.client_id & self._mask
+            with self._locks[index]:
+                shard = self._shards[index]
+                # ID мог быть занят через add до reserve - берем следующий
+                if client.client_id not in shard:
+                    shard[client.client_id] = client
+                    return client
+
+    def add(self, client: Client):
+        """Добавляет клиента с уже назначенным ID. ID должен быть свободен."""
+        if not isinstance(client, Client):
+            raise ValueError("В реестр можно добавить только объект Client")
+        # Резервируем до вставки, чтобы register не выдал этот ID
+        self._allocator.reserve(client.client_id)
+        index = client.client_id & self._mask
+        with self._locks[index]:
+            shard = self._shards[index]
+            if client.client_id in shard:
+                raise ValueError(f"Клиент с ID {client.client_id} уже существует")
+            shard[client.client_id] = client
+
+    def update(self, client: Client, expected: Client = None) -> Client:
+        """
+        Заменяет клиента с тем же ID и возвращает прежний объект.
+        Если передан expected, замена выполняется, только если в реестре
+        все еще лежит именно этот объект (иначе ValueError) - так
+        параллельные изменения одного клиента не теряются молча.
+        """
+        if not isinstance(client, Client):
+            raise ValueError("В реестр можно добавить только объект Client")
+        index = client.client_id & self._mask
+        with self._locks[index]:
+            shard = self._shards[index]
+            current = shard.get(client.client_id)
+            if current is None:
+                raise ValueError(f"Клиент с ID {client.client_id} не найден")
+            if expected is not None and current is not expected:
+                raise ValueError(f"Клиент с ID {client.client_id} изменен другим потоком")
+            shard[client.client_id] = client
+        return current
+
+    def remove(self, client_id: int) -> Client:
+        """Удаляет клиента по ID и возвращает его."""
+        index = client_id & self._mask
+        with self._locks[index]:
+            client = self._shards[index].pop(client_id, None)
+        if client is None:
+            raise ValueError(f"Клиент с ID {client_id} не найден")
+        return client
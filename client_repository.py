@@ -0,0 +1,235 @@
+import json
+from bisect import bisect_left, insort
+
+import client_io
+from client import Client
+from normalize import normalize_email, normalize_name, normalize_phone
+
+
+class ClientRepository:
+    """
+    Хранилище клиентов в памяти с индексами.
+    Хеш-индексы по ID, нормализованному телефону и email (уникальные),
+    индекс фамилий (фамилия -> ID) с отсортированным списком фамилий
+    для поиска по префиксу.
+    Все изменения пишутся в журнал с монотонным номером (курсором),
+    по которому export_changes выгружает только изменившихся клиентов.
+    """
+
+    def __init__(self, clients=None):
+        """
+        Инициализирует хранилище, при необходимости заполняя его клиентами.
+        """
+        self._by_id = {}
+        self._by_phone = {}
+        self._by_email = {}
+        # Нормализованная фамилия -> отсортированный список ID
+        self._by_last_name = {}
+        # Отсортированный список различных фамилий для поиска по префиксу
+        self._last_names = []
+        # Журнал изменений: (номер, операция, ID, измененные поля)
+        self._changes = []
+        # Номер последней удаленной из журнала записи
+        self._changes_offset = 0
+
+        if clients is not None:
+            for client in clients:
+                self.add(client)
+
+    # ИЗМЕНЕНИЕ
+
+    def add(self, client: Client):
+        """Добавляет клиента. ID, телефон и email должны быть уникальными."""
+        if not isinstance(client, Client):
+            raise ValueError("В хранилище можно добавить только объект Client")
+        if client.client_id in self._by_id:
+            raise ValueError(f"Клиент с ID {client.client_id} уже существует")
+        self._check_unique(client)
+        self._index(client)
+        self._log_change("insert", client.client_id, tuple(client.to_dict()))
+
+    def update(self, client: Client):
+        """Заменяет клиента с тем же ID и перестраивает его индексы."""
+        if not isinstance(client, Client):
+            raise ValueError("В хранилище можно добавить только объект Client")
+        old = self._by_id.get(client.client_id)
+        if old is None:
+            raise ValueError(f"Клиент с ID {client.client_id} не найден")
+        fields = client.changed_fields(old)
+        if not fields:
+            return
+        self._check_unique(client)
+        # Индекс фамилий меняется, только если изменилась фамилия
+        last_name_changed = normalize_name(client.last_name) != normalize_name(old.last_name)
+        self._unindex(old, last_name_changed)
+        self._index(client, last_name_changed)
+        self._log_change("update", client.client_id, tuple(fields))
+
+    def remove(self, client_id: int) -> Client:
+        """Удаляет клиента по ID и возвращает его."""
+        client = self._by_id.get(client_id)
+        if client is None:
+            raise ValueError(f"Клиент с ID {client_id} не найден")
+        self._unindex(client)
+        self._log_change("delete", client_id, ())
+        return client
+
+    # ЖУРНАЛ ИЗМЕНЕНИЙ
+
+    @property
+    def change_cursor(self) -> int:
+        """Возвращает номер последнего изменения."""
+        return self._changes_offset + len(self._changes)
+
+    def changes(self, since: int = 0) -> list:
+        """
+        Возвращает изменения после курсора since, по одному на клиента:
+        словари {"seq", "op", "client_id", "fields", "client"}.
+        Несколько изменений одного клиента сворачиваются в итоговое:
+        вставка и удаление внутри окна не выгружаются совсем,
+        изменения клиента, известного получателю, выгружаются как update.
+        """
+        if not isinstance(since, int) or since < 0 or since > self.change_cursor:
+            raise ValueError(f"Неверный курсор изменений: {since}")
+        if since < self._changes_offset:
+            raise ValueError(f"Изменения до {self._changes_offset} уже удалены из журнала")
+
+        # ID -> [первая операция, последний номер, объединение полей]
+        summary = {}
+        for seq, op, client_id, fields in self._changes[since - self._changes_offset:]:
+            entry = summary.get(client_id)
+            if entry is None:
+                summary[client_id] = [op, seq, set(fields)]
+            else:
+                entry[1] = seq
+                entry[2].update(fields)
+
+        result = []
+        for client_id, (first_op, seq, fields) in summary.items():
+            client = self._by_id.get(client_id)
+            if first_op == "insert":
+                if client is None:
+                    continue
+                op = "insert"
+            elif client is None:
+                op = "delete"
+            else:
+                op = "update"
+            result.append({
+                "seq": seq,
+                "op": op,
+                "client_id": client_id,
+                "fields": [field for field in client.to_dict() if field in fields] if client else [],
+                "client": client.to_dict() if client else None
+            })
+        result.sort(key=lambda change: change["seq"])
+        return result
+
+    def export_changes(self, target, since: int = 0) -> int:
+        """
+        Записывает изменения после курсора since в JSONL (путь или файл).
+        Возвращает курсор для следующей выгрузки.
+        """
+        cursor = self.change_cursor
+        with client_io.open_source(target, 'w') as file:
+            for change in self.changes(since):
+                file.write(json.dumps(change, ensure_ascii=False, separators=(',', ':')))
+                file.write('\n')
+        return cursor
+
+    def discard_changes(self, until: int):
+        """Удаляет из журнала изменения с номерами до until включительно."""
+        if not isinstance(until, int) or until > self.change_cursor:
+            raise ValueError(f"Неверный курсор изменений: {until}")
+        if until > self._changes_offset:
+            del self._changes[:until - self._changes_offset]
+            self._changes_offset = until
+
+    def _log_change(self, op: str, client_id: int, fields: tuple):
+        self._changes.append((self.change_cursor + 1, op, client_id, fields))
+
+    # ПОИСК
+
+    def get(self, client_id: int) -> Client:
+        """Возвращает клиента по ID или None."""
+        return self._by_id.get(client_id)
+
+    def find_by_phone(self, phone: str) -> Client:
+        """Возвращает клиента по телефону в любом формате или None."""
+        return self._by_phone.get(normalize_phone(phone))
+
+    def find_by_email(self, email: str) -> Client:
+        """Возвращает клиента по email без учета регистра или None."""
+        return self._by_email.get(normalize_email(email))
+
+    def search_last_name(self, prefix: str, limit: int = None) -> list:
+        """
+        Возвращает клиентов, чья фамилия начинается с prefix,
+        в алфавитном порядке фамилий.
+        """
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+
+        result = []
+        last_names = self._last_names
+        position = bisect_left(last_names, prefix)
+        while position < len(last_names) and last_names[position].startswith(prefix):
+            for client_id in self._by_last_name[last_names[position]]:
+                if limit is not None and len(result) >= limit:
+                    return result
+                result.append(self._by_id[client_id])
+            position += 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, client_id) -> bool:
+        return client_id in self._by_id
+
+    # ИНДЕКСЫ
+
+    def _check_unique(self, client: Client):
+        """Проверяет, что телефон и email не заняты другим клиентом."""
+        owner = self._by_phone.get(normalize_phone(client.phone))
+        if owner is not None and owner.client_id != client.client_id:
+            raise ValueError(f"Телефон {client.phone} уже принадлежит клиенту с ID {owner.client_id}")
+        owner = self._by_email.get(normalize_email(client.email))
+        if owner is not None and owner.client_id != client.client_id:
+            raise ValueError(f"Email {client.email} уже принадлежит клиенту с ID {owner.client_id}")
+
+    def _index(self, client: Client, last_name: bool = True):
+        """Добавляет клиента в индексы (в индекс фамилий - если last_name)."""
+        self._by_id[client.client_id] = client
+        phone = normalize_phone(client.phone)
+        if phone:
+            self._by_phone[phone] = client
+        email = normalize_email(client.email)
+        if email:
+            self._by_email[email] = client
+
+        if last_name:
+            key = normalize_name(client.last_name)
+            client_ids = self._by_last_name.get(key)
+            if client_ids is None:
+                insort(self._last_names, key)
+                client_ids = self._by_last_name[key] = []
+            insort(client_ids, client.client_id)
+
+    def _unindex(self, client: Client, last_name: bool = True):
+        """Удаляет клиента из индексов (из индекса фамилий - если last_name)."""
+        del self._by_id[client.client_id]
+        self._by_phone.pop(normalize_phone(client.phone), None)
+        self._by_email.pop(normalize_email(client.email), None)
+
+        if last_name:
+            key = normalize_name(client.last_name)
+            client_ids = self._by_last_name[key]
+            del client_ids[bisect_left(client_ids, client.client_id)]
+            if not client_ids:
+                del self._by_last_name[key]
+                del self._last_names[bisect_left(self._last_names, key)]
@@ -0,0 +1,149 @@
+from array import array
+from sys import getsizeof, intern
+
+from client import Client
+
+
+class _InternedColumn:
+    """
+    Строковая колонка со словарным кодированием.
+    Подходит для часто повторяющихся значений: фамилии, имена, отчества, даты.
+    """
+
+    __slots__ = ('_values', '_index', '_codes')
+
+    def __init__(self):
+        self._values = []
+        self._index = {}
+        self._codes = array('i')
+
+    def append(self, value: str):
+        """Добавляет значение (None хранится как код -1)."""
+        if value is None:
+            self._codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = len(self._values)
+            value = intern(value)
+            self._values.append(value)
+            self._index[value] = code
+        self._codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        code = self._codes[index]
+        return self._values[code] if code >= 0 else None
+
+    def nbytes(self) -> int:
+        """Возвращает примерный объем памяти колонки в байтах."""
+        return (getsizeof(self._codes) + getsizeof(self._values) + getsizeof(self._index)
+                + sum(getsizeof(value) for value in self._values))
+
+
+class _BufferColumn:
+    """
+    Строковая колонка в одном UTF-8 буфере со смещениями.
+    Подходит для почти уникальных значений: телефоны, email.
+    """
+
+    __slots__ = ('_buffer', '_offsets', '_present')
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offsets = array('q', [0])
+        self._present = bytearray()
+
+    def append(self, value: str):
+        """Добавляет значение в конец буфера."""
+        if value is not None:
+            self._buffer += value.encode('utf-8')
+        self._offsets.append(len(self._buffer))
+        self._present.append(value is not None)
+
+    def __getitem__(self, index: int) -> str:
+        if not self._present[index]:
+            return None
+        return self._buffer[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def nbytes(self) -> int:
+        """Возвращает примерный объем памяти колонки в байтах."""
+        return getsizeof(self._buffer) + getsizeof(self._offsets) + getsizeof(self._present)
+
+
+class ClientTable:
+    """
+    Компактное колоночное хранилище клиентов.
+    ID хранятся в array('q'), строки - в интернированных пулах и буферах.
+    При обращении по индексу возвращается новый объект Client.
+    """
+
+    __slots__ = ('_ids', '_last_names', '_first_names', '_patronymics',
+                 '_phones', '_emails', '_registration_dates')
+
+    def __init__(self, clients=None):
+        """
+        Инициализирует таблицу, при необходимости заполняя ее клиентами.
+        """
+        self._ids = array('q')
+        self._last_names = _InternedColumn()
+        self._first_names = _InternedColumn()
+        self._patronymics = _InternedColumn()
+        self._phones = _BufferColumn()
+        self._emails = _BufferColumn()
+        self._registration_dates = _InternedColumn()
+
+        if clients is not None:
+            self.extend(clients)
+
+    # ДОБАВЛЕНИЕ
+
+    def append(self, client: Client):
+        """Добавляет клиента в таблицу."""
+        if not isinstance(client, Client):
+            raise ValueError("В таблицу можно добавить только объект Client")
+
+        self._ids.append(client.client_id)
+        self._last_names.append(client.last_name)
+        self._first_names.append(client.first_name)
+        self._patronymics.append(client.patronymic)
+        self._phones.append(client.phone)
+        self._emails.append(client.email)
+        self._registration_dates.append(client.registration_date)
+
+    def extend(self, clients):
+        """Добавляет несколько клиентов."""
+        for client in clients:
+            self.append(client)
+
+    # ДОСТУП
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> Client:
+        """Возвращает клиента по позиции в таблице."""
+        size = len(self._ids)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Индекс клиента вне диапазона")
+
+        return Client._from_validated(
+            self._ids[index],
+            self._last_names[index],
+            self._first_names[index],
+            self._patronymics[index],
+            self._phones[index],
+            self._emails[index],
+            self._registration_dates[index]
+        )
+
+    def __iter__(self):
+        for index in range(len(self._ids)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """Возвращает примерный объем памяти таблицы в байтах."""
+        return (getsizeof(self._ids) + self._last_names.nbytes() + self._first_names.nbytes()
+                + self._patronymics.nbytes() + self._phones.nbytes() + self._emails.nbytes()
+                + self._registration_dates.nbytes())
@@ -0,0 +1,148 @@
+"""
+Поиск дубликатов клиентов при объединении баз филиалов.
+
+Один и тот же человек может быть зарегистрирован под разными ID, с телефоном
+в другом формате и email в другом регистре. Чтобы не сравнивать все пары,
+клиенты группируются по ключам блокировки (начало фамилии + телефон,
+начало фамилии + email), и сравниваются только внутри одного блока.
+"""
+from client import Client
+from normalize import normalize_email, normalize_name, normalize_phone
+
+# Сколько букв фамилии входит в ключ блокировки
+SURNAME_PREFIX = 3
+# Сколько последних цифр телефона сравнивается (без кода страны)
+PHONE_DIGITS = 10
+# Женские окончания фамилий и соответствующие мужские
+FEMININE_ENDINGS = (("ская", "ский"), ("цкая", "цкий"), ("ова", "ов"), ("ева", "ев"),
+                    ("ина", "ин"), ("ына", "ын"))
+
+
+class DuplicateCluster:
+    """
+    Группа клиентов, которые, вероятно, являются одним человеком.
+    """
+
+    __slots__ = ('clients', 'merged')
+
+    def __init__(self, clients: list, merged: Client):
+        self.clients = clients
+        self.merged = merged
+
+    def __repr__(self) -> str:
+        return (f"DuplicateCluster(ids={[client.client_id for client in self.clients]}, "
+                f"merged={self.merged!r})")
+
+
+def blocking_keys(client: Client) -> list:
+    """Возвращает ключи блокировки клиента."""
+    surname = normalize_name(client.last_name)[:SURNAME_PREFIX]
+    keys = []
+    phone = normalize_phone(client.phone)
+    if phone:
+        keys.append((surname, 'phone', phone[-PHONE_DIGITS:]))
+    email = normalize_email(client.email)
+    if email:
+        keys.append((surname, 'email', email))
+    return keys
+
+
+def surname_key(last_name: str) -> str:
+    """
+    Приводит фамилию к ключу сравнения: нижний регистр, 'ё' -> 'е',
+    женская форма -> мужская ("Иванова" и "Иванов" дают один ключ).
+    Части составной фамилии приводятся по отдельности.
+    """
+    parts = []
+    for part in (normalize_name(last_name) or '').split('-'):
+        for feminine, masculine in FEMININE_ENDINGS:
+            if part.endswith(feminine):
+                part = part[:-len(feminine)] + masculine
+                break
+        parts.append(part)
+    return '-'.join(parts)
+
+
+def is_same_person(first: Client, second: Client) -> bool:
+    """
+    Проверяет двух клиентов из одного блока: совпадают фамилия (с точностью
+    до женской формы и 'ё') и имя, а отчества (если указаны у обоих) равны.
+    Родственники с общим телефоном отличаются именем.
+    """
+    if normalize_name(first.first_name) != normalize_name(second.first_name):
+        return False
+    if surname_key(first.last_name) != surname_key(second.last_name):
+        return False
+    if first.patronymic and second.patronymic:
+        return normalize_name(first.patronymic) == normalize_name(second.patronymic)
+    return True
+
+
+def merge_clients(clients: list) -> Client:
+    """
+    Объединяет дубликаты в одного клиента.
+    Основной - самый ранний по дате регистрации (затем по ID);
+    пустые поля дополняются значениями остальных.
+    """
+    ordered = sorted(clients, key=lambda client: (client.registration_date or '9999-99-99',
+                                                  client.client_id))
+    primary = ordered[0]
+
+    def first_value(field: str):
+        return next((getattr(client, field) for client in ordered
+                     if getattr(client, field) is not None), None)
+
+    return Client._from_validated(
+        primary.client_id, primary.last_name, primary.first_name,
+        first_value("patronymic"), first_value("phone"), first_value("email"),
+        primary.registration_date
+    )
+
+
+def find_duplicates(clients, max_block_size: int = 50) -> list:
+    """
+    Находит группы дубликатов среди клиентов.
+    В блоке больше max_block_size каждый клиент сравнивается только
+    с первыми max_block_size клиентами блока.
+    Возвращает список DuplicateCluster, упорядоченный по ID основного клиента.
+    """
+    clients = list(clients)
+    blocks = {}
+    for position, client in enumerate(clients):
+        for key in blocking_keys(client):
+            blocks.setdefault(key, []).append(position)
+
+    parents = list(range(len(clients)))
+    # Корень группы -> отчество группы (None, если ни у кого не указано).
+    # Клиент без отчества подходит к любому, но группы с разными
+    # отчествами через него не объединяются.
+    patronymics = [normalize_name(client.patronymic) for client in clients]
+
+    def find(position: int) -> int:
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position = parents[position]
+        return position
+
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        for index, position in enumerate(members[1:], start=1):
+            for other in members[:min(index, max_block_size)]:
+                root, other_root = find(position), find(other)
+                if root == other_root or not is_same_person(clients[position], clients[other]):
+                    continue
+                patronymic, other_patronymic = patronymics[root], patronymics[other_root]
+                if patronymic and other_patronymic and patronymic != other_patronymic:
+                    continue
+                parents[root] = other_root
+                patronymics[other_root] = other_patronymic or patronymic
+
+    groups = {}
+    for position, client in enumerate(clients):
+        groups.setdefault(find(position), []).append(client)
+
+    clusters = [DuplicateCluster(group, merge_clients(group)) for group in groups.values()
+                if len(group) > 1]
+    clusters.sort(key=lambda cluster: cluster.merged.client_id)
+    return clusters
@@ -0,0 +1,135 @@
+"""
+Необязательные счетчики для горячих путей создания и преобразования клиентов.
+
+Пока инструментирование выключено, код не меняется вообще: enable()
+подменяет правила валидации и методы Client/ShortClient обертками,
+disable() возвращает исходные функции. Поэтому в выключенном состоянии
+накладные расходы равны нулю.
+
+Для каждого имени считаются вызовы, ошибки (исключения) и суммарное время.
+"""
+from contextlib import contextmanager
+from time import perf_counter
+
+from client import Client
+from short_client import ShortClient
+
+# Методы, которые оборачиваются при включении: (класс, имя атрибута)
+METHODS = (
+    (ShortClient, "__init__"),
+    (Client, "__init__"),
+    (Client, "from_dict"),
+    (Client, "from_json"),
+    (Client, "to_dict"),
+    (Client, "to_json"),
+    (Client, "load_many"),
+    (Client, "dump_many"),
+)
+# Классы, чьи правила валидации (_field_rules) оборачиваются
+RULE_OWNERS = (ShortClient, Client)
+
+# Имя -> [вызовы, ошибки, секунды]
+_metrics = {}
+# Подмененные атрибуты: (объект, ключ, исходное значение)
+_patches = []
+
+
+def _wrap(name: str, function):
+    """Возвращает обертку, которая считает вызовы, ошибки и время."""
+    metric = _metrics.setdefault(name, [0, 0, 0.0])
+
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            metric[1] += 1
+            raise
+        finally:
+            metric[0] += 1
+            metric[2] += perf_counter() - start
+
+    wrapper.__name__ = getattr(function, "__name__", name)
+    wrapper.__doc__ = getattr(function, "__doc__", None)
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def is_enabled() -> bool:
+    """Возвращает True, если инструментирование включено."""
+    return bool(_patches)
+
+
+def enable():
+    """Включает инструментирование (повторный вызов ничего не делает)."""
+    if _patches:
+        return
+
+    for owner in RULE_OWNERS:
+        rules = owner.__dict__["_field_rules"]
+        for field, rule in list(rules.items()):
+            _patches.append((rules, field, rule))
+            rules[field] = _wrap(f"validate.{field}", rule)
+
+    for owner, attribute in METHODS:
+        original = owner.__dict__[attribute]
+        name = f"{owner.__name__}.{attribute}"
+        if isinstance(original, classmethod):
+            wrapped = classmethod(_wrap(name, original.__func__))
+        elif isinstance(original, staticmethod):
+            wrapped = staticmethod(_wrap(name, original.__func__))
+        else:
+            wrapped = _wrap(name, original)
+        _patches.append((owner, attribute, original))
+        setattr(owner, attribute, wrapped)
+
+
+def disable():
+    """Выключает инструментирование и возвращает исходные функции."""
+    while _patches:
+        target, key, original = _patches.pop()
+        if isinstance(target, dict):
+            target[key] = original
+        else:
+            setattr(target, key, original)
+
+
+@contextmanager
+def instrumented():
+    """Включает инструментирование на время блока with."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset():
+    """Обнуляет все счетчики."""
+    for metric in _metrics.values():
+        metric[:] = [0, 0, 0.0]
+
+
+def snapshot() -> dict:
+    """
+    Возвращает счетчики: {имя: {"calls", "failures", "seconds"}}.
+    Имена без вызовов не включаются.
+    """
+    return {name: {"calls": calls, "failures": failures, "seconds": seconds}
+            for name, (calls, failures, seconds) in sorted(_metrics.items()) if calls}
+
+
+def to_prometheus(prefix: str = "barbershop") -> str:
+    """Возвращает счетчики в текстовом формате Prometheus."""
+    metrics = snapshot()
+    lines = []
+    for suffix, key, description in (("calls_total", "calls", "Число вызовов"),
+                                     ("failures_total", "failures", "Число ошибок"),
+                                     ("seconds_total", "seconds", "Суммарное время, секунды")):
+        lines.append(f"# HELP {prefix}_{suffix} {description}")
+        lines.append(f"# TYPE {prefix}_{suffix} counter")
+        for name, values in metrics.items():
+            lines.append(f'{prefix}_{suffix}{{name="{name}"}} {values[key]}')
+    return "\n".join(lines) + "\n"
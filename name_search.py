@@ -0,0 +1,401 @@
+import heapq
+from bisect import bisect_left, insort
+from itertools import product
+
+from normalize import normalize_name
+from short_client import ShortClient
+
+# Порядок полей при ранжировании: фамилия важнее имени, имя важнее отчества
+LAST_NAME, FIRST_NAME, PATRONYMIC = 0, 1, 2
+
+# Веса совпадений: точное, по префиксу, с опечатками (плюс число опечаток)
+EXACT, PREFIX, FUZZY = 0, 1, 2
+
+# Ограничения поиска по нескольким словам: короткие слова вроде "а" подходят
+# к тысячам токенов. Для каждого слова берутся лучшие токены каждого поля так,
+# чтобы сочетаний было не больше MAX_COMBINATIONS, а проверок списков
+# клиентов - не больше MAX_CHECKS (после этого возвращается найденное).
+MAX_COMBINATIONS = 1024
+MAX_CHECKS = 30_000
+
+
+def _name_tokens(name: str) -> list:
+    """
+    Разбивает имя на токены поиска.
+    Составные имена ("Римский-Корсаков") индексируются целиком и по частям,
+    повторяющиеся части ("Ким-Ким") - один раз.
+    """
+    name = normalize_name(name)
+    if not name:
+        return []
+    tokens = [name]
+    parts = name.replace('-', ' ').split()
+    if len(parts) > 1:
+        tokens.extend(parts)
+    return list(dict.fromkeys(tokens))
+
+
+def _trigrams(token: str) -> set:
+    """Возвращает триграммы токена с маркером начала слова."""
+    padded = '$' + token
+    return {padded[i:i + 3] for i in range(len(padded) - 2)} or {padded}
+
+
+def _max_typos(word: str, max_typos: int = None) -> int:
+    """Возвращает допустимое число опечаток: заданное или по длине слова (0, 1 или 2)."""
+    if max_typos is not None:
+        return max_typos
+    return 0 if len(word) < 3 else 1 if len(word) <= 5 else 2
+
+
+def _prefix_distance(word: str, token: str, max_distance: int) -> int:
+    """
+    Возвращает минимальное расстояние Левенштейна между word и любым
+    префиксом token или None, если оно больше max_distance.
+    """
+    previous = list(range(len(token) + 1))
+    for i, char in enumerate(word, start=1):
+        current = [i]
+        for j, token_char in enumerate(token, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char != token_char)))
+        if min(current) > max_distance:
+            return None
+        previous = current
+    distance = min(previous)
+    return distance if distance <= max_distance else None
+
+
+class NameSearchIndex:
+    """
+    Индекс поиска клиентов по фамилии, имени и отчеству.
+    Поддерживает поиск по префиксу и с опечатками, результаты ранжируются:
+    точное совпадение, затем префикс, затем опечатки; фамилия важнее имени.
+    """
+
+    def __init__(self, clients=None):
+        """
+        Инициализирует индекс, при необходимости заполняя его клиентами.
+        """
+        self._clients = {}
+        # ID клиента -> пары (поле, токен)
+        self._client_tokens = {}
+        # Токен -> три словаря ID (по одному на поле) в порядке добавления
+        self._postings = {}
+        # Отсортированный словарь токенов для поиска по префиксу
+        self._vocabulary = []
+        # Триграмма -> множество токенов для поиска с опечатками
+        self._trigrams = {}
+
+        if clients is not None:
+            for client in clients:
+                self.add(client)
+
+    # ИЗМЕНЕНИЕ
+
+    def add(self, client: ShortClient):
+        """Добавляет клиента в индекс (повторное добавление обновляет его)."""
+        if not isinstance(client, ShortClient):
+            raise ValueError("В индекс можно добавить только объект ShortClient")
+        if client.client_id in self._clients:
+            self.remove(client.client_id)
+
+        pairs = []
+        for field, name in ((LAST_NAME, client.last_name), (FIRST_NAME, client.first_name),
+                            (PATRONYMIC, client.patronymic)):
+            for token in _name_tokens(name):
+                pairs.append((field, token))
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = ({}, {}, {})
+                    self._add_token(token)
+                postings[field][client.client_id] = None
+
+        self._clients[client.client_id] = client
+        self._client_tokens[client.client_id] = tuple(pairs)
+
+    def remove(self, client_id: int) -> ShortClient:
+        """Удаляет клиента из индекса и возвращает его."""
+        client = self._clients.pop(client_id, None)
+        if client is None:
+            raise ValueError(f"Клиент с ID {client_id} не найден")
+
+        for field, token in self._client_tokens.pop(client_id):
+            postings = self._postings[token]
+            postings[field].pop(client_id, None)
+            if not any(postings):
+                del self._postings[token]
+                self._remove_token(token)
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    # ПОИСК
+
+    def search(self, query: str, limit: int = 10, max_typos: int = None) -> list:
+        """
+        Ищет клиентов по началу фамилии, имени и/или отчества.
+        Каждое слово запроса сопоставляется с отдельной частью ФИО.
+        max_typos по умолчанию зависит от длины слова (0, 1 или 2).
+        """
+        words = (normalize_name(query) or '').split() if isinstance(query, str) else []
+        if not words or limit <= 0:
+            return []
+
+        if len(words) == 1:
+            client_ids = self._search_word(words[0], limit, max_typos)
+        else:
+            client_ids = self._search_words(words, limit, max_typos)
+        return [self._clients[client_id] for client_id in client_ids]
+
+    def _search_word(self, word: str, limit: int, max_typos: int) -> list:
+        """Ищет по одному слову, перебирая токены в порядке ранга."""
+        result = {}
+        for _, field, token in self._ranked_tokens(word, max_typos, limit):
+            for client_id in self._postings[token][field]:
+                result[client_id] = None
+                if len(result) >= limit:
+                    return list(result)
+        return list(result)
+
+    def _search_words(self, words: list, limit: int, max_typos: int) -> list:
+        """
+        Ищет по нескольким словам в два прохода: сначала только точные
+        и префиксные совпадения, затем, если их не хватило на limit,
+        сочетания с опечатками (они ранжируются ниже любых сочетаний без них).
+        """
+        result = {}
+        # Пересечения пар самых коротких списков клиентов общие для многих сочетаний
+        pairs = {}
+        budget = self._search_combinations(words, 0, limit, result, MAX_CHECKS, pairs)
+        if len(result) < limit and budget > 0 and any(_max_typos(word, max_typos) for word in words):
+            self._search_combinations(words, max_typos, limit, result, budget, pairs)
+        return list(result)
+
+    def _search_combinations(self, words: list, max_typos: int, limit: int,
+                             result: dict, budget: int, pairs: dict) -> int:
+        """
+        Перебирает сочетания лучших токенов слов (не больше MAX_COMBINATIONS)
+        в порядке суммарного ранга и добавляет найденных клиентов в result,
+        пока не наберется limit или не кончится budget проверок.
+        При max_typos != 0 пропускаются сочетания без опечаток - они
+        проверены в первом проходе. Возвращает оставшийся budget.
+        """
+        per_field = max(1, int(MAX_COMBINATIONS ** (1 / len(words))) // 3)
+        ranked = []
+        for word in words:
+            taken = [0, 0, 0]
+            tokens = []
+            for rank, field, token in self._ranked_tokens(word, max_typos):
+                if taken[field] < per_field:
+                    taken[field] += 1
+                    tokens.append((rank + field / 10, field, token))
+            if not tokens:
+                return budget
+            ranked.append(tokens)
+
+        # Сочетания, где два слова попадают в одно поле, возможны только
+        # для составных имен, поэтому они перебираются последними
+        combinations = sorted(product(*ranked), key=lambda combo: (
+            len(combo) - len({field for _, field, _ in combo}), sum(weight for weight, _, _ in combo)))
+
+        for combo in combinations:
+            if max_typos != 0 and all(weight < FUZZY for weight, _, _ in combo):
+                continue
+            keys = {(field, token) for _, field, token in combo}
+            if len(keys) < len(combo):
+                continue
+            keys = sorted(keys, key=lambda key: len(self._postings[key[1]][key[0]]))
+            pair = (keys[0], keys[1])
+            matched = pairs.get(pair)
+            if matched is None:
+                first, second = (self._postings[token][field] for field, token in pair)
+                budget -= len(first)
+                if budget < 0:
+                    return budget
+                # Пересечение множеств считается на уровне C; пустое
+                # отсекает все сочетания с этой парой без новых проверок
+                matched = pairs[pair] = first.keys() & second.keys()
+            for field, token in keys[2:]:
+                if not matched:
+                    break
+                budget -= len(matched)
+                matched = matched & self._postings[token][field].keys()
+            if not matched or matched <= result.keys():
+                continue
+            # Новые клиенты добавляются в порядке самого короткого списка
+            field, token = keys[0]
+            for client_id in self._postings[token][field]:
+                if client_id in matched and client_id not in result:
+                    result[client_id] = None
+                    if len(result) >= limit:
+                        return budget
+        return budget
+
+    def _ranked_tokens(self, word: str, max_typos: int = None, enough: int = None) -> list:
+        """
+        Возвращает тройки (ранг, поле, токен), подходящие под слово,
+        в порядке убывания релевантности. Если точных и префиксных
+        совпадений хватает на enough клиентов, опечатки не ищутся.
+        """
+        ranked = []
+        found = 0
+        position = bisect_left(self._vocabulary, word)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(word):
+            token = self._vocabulary[position]
+            rank = EXACT if token == word else PREFIX
+            for field, client_ids in enumerate(self._postings[token]):
+                if client_ids:
+                    ranked.append((rank, field, len(token), token))
+                    found += len(client_ids)
+            position += 1
+
+        max_typos = _max_typos(word, max_typos)
+        if max_typos > 0 and (enough is None or found < enough):
+            for token, distance in self._fuzzy_tokens(word, max_typos):
+                for field, client_ids in enumerate(self._postings[token]):
+                    if client_ids:
+                        ranked.append((FUZZY + distance, field, len(token), token))
+
+        ranked.sort()
+        return [(rank, field, token) for rank, field, _, token in ranked]
+
+    def _fuzzy_tokens(self, word: str, max_typos: int) -> list:
+        """Возвращает токены с опечатками относительно слова (без префиксных)."""
+        word_trigrams = _trigrams(word)
+        # Каждая опечатка портит не более трех триграмм
+        required = max(1, len(word_trigrams) - 3 * max_typos)
+
+        counts = {}
+        for trigram in word_trigrams:
+            for token in self._trigrams.get(trigram, ()):
+                counts[token] = counts.get(token, 0) + 1
+
+        result = []
+        for token, count in counts.items():
+            if count < required or token.startswith(word):
+                continue
+            distance = _prefix_distance(word, token, max_typos)
+            if distance is not None:
+                result.append((token, distance))
+        return result
+
+    # СЛОВАРЬ ТОКЕНОВ
+
+    def _add_token(self, token: str):
+        """Добавляет новый токен в словарь и триграммный индекс."""
+        insort(self._vocabulary, token)
+        for trigram in _trigrams(token):
+            self._trigrams.setdefault(trigram, set()).add(token)
+
+    def _remove_token(self, token: str):
+        """Удаляет токен, у которого не осталось клиентов."""
+        del self._vocabulary[bisect_left(self._vocabulary, token)]
+        for trigram in _trigrams(token):
+            tokens = self._trigrams[trigram]
+            tokens.discard(token)
+            if not tokens:
+                del self._trigrams[trigram]
+
+
+# ПОИСК БЕЗ ИНДЕКСА
+
+class _QueryMatcher:
+    """
+    Ранжирует отдельных клиентов по одному запросу так же, как NameSearchIndex.
+    Совпадения слов кэшируются по значению каждой части ФИО: фамилии и имена
+    повторяются, поэтому клиент обычно проверяется за три обращения к словарю.
+    """
+
+    def __init__(self, words: list, max_typos: int = None):
+        self._words = words
+        self._typos = [_max_typos(word, max_typos) for word in words]
+        self._ranks = [{} for _ in words]
+        # Для каждого поля: значение -> (число токенов, подходящие токены для каждого слова)
+        self._matches = ({}, {}, {})
+
+    def key(self, client: ShortClient) -> tuple:
+        """Возвращает ключ сортировки клиента (меньше - лучше) или None."""
+        last_names, first_names, patronymics = self._matches
+        fields = (last_names.get(client.last_name) or self._field_matches(LAST_NAME, client.last_name),
+                  first_names.get(client.first_name) or self._field_matches(FIRST_NAME, client.first_name),
+                  patronymics.get(client.patronymic) or self._field_matches(PATRONYMIC, client.patronymic))
+
+        if len(self._words) == 1:
+            candidates = [matches[0][0] for _, matches in fields if matches[0]]
+            return min(candidates) if candidates else None
+
+        (last_count, last_matches), (first_count, first_matches), (other_count, other_matches) = fields
+        if last_count + first_count + other_count < len(self._words):
+            return None
+        for number in range(len(self._words)):
+            if not (last_matches[number] or first_matches[number] or other_matches[number]):
+                return None
+        matches = [[(rank + field / 10, field, token) for _, field_matches in fields
+                    for rank, field, _, token in field_matches[number]]
+                   for number in range(len(self._words))]
+
+        # Как в NameSearchIndex._search_words: каждое слово - своя пара (поле, токен),
+        # сочетания с опечатками после остальных, затем без повторов полей
+        # и по сумме весов
+        best = None
+        for combo in product(*matches):
+            if len({(field, token) for _, field, token in combo}) < len(combo):
+                continue
+            candidate = (any(weight >= FUZZY for weight, _, _ in combo),
+                         len(combo) - len({field for _, field, _ in combo}),
+                         sum(weight for weight, _, _ in combo))
+            if best is None or candidate < best:
+                best = candidate
+        return best
+
+    def _field_matches(self, field: int, name: str) -> tuple:
+        """
+        Возвращает число токенов значения и подходящие токены для каждого
+        слова - четверки (ранг, поле, длина, токен) по возрастанию.
+        """
+        tokens = _name_tokens(name)
+        matches = self._matches[field][name] = (len(tokens), tuple(
+            tuple(sorted((rank, field, len(token), token) for token in tokens
+                         for rank in (self._rank(number, token),) if rank is not None))
+            for number in range(len(self._words))))
+        return matches
+
+    def _rank(self, number: int, token: str) -> int:
+        """Возвращает ранг совпадения слова с токеном или None."""
+        ranks = self._ranks[number]
+        if token in ranks:
+            return ranks[token]
+        word, max_typos = self._words[number], self._typos[number]
+        rank = None
+        if token == word:
+            rank = EXACT
+        elif token.startswith(word):
+            rank = PREFIX
+        elif max_typos > 0:
+            # Тот же отбор по триграммам, что в NameSearchIndex._fuzzy_tokens
+            word_trigrams = _trigrams(word)
+            if len(word_trigrams & _trigrams(token)) >= max(1, len(word_trigrams) - 3 * max_typos):
+                distance = _prefix_distance(word, token, max_typos)
+                if distance is not None:
+                    rank = FUZZY + distance
+        ranks[token] = rank
+        return rank
+
+
+def search_clients(clients, query: str, limit: int = 10, max_typos: int = None) -> list:
+    """
+    Ищет по ФИО в потоке клиентов без построения индекса - для одного
+    запроса. Ранжирование то же, что у NameSearchIndex.search (при равном
+    ранге - в порядке потока). В памяти держатся только limit лучших
+    клиентов и совпадения для различных значений фамилий, имен и отчеств.
+    """
+    words = (normalize_name(query) or '').split() if isinstance(query, str) else []
+    if not words or limit <= 0:
+        return []
+
+    matcher = _QueryMatcher(words, max_typos)
+    ranked = ((key, number, client) for number, client in enumerate(clients)
+              for key in (matcher.key(client),) if key is not None)
+    return [client for _, _, client in heapq.nsmallest(limit, ranked)]
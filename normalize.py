@@ -0,0 +1,32 @@
+"""
+Нормализация контактных данных и имен клиентов для поиска и сравнения.
+"""
+
+
+def normalize_phone(phone: str) -> str:
+    """
+    Приводит телефон к виду 7XXXXXXXXXX (только цифры).
+    Номера 8XXXXXXXXXX и XXXXXXXXXX считаются российскими.
+    """
+    if phone is None:
+        return None
+    digits = ''.join(char for char in phone if char.isdigit())
+    if len(digits) == 11 and digits[0] == '8':
+        return '7' + digits[1:]
+    if len(digits) == 10:
+        return '7' + digits
+    return digits or None
+
+
+def normalize_email(email: str) -> str:
+    """Приводит email к нижнему регистру без пробелов по краям."""
+    if email is None:
+        return None
+    return email.strip().lower() or None
+
+
+def normalize_name(name: str) -> str:
+    """Приводит имя к нижнему регистру и заменяет 'ё' на 'е'."""
+    if name is None:
+        return None
+    return name.strip().lower().replace('ё', 'е') or None
@@ -0,0 +1,217 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta
+from heapq import merge
+from itertools import islice
+
+from appointment import Appointment
+
+
+class _Timeline:
+    """
+    Записи одного мастера, отсортированные по времени.
+    Записи мастера не пересекаются, поэтому списки начал и концов
+    отсортированы одновременно и поиск конфликта - двоичный.
+    """
+
+    __slots__ = ('branch_id', 'starts', 'ends', 'appointments')
+
+    def __init__(self, branch_id: int):
+        self.branch_id = branch_id
+        self.starts = []
+        self.ends = []
+        self.appointments = []
+
+    def overlapping(self, start: datetime, end: datetime) -> list:
+        """Возвращает записи, пересекающиеся с [start, end)."""
+        position = bisect_right(self.ends, start)
+        result = []
+        while position < len(self.starts) and self.starts[position] < end:
+            result.append(self.appointments[position])
+            position += 1
+        return result
+
+    def insert(self, appointment: Appointment):
+        position = bisect_left(self.starts, appointment.start)
+        self.starts.insert(position, appointment.start)
+        self.ends.insert(position, appointment.end)
+        self.appointments.insert(position, appointment)
+
+    def remove(self, appointment: Appointment):
+        position = bisect_left(self.starts, appointment.start)
+        del self.starts[position]
+        del self.ends[position]
+        del self.appointments[position]
+
+
+class Scheduler:
+    """
+    Расписание мастеров нескольких филиалов.
+    Конфликты проверяются двоичным поиском по расписанию мастера,
+    свободные окна ищутся проходом по промежуткам между записями.
+    """
+
+    def __init__(self, opening: time = time(10), closing: time = time(21)):
+        """
+        Инициализирует расписание с рабочими часами opening-closing.
+        """
+        if not isinstance(opening, time) or not isinstance(closing, time) or opening >= closing:
+            raise ValueError("Рабочие часы должны быть временем, начало раньше конца")
+        self._opening = opening
+        self._closing = closing
+        self._timelines = {}
+        self._appointments = {}
+        self._by_client = {}
+
+    # МАСТЕРА
+
+    def add_barber(self, barber_id: int, branch_id: int):
+        """Добавляет мастера в филиал."""
+        if barber_id in self._timelines:
+            raise ValueError(f"Мастер с ID {barber_id} уже существует")
+        self._timelines[barber_id] = _Timeline(branch_id)
+
+    def barbers(self, branch_id: int = None) -> list:
+        """Возвращает ID мастеров (всех или одного филиала)."""
+        return [barber_id for barber_id, timeline in self._timelines.items()
+                if branch_id is None or timeline.branch_id == branch_id]
+
+    # ЗАПИСИ
+
+    def book(self, appointment: Appointment):
+        """Добавляет запись. Выбрасывает ValueError при пересечении."""
+        if not isinstance(appointment, Appointment):
+            raise ValueError("Добавить можно только объект Appointment")
+        if appointment.appointment_id in self._appointments:
+            raise ValueError(f"Запись с ID {appointment.appointment_id} уже существует")
+        timeline = self._timeline(appointment)
+        conflicts = timeline.overlapping(appointment.start, appointment.end)
+        if conflicts:
+            raise ValueError(f"Запись {appointment.appointment_id} пересекается "
+                             f"с записью {conflicts[0].appointment_id}")
+
+        timeline.insert(appointment)
+        self._appointments[appointment.appointment_id] = appointment
+        self._by_client.setdefault(appointment.client_id, set()).add(appointment.appointment_id)
+
+    def cancel(self, appointment_id: int) -> Appointment:
+        """Отменяет запись и возвращает ее."""
+        appointment = self._appointments.pop(appointment_id, None)
+        if appointment is None:
+            raise ValueError(f"Запись с ID {appointment_id} не найдена")
+        self._timelines[appointment.barber_id].remove(appointment)
+        client_appointments = self._by_client[appointment.client_id]
+        client_appointments.discard(appointment_id)
+        if not client_appointments:
+            del self._by_client[appointment.client_id]
+        return appointment
+
+    def get(self, appointment_id: int) -> Appointment:
+        """Возвращает запись по ID или None."""
+        return self._appointments.get(appointment_id)
+
+    def appointments_for_client(self, client_id: int) -> list:
+        """Возвращает записи клиента по времени начала."""
+        appointments = (self._appointments[appointment_id]
+                        for appointment_id in self._by_client.get(client_id, ()))
+        return sorted(appointments, key=lambda appointment: appointment.start)
+
+    def conflicts(self, barber_id: int, start: datetime, end: datetime) -> list:
+        """Возвращает записи мастера, пересекающиеся с [start, end)."""
+        timeline = self._timelines.get(barber_id)
+        if timeline is None:
+            raise ValueError(f"Мастер с ID {barber_id} не найден")
+        return timeline.overlapping(start, end)
+
+    def reschedule_many(self, changes) -> list:
+        """
+        Переносит несколько записей сразу: пары (ID записи, новое начало)
+        или тройки (ID записи, новое начало, новый мастер).
+        Перенос атомарный: при любом конфликте расписание не меняется.
+        Возвращает новые записи.
+        """
+        moved = []
+        for change in changes:
+            appointment_id, start, barber_id = (tuple(change) + (None,))[:3]
+            appointment = self._appointments.get(appointment_id)
+            if appointment is None:
+                raise ValueError(f"Запись с ID {appointment_id} не найдена")
+            branch_id = None
+            if barber_id is not None:
+                if barber_id not in self._timelines:
+                    raise ValueError(f"Мастер с ID {barber_id} не найден")
+                branch_id = self._timelines[barber_id].branch_id
+            moved.append(appointment.moved(start, barber_id, branch_id))
+        if len({appointment.appointment_id for appointment in moved}) < len(moved):
+            raise ValueError("Запись переносится несколько раз")
+
+        originals = [self.cancel(appointment.appointment_id) for appointment in moved]
+        booked = []
+        try:
+            for appointment in moved:
+                self.book(appointment)
+                booked.append(appointment)
+        except ValueError:
+            for appointment in booked:
+                self.cancel(appointment.appointment_id)
+            for appointment in originals:
+                self.book(appointment)
+            raise
+        return moved
+
+    # СВОБОДНЫЕ ОКНА
+
+    def find_free_slots(self, start: datetime, end: datetime, duration: timedelta,
+                        branch_id: int = None, barber_ids=None, limit: int = None) -> list:
+        """
+        Возвращает свободные окна не короче duration в рабочие часы
+        между start и end: тройки (начало, конец, ID мастера) по времени начала.
+        limit ограничивает число окон (ищутся самые ранние).
+        """
+        if duration <= timedelta(0):
+            raise ValueError("Длительность должна быть положительной")
+        if barber_ids is None:
+            barber_ids = self.barbers(branch_id)
+
+        gaps = []
+        for barber_id in barber_ids:
+            timeline = self._timelines.get(barber_id)
+            if timeline is None:
+                raise ValueError(f"Мастер с ID {barber_id} не найден")
+            gaps.append(self._barber_gaps(barber_id, timeline, start, end, duration))
+        if limit is None:
+            # Без ограничения сортировка всех окон быстрее слияния генераторов
+            result = [gap for barber_gaps in gaps for gap in barber_gaps]
+            result.sort()
+            return result
+        return list(islice(merge(*gaps), limit))
+
+    def _barber_gaps(self, barber_id: int, timeline: _Timeline, start: datetime, end: datetime,
+                     duration: timedelta):
+        """Генерирует свободные окна мастера по возрастанию начала."""
+        starts, ends = timeline.starts, timeline.ends
+
+        day = start.date()
+        while True:
+            open_at = datetime.combine(day, self._opening)
+            if open_at >= end:
+                return
+            cursor = max(open_at, start)
+            close_at = min(datetime.combine(day, self._closing), end)
+            if cursor < close_at:
+                position = bisect_right(ends, cursor)
+                while position < len(starts) and starts[position] < close_at:
+                    if starts[position] - cursor >= duration:
+                        yield cursor, starts[position], barber_id
+                    cursor = max(cursor, ends[position])
+                    position += 1
+                if close_at - cursor >= duration:
+                    yield cursor, close_at, barber_id
+            day += timedelta(days=1)
+
+    def _timeline(self, appointment: Appointment) -> _Timeline:
+        timeline = self._timelines.get(appointment.barber_id)
+        if timeline is None:
+            raise ValueError(f"Мастер с ID {appointment.barber_id} не найден")
+        if timeline.branch_id != appointment.branch_id:
+            raise ValueError(f"Мастер с ID {appointment.barber_id} работает в другом филиале")
+        return timeline
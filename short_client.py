@@ -1,47 +1,48 @@
+from collections.abc import Sequence
+from itertools import count
+
+import client_ids
+import client_io
+import validation
+
+# Частицы, которые пишутся после отчества отдельным словом (Мамедов Рашид Алиевич оглы)
+PATRONYMIC_PARTICLES = frozenset(("оглы", "кызы", "улы", "уулу", "гызы"))
+
+
 class ShortClient:
     """
     Базовый класс для краткого представления клиента.
     Содержит основную информацию: ФИО и ID.
     """
 
+    # Слоты вместо __dict__ - экономия памяти на больших выборках клиентов.
+    # Слоты с префиксом _cached_ заполняются лениво при первом обращении
+    # и сбрасываются в None методом _clear_cached.
+    __slots__ = ('_client_id', '_last_name', '_first_name', '_patronymic',
+                 '_cached_initials', '_cached_full_name', '_cached_full_name_with_initials',
+                 '_cached_hash')
+
+    # Правила валидации полей (см. validation.py); подклассы могут их заменить
+    _field_rules = {
+        "client_id": validation.positive_int("ID клиента"),
+        "last_name": validation.required_string("Фамилия", min_length=2),
+        "first_name": validation.required_string("Имя", min_length=2),
+        "patronymic": validation.optional_string("Отчество"),
+    }
+
     def __init__(self, client_id: int, last_name: str, first_name: str, patronymic: str = None):
         """
         Инициализирует объект краткого представления клиента.
+        Каждое значение проверяется и очищается от пробелов один раз.
         """
-        # Валидация обязательных полей
-        self._validate_positive_int(client_id, "ID клиента")
-        self._validate_required_string(last_name, "Фамилия", min_length=2)
-        self._validate_required_string(first_name, "Имя", min_length=2)
-        self._validate_optional_string(patronymic, "Отчество")
+        rules = self._field_rules
 
         # Защищенные поля (один подчерк - для наследования)
-        self._client_id = client_id
-        self._last_name = last_name.strip()
-        self._first_name = first_name.strip()
-        self._patronymic = patronymic.strip() if patronymic else None
-
-    # СТАТИЧЕСКИЕ МЕТОДЫ ВАЛИДАЦИИ
-
-    @staticmethod
-    def _validate_positive_int(value: int, field_name: str):
-        """Проверяет положительное целое число."""
-        if not isinstance(value, int) or value <= 0:
-            raise ValueError(f"{field_name} должен быть положительным целым числом")
-
-    @staticmethod
-    def _validate_required_string(value: str, field_name: str, min_length: int = 1):
-        """Проверяет обязательные строковые поля."""
-        if not value or not isinstance(value, str) or not value.strip():
-            raise ValueError(f"{field_name} не может быть пустой")
-        if len(value.strip()) < min_length:
-            raise ValueError(f"{field_name} должна содержать минимум {min_length} символов")
-
-    @staticmethod
-    def _validate_optional_string(value: str, field_name: str):
-        """Проверяет опциональные строковые поля."""
-        if value is not None:
-            if not isinstance(value, str) or not value.strip():
-                raise ValueError(f"{field_name} не может быть пустой")
+        self._client_id = rules["client_id"](client_id)
+        self._last_name = rules["last_name"](last_name)
+        self._first_name = rules["first_name"](first_name)
+        self._patronymic = rules["patronymic"](patronymic)
+        self._clear_cached()
 
     # СВОЙСТВА (геттеры)
 
@@ -65,31 +66,47 @@ class ShortClient:
         """Возвращает отчество клиента."""
         return self._patronymic
 
+    def _clear_cached(self):
+        """Сбрасывает кешированные производные значения."""
+        self._cached_initials = None
+        self._cached_full_name = None
+        self._cached_full_name_with_initials = None
+        self._cached_hash = None
+
     # МЕТОДЫ ПРЕОБРАЗОВАНИЯ
 
     def get_initials(self) -> str:
         """
         Возвращает инициалы клиента.
         """
+        if self._cached_initials is not None:
+            return self._cached_initials
         first_initial = self.first_name[0] + '.' if self.first_name else ''
         patronymic_initial = self.patronymic[0] + '.' if self.patronymic else ''
-        return f"{first_initial}{patronymic_initial}"
+        self._cached_initials = f"{first_initial}{patronymic_initial}"
+        return self._cached_initials
 
     def get_full_name_with_initials(self) -> str:
         """
         Возвращает полное имя с инициалами.
         """
+        if self._cached_full_name_with_initials is not None:
+            return self._cached_full_name_with_initials
         initials = self.get_initials()
-        return f"{self.last_name} {initials}"
+        self._cached_full_name_with_initials = f"{self.last_name} {initials}"
+        return self._cached_full_name_with_initials
 
     def get_full_name(self) -> str:
         """
         Возвращает полное ФИО клиента.
         """
+        if self._cached_full_name is not None:
+            return self._cached_full_name
         if self.patronymic:
-            return f"{self.last_name} {self.first_name} {self.patronymic}"
+            self._cached_full_name = f"{self.last_name} {self.first_name} {self.patronymic}"
         else:
-            return f"{self.last_name} {self.first_name}"
+            self._cached_full_name = f"{self.last_name} {self.first_name}"
+        return self._cached_full_name
 
     # МЕТОДЫ ВЫВОДА И СРАВНЕНИЯ
 
@@ -113,25 +130,166 @@ class ShortClient:
                 self.patronymic == other.patronymic)
 
     def __hash__(self) -> int:
-        """Возвращает хеш-значение объекта."""
-        return hash((self.client_id, self.last_name, self.first_name, self.patronymic))
+        """Возвращает хеш-значение объекта (вычисляется один раз)."""
+        if self._cached_hash is not None:
+            return self._cached_hash
+        self._cached_hash = hash((self.client_id, self.last_name, self.first_name, self.patronymic))
+        return self._cached_hash
 
     # АЛЬТЕРНАТИВНЫЕ КОНСТРУКТОРЫ
 
     @classmethod
-    def from_full_name_string(cls, full_name_string: str, client_id: int = 1):
+    def from_full_name_string(cls, full_name_string: str, client_id: int = None):
         """
         Создает ShortClient из строки с полным именем.
+        Если client_id не передан, выдается новый ID (client_ids.default_allocator).
         """
         if not full_name_string or not isinstance(full_name_string, str):
             raise ValueError("Строка с ФИО не может быть пустой")
 
-        parts = full_name_string.strip().split()
+        last_name, first_name, patronymic = cls._split_full_name(full_name_string)
+        if client_id is None:
+            client_id = client_ids.default_allocator.allocate()
+        return cls(client_id, last_name, first_name, patronymic)
+
+    @classmethod
+    def parse_names(cls, lines, id_start: int = None, errors: list = None):
+        """
+        Потоково создает клиентов из строк "Фамилия Имя [Отчество]".
+        lines - итерируемый объект строк, открытый файл или путь к файлу.
+        ID назначаются подряд начиная с id_start, а без него выдаются
+        client_ids.default_allocator. Пустые строки пропускаются,
+        ошибочные не прерывают разбор: если передан список errors, в него
+        добавляются пары (номер строки, сообщение).
+        """
+        if id_start is None:
+            next_id = client_ids.default_allocator.allocate
+        else:
+            next_id = count(validation.positive_int("Начальный ID")(id_start)).__next__
+        from_validated = cls._from_validated
+        split = cls._split_full_name
+        rules = cls._field_rules
+
+        with client_io.open_source(lines) as source:
+            for line_number, line in enumerate(source, start=1):
+                parts = line.split()
+                if not parts:
+                    continue
+                if 2 <= len(parts) <= 3 and '-' not in line:
+                    # Частый случай: два-три слова без дефисов и частиц
+                    last_name, first_name = parts[0], parts[1]
+                    patronymic = parts[2] if len(parts) == 3 else None
+                    if len(last_name) < 2 or len(first_name) < 2:
+                        parts = None
+                else:
+                    parts = None
+                if parts is None:
+                    try:
+                        last_name, first_name, patronymic = split(line)
+                        last_name = rules["last_name"](last_name)
+                        first_name = rules["first_name"](first_name)
+                    except ValueError as e:
+                        if errors is not None:
+                            errors.append((line_number, str(e)))
+                        continue
+                yield from_validated(next_id(), last_name, first_name, patronymic)
+
+    @staticmethod
+    def _split_full_name(full_name_string: str) -> tuple:
+        """
+        Делит строку ФИО на (фамилия, имя, отчество или None).
+        Лишние пробелы игнорируются, дефис в составной фамилии может
+        окружаться пробелами ("Петров - Водкин"), частица после отчества
+        присоединяется к нему.
+        """
+        parts = full_name_string.split()
+        if '-' in full_name_string:
+            parts = " ".join(parts).replace(" -", "-").replace("- ", "-").split()
+        if len(parts) == 4 and parts[3].lower() in PATRONYMIC_PARTICLES:
+            parts[2:] = [f"{parts[2]} {parts[3]}"]
         if len(parts) < 2:
             raise ValueError("Строка должна содержать как минимум фамилию и имя")
+        if len(parts) > 3:
+            raise ValueError(f"Строка содержит лишние части: {' '.join(parts[3:])}")
+        return parts[0], parts[1], parts[2] if len(parts) > 2 else None
+
+    @classmethod
+    def _from_validated(cls, client_id: int, last_name: str, first_name: str,
+                        patronymic: str = None):
+        """
+        Создает объект из уже проверенных и очищенных значений.
+        Валидация не выполняется - только для доверенных источников.
+        """
+        short_client = cls.__new__(cls)
+        short_client._client_id = client_id
+        short_client._last_name = last_name
+        short_client._first_name = first_name
+        short_client._patronymic = patronymic
+        short_client._clear_cached()
+        return short_client
 
-        last_name = parts[0]
-        first_name = parts[1]
-        patronymic = parts[2] if len(parts) > 2 else None
+    @staticmethod
+    def from_client(client):
+        """
+        Создает ShortClient из Client (или другого ShortClient) без валидации.
+        Строки и уже вычисленные кеши (ФИО, инициалы, хеш) не копируются,
+        а используются совместно с исходным объектом.
+        """
+        if not isinstance(client, ShortClient):
+            raise ValueError("Преобразовать можно только объект ShortClient или Client")
+        short_client = _new_short_client(ShortClient)
+        short_client._client_id = client._client_id
+        short_client._last_name = client._last_name
+        short_client._first_name = client._first_name
+        short_client._patronymic = client._patronymic
+        # Кеши ShortClient и Client вычисляются по одним и тем же полям
+        short_client._cached_initials = client._cached_initials
+        short_client._cached_full_name = client._cached_full_name
+        short_client._cached_full_name_with_initials = client._cached_full_name_with_initials
+        short_client._cached_hash = client._cached_hash
+        return short_client
 
-        return cls(client_id, last_name, first_name, patronymic)
+
+_new_short_client = object.__new__
+
+
+class ShortClientProjection(Sequence):
+    """
+    Ленивое представление коллекции клиентов в виде ShortClient.
+    Хранит только ссылку на исходный список; ShortClient создается
+    при обращении к элементу, без валидации и копирования строк.
+    """
+
+    __slots__ = ('_clients',)
+
+    def __init__(self, clients):
+        """
+        Инициализирует представление над списком (или другой последовательностью) клиентов.
+        """
+        self._clients = clients if isinstance(clients, Sequence) else list(clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ShortClientProjection(self._clients[index])
+        return ShortClient.from_client(self._clients[index])
+
+    def __iter__(self):
+        return map(ShortClient.from_client, self._clients)
+
+    def to_list(self) -> list:
+        """Создает все ShortClient сразу и возвращает их списком."""
+        return list(map(ShortClient.from_client, self._clients))
+
+    def __repr__(self) -> str:
+        return f"ShortClientProjection({len(self._clients)} клиентов)"
+
+
+def project_short(clients) -> ShortClientProjection:
+    """
+    Возвращает ленивое представление клиентов в виде ShortClient.
+    Для готового списка используйте project_short(clients).to_list().
+    """
+    return ShortClientProjection(clients)
@@ -0,0 +1,55 @@
+from datetime import date
+
+from analytics import ClientSnapshot
+from client import Client
+
+
+def make_snapshot() -> ClientSnapshot:
+    clients = [
+        Client(1, "Иванов", "Иван", "Иванович", "+79161234567", registration_date="2024-01-15"),
+        Client(2, "Петров", "Петр", email="petrov@mail.ru", registration_date="2024-01-20"),
+        Client(3, "Сидоров", "Алексей", phone="+79160000000", email="s@mail.ru",
+               registration_date="2024-02-01"),
+        Client(4, "Смирнов", "Олег")
+    ]
+    return ClientSnapshot.from_clients(clients, branches={1: 1, 2: 2, 3: 1})
+
+
+def test_group_counts():
+    """Тест группировок по месяцам и филиалам."""
+    print("🧪 Тестирование колоночных отчетов:")
+
+    snapshot = make_snapshot()
+    print(f"✅ По месяцам: {snapshot.count_by_month()}")
+    print(f"✅ По месяцам и филиалам: {snapshot.count_by_month_and_branch()}")
+    assert len(snapshot) == 4
+    assert snapshot.count_by_month() == {"2024-01": 2, "2024-02": 1}
+    assert snapshot.count_by_month(where="email") == {"2024-01": 1, "2024-02": 1}
+    assert snapshot.count_by_branch() == {1: 2, 2: 1}
+    assert snapshot.count_by_month_and_branch() == {
+        ("2024-01", 1): 1, ("2024-01", 2): 1, ("2024-02", 1): 1}
+
+
+def test_shares_and_ranges():
+    """Тест долей и диапазонов дат."""
+    print("\n🧪 Тестирование долей и диапазонов:")
+
+    snapshot = make_snapshot()
+    print(f"✅ Доля с email: {snapshot.share('email'):.0%}")
+    assert snapshot.share("email") == 0.5
+    assert snapshot.share("patronymic") == 0.25
+    assert snapshot.registered_between(date(2024, 1, 16), date(2024, 2, 1)) == 2
+    try:
+        snapshot.share("address")
+    except ValueError as e:
+        print(f"✅ Ошибка: {e}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+
+if __name__ == "__main__":
+    print("🚀 Аналитика по клиентам")
+    print("=" * 60)
+    test_group_counts()
+    test_shares_and_ranges()
+    print("=" * 60)
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+
+from async_store import AsyncClientStore
+from client import Client
+
+
+async def run_store_round_trip(path: str):
+    async with AsyncClientStore(path, readers=2) as store:
+        clients = [Client(client_id, "Иванов", "Иван", phone=f"+7916000000{client_id}")
+                   for client_id in range(1, 6)]
+        await asyncio.gather(*(store.save(client) for client in clients))
+        await store.save(Client(1, "Петров", "Петр", email="petrov@mail.ru",
+                                registration_date="2024-01-15"))
+
+        print(f"✅ Клиентов в базе: {await store.count()}")
+        assert await store.count() == 5
+        assert await store.get(1) == Client(1, "Петров", "Петр", email="petrov@mail.ru",
+                                            registration_date="2024-01-15")
+        assert await store.delete(2) is True
+        assert await store.delete(2) is False
+        assert await store.get(2) is None
+        assert sorted(await store.get_many([1, 2, 3, 100])) == [1, 3]
+
+    async with AsyncClientStore(path) as store:
+        print(f"✅ После переоткрытия: {await store.get(3)!r}")
+        assert (await store.get(3)).phone == "+79160000003"
+
+
+async def run_failed_operation_in_batch(path: str):
+    async with AsyncClientStore(path) as store:
+        clients = [Client(client_id, "Иванов", "Иван") for client_id in range(1, 6)]
+        # Список вместо ID нельзя передать в SQLite - ошибка только у этой операции
+        results = await asyncio.gather(*(store.save(client) for client in clients[:3]),
+                                       store.delete([1]),
+                                       *(store.save(client) for client in clients[3:]),
+                                       return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert len(errors) == 1 and results[3] is errors[0]
+        assert await store.count() == 5
+        print(f"✅ Ошибка одной операции: {type(errors[0]).__name__}, сохранено {await store.count()}")
+
+
+async def run_write_during_close(path: str):
+    store = await AsyncClientStore(path).open()
+    saving = asyncio.create_task(store.save(Client(1, "Иванов", "Иван")))
+    await asyncio.sleep(0)
+    closing = asyncio.create_task(store.close())
+    await asyncio.sleep(0)
+    try:
+        await asyncio.wait_for(store.save(Client(2, "Петров", "Петр")), timeout=5)
+    except ValueError as error:
+        print(f"✅ Запись во время закрытия: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+    await saving
+    await closing
+
+    async with AsyncClientStore(path) as store:
+        assert await store.count() == 1
+
+
+class FailingCommitConnection:
+    """Обертка соединения, у которой первый COMMIT завершается ошибкой."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.failed = False
+
+    def execute(self, query: str, *args):
+        if query == "COMMIT" and not self.failed:
+            self.failed = True
+            raise sqlite3.OperationalError("database is locked")
+        return self._connection.execute(query, *args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._connection, name)
+
+
+class FailingCommitStore(AsyncClientStore):
+    def _connect(self):
+        return FailingCommitConnection(super()._connect())
+
+
+async def run_failed_commit(path: str):
+    async with FailingCommitStore(path) as store:
+        try:
+            await store.save(Client(1, "Иванов", "Иван"))
+        except sqlite3.OperationalError as error:
+            print(f"✅ Ошибка COMMIT: {error}")
+        else:
+            assert False, "Ожидалась ошибка OperationalError"
+        await store.save(Client(2, "Петров", "Петр"))
+        assert await store.count() == 1
+        print("✅ Следующая транзакция записана")
+
+
+def test_store_round_trip():
+    """Тест сохранения и чтения клиентов через AsyncClientStore."""
+    print("🧪 Тестирование AsyncClientStore:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_store_round_trip(os.path.join(directory, "clients.db")))
+
+
+def test_failed_operation_does_not_fail_batch():
+    """Тест: ошибочная операция не проваливает остальные операции пачки."""
+    print("\n🧪 Тестирование ошибки внутри group commit:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_failed_operation_in_batch(os.path.join(directory, "clients.db")))
+
+
+def test_write_during_close_is_rejected():
+    """Тест: запись, начатая во время закрытия, не зависает."""
+    print("\n🧪 Тестирование записи во время закрытия:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_write_during_close(os.path.join(directory, "clients.db")))
+
+
+def test_failed_commit_is_rolled_back():
+    """Тест: после ошибки COMMIT транзакция откатывается и запись продолжается."""
+    print("\n🧪 Тестирование ошибки COMMIT:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run_failed_commit(os.path.join(directory, "clients.db")))
+
+
+if __name__ == "__main__":
+    print("🚀 Асинхронное хранилище клиентов")
+    print("=" * 60)
+    test_store_round_trip()
+    test_failed_operation_does_not_fail_batch()
+    test_write_during_close_is_rejected()
+    test_failed_commit_is_rolled_back()
+    print("=" * 60)
@@ -0,0 +1,153 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+import barbershop
+from client import Client
+
+CLIENTS = [
+    Client(1, "Иванов", "Иван", "Иванович", "+79161234567", "ivanov@mail.ru", "2024-01-15"),
+    Client(2, "Петрова", "Анна", phone="+79161234568", registration_date="2024-02-01"),
+    Client(3, "ИВАНОВ", "Иван", "Иванович", "8 (916) 123-45-67"),
+]
+
+
+def run(*argv) -> tuple:
+    """Запускает CLI и возвращает (код завершения, stdout, ошибки из stderr)."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        code = barbershop.main(list(argv))
+    errors = [json.loads(line) for line in stderr.getvalue().splitlines()]
+    return code, stdout.getvalue(), errors
+
+
+def test_convert_and_validate():
+    """Тест преобразования форматов и проверки записей."""
+    print("🧪 Тестирование convert и validate:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "clients.jsonl")
+        Client.dump_many(CLIENTS, source)
+        with open(source, "a", encoding="utf-8") as file:
+            file.write('{"client_id": 4, "last_name": "Козлов"}\n')
+
+        code, output, errors = run("validate", source)
+        assert code == barbershop.EXIT_INVALID_DATA
+        assert json.loads(output) == {"valid": 3, "invalid": 1}
+        assert errors[0]["error"] == "invalid_record" and errors[0]["line"] == 4
+        print(f"✅ validate: {output.strip()}, ошибка: {errors[0]}")
+
+        csv_path = os.path.join(directory, "clients.csv")
+        json_path = os.path.join(directory, "clients.json")
+        assert run("convert", source, csv_path)[0] == barbershop.EXIT_INVALID_DATA
+        assert run("convert", csv_path, json_path)[0] == barbershop.EXIT_OK
+        clients, load_errors = Client.load_many(json_path, format="json")
+        assert clients == CLIENTS and not load_errors
+        print("✅ JSONL → CSV → JSON без потерь")
+
+
+def test_dedupe_search_stats():
+    """Тест поиска дубликатов, поиска по ФИО и статистики."""
+    print("\n🧪 Тестирование dedupe, search и stats:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "clients.jsonl")
+        Client.dump_many(CLIENTS, source)
+
+        code, output, _ = run("dedupe", source)
+        assert code == barbershop.EXIT_OK
+        assert [json.loads(line)["client_id"] for line in output.splitlines()] == [1, 2]
+        code, output, _ = run("dedupe", source, "--clusters")
+        assert json.loads(output)["client_ids"] == [1, 3]
+        print(f"✅ dedupe: {output.strip()}")
+
+        code, output, _ = run("search", source, "петр ан")
+        assert [json.loads(line)["client_id"] for line in output.splitlines()] == [2]
+        print(f"✅ search: {output.strip()}")
+
+        code, output, _ = run("stats", source)
+        report = json.loads(output)
+        assert report["clients"] == 3 and report["by_month"] == {"2024-01": 1, "2024-02": 1}
+        print(f"✅ stats: {report}")
+
+
+def test_search_streams_large_input():
+    """Тест: search на большой выгрузке ранжирует так же, как NameSearchIndex."""
+    print("\n🧪 Тестирование search на большой выгрузке:")
+
+    from name_search import NameSearchIndex
+
+    last_names = ["Иванов", "Петров", "Смирнов", "Кузнецов", "Римский-Корсаков", "Ивашов"]
+    first_names = ["Иван", "Петр", "Олег", "Илья"]
+    patronymics = [None, "Иванович", "Олегович"]
+    clients = [Client(client_id, last_names[client_id % 6], first_names[client_id // 6 % 4],
+                      patronymics[client_id // 24 % 3])
+               for client_id in range(1, 20_001)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "clients.jsonl")
+        Client.dump_many(clients, source)
+
+        index = NameSearchIndex(clients)
+        for query in ("Ива", "Иванов Ив", "Смирнв", "корс Олег", "Иван Иванович"):
+            code, output, _ = run("search", source, query, "--limit", "25")
+            found = [json.loads(line)["client_id"] for line in output.splitlines()]
+            assert code == barbershop.EXIT_OK
+            assert found == [client.client_id for client in index.search(query, limit=25)], query
+            print(f"✅ {query!r}: {found[:5]}...")
+
+
+def test_errors():
+    """Тест кодов завершения и сообщений об ошибках."""
+    print("\n🧪 Тестирование ошибок CLI:")
+
+    code, _, errors = run("validate", "нет-такого-файла.jsonl")
+    assert code == barbershop.EXIT_IO and errors[0]["error"] == "io"
+    code, _, errors = run("validate", "clients.txt")
+    assert code == barbershop.EXIT_USAGE and errors[0]["error"] == "usage"
+    code, _, errors = run("frobnicate")
+    assert code == barbershop.EXIT_USAGE
+    print(f"✅ Ошибки: {errors}")
+
+    def broken_stats(args):
+        raise RuntimeError("сбой")
+
+    original, barbershop.command_stats = barbershop.command_stats, broken_stats
+    try:
+        code, _, errors = run("stats", "clients.csv")
+    finally:
+        barbershop.command_stats = original
+    assert code == barbershop.EXIT_INTERNAL
+    assert errors == [{"error": "internal", "message": "RuntimeError: сбой"}]
+    print(f"✅ Внутренняя ошибка: {errors[0]}")
+
+
+def test_csv_line_endings():
+    """Тест: CSV с переводами строк Windows читается без потерь."""
+    print("\n🧪 Тестирование CSV с CRLF:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "clients.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as file:
+            file.write("client_id,last_name,first_name,patronymic,phone,email,registration_date\r\n"
+                       '1,"Иванов",Иван,,+79161234567,,2024-01-15\r\n'
+                       "2,Петрова,Анна,,,,\r\n")
+        errors = []
+        clients = list(barbershop.read_clients(csv_path, "csv", errors))
+        assert not errors
+        assert clients == [Client(1, "Иванов", "Иван", phone="+79161234567", registration_date="2024-01-15"),
+                           Client(2, "Петрова", "Анна")]
+        print(f"✅ Прочитано {len(clients)} клиентов")
+
+
+if __name__ == "__main__":
+    print("🚀 Командная строка barbershop")
+    print("=" * 60)
+    test_convert_and_validate()
+    test_dedupe_search_stats()
+    test_search_streams_large_input()
+    test_errors()
+    test_csv_line_endings()
+    print("=" * 60)
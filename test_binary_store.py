@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+
+from binary_store import BinaryClientFile, binary_to_json, json_to_binary, write_binary
+from client import Client
+
+
+CLIENTS = [
+    Client(5, "Иванов", "Иван", "Иванович", "+79161234567", "ivanov@mail.ru", "2024-01-15"),
+    Client(2, "Иванова", "Мария", email="мария@почта.рф"),
+    Client(9, "Петров", "Иван")
+]
+
+
+def test_binary_round_trip():
+    """Тест записи и чтения двоичного файла."""
+    print("🧪 Тестирование двоичного формата:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.bin")
+        write_binary(CLIENTS, path)
+        print(f"✅ Размер файла: {os.path.getsize(path)} байт")
+
+        with BinaryClientFile(path) as binary:
+            assert len(binary) == 3
+            assert binary.get(5) == CLIENTS[0]
+            assert binary.get(2).email == "мария@почта.рф"
+            assert binary.get(3) is None
+            assert [client.client_id for client in binary] == [2, 5, 9]
+            assert binary[-1] == CLIENTS[2]
+
+
+def test_converters():
+    """Тест конвертации JSONL <-> двоичный формат."""
+    print("\n🧪 Тестирование конвертеров:")
+
+    source = io.StringIO()
+    Client.dump_many(CLIENTS, source)
+    source.seek(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.bin")
+        count, errors = json_to_binary(source, path)
+        target = io.StringIO()
+        binary_to_json(path, target)
+        print(f"✅ Конвертировано клиентов: {count}")
+        loaded, _ = Client.load_many(io.StringIO(target.getvalue()))
+        assert count == 3 and not errors
+        assert loaded == sorted(CLIENTS, key=lambda client: client.client_id)
+
+
+def test_invalid_file():
+    """Тест ошибок двоичного формата."""
+    print("\n🧪 Тестирование ошибок двоичного формата:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.bin")
+        with open(path, "wb") as file:
+            file.write(b"not a clients file at all")
+        try:
+            BinaryClientFile(path)
+        except ValueError as e:
+            print(f"✅ Ошибка: {e}")
+        else:
+            assert False, "Ожидалась ошибка ValueError"
+
+        # Обрезанный файл: заголовок (32 байта) цел, от индекса осталась одна запись (80 байт)
+        write_binary(CLIENTS, path)
+        with open(path, "r+b") as file:
+            file.truncate(32 + 80)
+        try:
+            BinaryClientFile(path)
+        except ValueError as e:
+            print(f"✅ Обрезанный файл: {e}")
+            assert str(e) == "Файл клиентов поврежден"
+        else:
+            assert False, "Ожидалась ошибка ValueError"
+
+        try:
+            write_binary([CLIENTS[0], CLIENTS[0]], path)
+        except ValueError as e:
+            print(f"✅ Ошибка: {e}")
+        else:
+            assert False, "Ожидалась ошибка ValueError"
+
+
+if __name__ == "__main__":
+    print("🚀 Двоичный формат клиентов")
+    print("=" * 60)
+    test_binary_round_trip()
+    test_converters()
+    test_invalid_file()
+    print("=" * 60)
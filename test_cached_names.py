@@ -0,0 +1,33 @@
+from client import Client
+from short_client import ShortClient
+
+
+def test_cached_names():
+    """Тест кеширования производных строк."""
+    print("🧪 Тестирование кеширования имен:")
+
+    client = Client(1, "Иванов", "Иван", "Иванович")
+    first = client.get_full_name()
+    print(f"✅ {first} / {client} / {client.short_info()}")
+    assert client.get_full_name() is first
+    assert str(client) is str(client)
+    assert client.short_info() == "Иванов Иван Иванович (ID: 1)"
+    assert ShortClient(2, "Петров", "Петр").get_initials() == "П."
+
+
+def test_client_hash():
+    """Тест хеширования Client и ShortClient."""
+    print("\n🧪 Тестирование хеширования:")
+
+    clients = {Client(1, "Иванов", "Иван"), Client(1, "Иванов", "Иван"), Client(2, "Петров", "Петр")}
+    print(f"✅ Множество клиентов: {len(clients)} элемента")
+    assert len(clients) == 2
+    assert hash(Client(1, "Иванов", "Иван")) == hash(ShortClient(1, "Иванов", "Иван"))
+
+
+if __name__ == "__main__":
+    print("🚀 Кеширование производных значений")
+    print("=" * 60)
+    test_cached_names()
+    test_client_hash()
+    print("=" * 60)
@@ -0,0 +1,139 @@
+import threading
+import time
+
+from client import Client
+from client_cache import ClientCache, client_size
+
+
+class FakeClock:
+    """Управляемые часы для проверки TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_backend(count: int = 10):
+    records = {client_id: Client(client_id, "Иванов", "Иван", phone=f"+7916000{client_id:04d}").to_dict()
+               for client_id in range(1, count + 1)}
+    loads = []
+
+    def load(client_id):
+        loads.append(client_id)
+        return records.get(client_id)
+
+    def save(client):
+        records[client.client_id] = client.to_dict()
+
+    return records, loads, load, save
+
+
+def test_read_through_and_lru():
+    """Тест сквозного чтения, вытеснения и статистики."""
+    print("🧪 Тестирование ClientCache:")
+
+    records, loads, load, save = make_backend()
+    cache = ClientCache(load, save, max_entries=3)
+
+    first = cache.get(1)
+    assert isinstance(first, Client) and first.phone == "+79160000001"
+    assert cache.get(1) is first
+    assert cache.get(100) is None
+    assert 100 not in cache
+    for client_id in (2, 3, 1, 4):
+        cache.get(client_id)
+    # Самый давно использованный (2) вытеснен, 1 был прочитан недавно
+    assert 2 not in cache and 1 in cache and len(cache) == 3
+    assert loads == [1, 100, 2, 3, 4]
+
+    stats = cache.stats()
+    print(f"✅ Статистика: {stats}")
+    assert stats["hits"] == 2 and stats["misses"] == 5 and stats["evictions"] == 1
+    assert abs(stats["hit_ratio"] - 2 / 7) < 1e-9
+
+
+def test_update_and_invalidate():
+    """Тест обновления клиента и сброса записи."""
+    print("\n🧪 Тестирование update и invalidate:")
+
+    records, loads, load, save = make_backend()
+    cache = ClientCache(load, save)
+    cache.get(1)
+    cache.update(Client(1, "Петров", "Петр"))
+    assert records[1]["last_name"] == "Петров"
+    assert cache.get(1).last_name == "Петров"
+    assert loads == [1]
+
+    records[1]["last_name"] = "Сидоров"
+    assert cache.invalidate(1) is True
+    assert cache.invalidate(1) is False
+    assert cache.get(1).last_name == "Сидоров"
+    print(f"✅ После сброса загружено заново: {cache.get(1)!r}")
+
+
+def test_ttl_and_memory_budget():
+    """Тест устаревания записей и бюджета памяти."""
+    print("\n🧪 Тестирование TTL и бюджета памяти:")
+
+    records, loads, load, save = make_backend()
+    clock = FakeClock()
+    cache = ClientCache(load, ttl=60, clock=clock)
+    cache.get(1)
+    clock.now = 59
+    cache.get(1)
+    clock.now = 61
+    cache.get(1)
+    assert loads == [1, 1] and cache.stats()["expirations"] == 1
+
+    budget = client_size(Client.from_dict(records[1])) * 2
+    cache = ClientCache(load, max_bytes=budget)
+    for client_id in range(1, 6):
+        cache.get(client_id)
+    assert len(cache) == 2 and cache.nbytes <= budget
+    print(f"✅ В бюджете {budget} байт: {len(cache)} клиента, {cache.nbytes} байт")
+
+
+def test_single_load_on_concurrent_miss():
+    """Тест: одновременные промахи по одному ID загружают клиента один раз."""
+    print("\n🧪 Тестирование защиты от одновременных загрузок:")
+
+    records, loads, load, save = make_backend()
+    started = threading.Event()
+
+    def slow_load(client_id):
+        started.set()
+        time.sleep(0.05)
+        return load(client_id)
+
+    cache = ClientCache(slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(7))) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [7]
+    assert len(results) == 20 and all(client is results[0] for client in results)
+    print(f"✅ 20 потоков, загрузок: {len(loads)}, ожиданий: {cache.stats()['coalesced']}")
+
+    failing = ClientCache(lambda client_id: {"client_id": client_id, "last_name": "И"})
+    try:
+        failing.get(1)
+    except ValueError as error:
+        print(f"✅ Ошибка загрузки: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+    assert failing.stats()["load_failures"] == 1 and 1 not in failing
+
+
+if __name__ == "__main__":
+    print("🚀 Кеш клиентов")
+    print("=" * 60)
+    test_read_through_and_lru()
+    test_update_and_invalidate()
+    test_ttl_and_memory_budget()
+    test_single_load_on_concurrent_miss()
+    print("=" * 60)
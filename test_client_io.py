@@ -0,0 +1,120 @@
+import io
+import json
+import os
+import tempfile
+
+from client import Client
+
+
+JSONL = """{"client_id": 1, "last_name": "Иванов", "first_name": "Иван", "phone": "+79161234567"}
+{"client_id": 2, "last_name": "П", "first_name": "Петр"}
+
+не json
+[1, 2]
+{"client_id": 3, "last_name": "Сидоров", "first_name": "Алексей", "email": "sidorov@mail.ru"}
+"""
+
+
+def test_load_many_collects_errors():
+    """Тест загрузки JSONL со сбором ошибок."""
+    print("🧪 Тестирование Client.load_many:")
+
+    clients, errors = Client.load_many(io.StringIO(JSONL), batch_size=2)
+    print(f"✅ Загружено клиентов: {len(clients)}")
+    for line_number, message in errors:
+        print(f"   ❌ Строка {line_number}: {message}")
+
+    assert [client.client_id for client in clients] == [1, 3]
+    assert [line_number for line_number, _ in errors] == [2, 4, 5]
+
+
+def test_misaligned_lines_are_rejected():
+    """Тест: строки, которые склеиваются в массив со сдвигом, считаются ошибочными."""
+    print("\n🧪 Тестирование строк, которые не являются отдельными объектами:")
+
+    source = ('{"client_id": 1, "last_name": "Иванов", "first_name": "Иван"}, '
+              '{"client_id": 2, "last_name": "Петров", "first_name": "Петр"}\n'
+              '{"client_id": 3, "last_name": "Сидоров"\n'
+              '"first_name": "Иван"}\n')
+    clients, errors = Client.load_many(io.StringIO(source))
+    print(f"✅ Клиенты: {clients}, ошибки: {errors}")
+    assert clients == []
+    assert [line_number for line_number, _ in errors] == [1, 2, 3]
+
+
+def test_invalid_utf8_line_is_an_error():
+    """Тест: строка с неверной кодировкой - ошибка этой строки, а не всего файла."""
+    print("\n🧪 Тестирование строки не в UTF-8:")
+
+    source = ('{"client_id": 1, "last_name": "Иванов", "first_name": "Иван"}\n'.encode('utf-8')
+              + b'{"client_id": 2, "last_name": "\xff\xfeab", "first_name": "Petr"}\n'
+              + '{"client_id": 3, "last_name": "Сидоров", "first_name": "Алексей"}\n'.encode('utf-8'))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.jsonl")
+        with open(path, "wb") as file:
+            file.write(source)
+        for input_source in (path, io.BytesIO(source)):
+            clients, errors = Client.load_many(input_source)
+            assert [client.client_id for client in clients] == [1, 3]
+            assert [line_number for line_number, _ in errors] == [2]
+        print(f"✅ Ошибка: {errors[0]}")
+
+
+def test_iter_from_jsonl_strict():
+    """Тест остановки на первой ошибке без списка errors."""
+    print("\n🧪 Тестирование Client.iter_from_jsonl без списка ошибок:")
+
+    loaded = []
+    try:
+        for client in Client.iter_from_jsonl(io.StringIO(JSONL)):
+            loaded.append(client)
+    except ValueError as e:
+        print(f"✅ Ошибка: {e}")
+    assert [client.client_id for client in loaded] == [1]
+
+
+def test_load_many_trusted_and_json():
+    """Тест доверенной загрузки и формата JSON."""
+    print("\n🧪 Тестирование trusted=True и format='json':")
+
+    source = '[{"client_id": 1, "last_name": "Иванов", "first_name": "Иван"}, {"client_id": 2}]'
+    clients, errors = Client.load_many(io.StringIO(source), trusted=True, format="json")
+    print(f"✅ Клиенты: {clients}, ошибки: {errors}")
+    assert clients == [Client(1, "Иванов", "Иван")]
+    assert errors == [(2, "Отсутствует обязательное поле: last_name")]
+
+
+def test_dump_many_round_trip():
+    """Тест компактной записи клиентов."""
+    print("\n🧪 Тестирование Client.dump_many:")
+
+    clients = [
+        Client(1, "Иванов", "Иван", "Иванович", "+79161234567", "ivanov@mail.ru", "2024-01-15"),
+        Client(2, 'О"Нил', "Петр\tПетрович")
+    ]
+    for client in clients:
+        expected = json.dumps(client.to_dict(), ensure_ascii=False, separators=(',', ':'))
+        assert client._to_compact_json() == expected
+
+    for format in ("jsonl", "json"):
+        buffer = io.StringIO()
+        count = Client.dump_many(clients, buffer, format=format, chunk_size=1)
+        print(f"✅ {format}: записано {count}, {len(buffer.getvalue())} символов")
+        loaded, errors = Client.load_many(io.StringIO(buffer.getvalue()), format=format)
+        assert loaded == clients and not errors
+
+    buffer = io.StringIO()
+    Client.dump_many([], buffer, format="json")
+    assert json.loads(buffer.getvalue()) == []
+
+
+if __name__ == "__main__":
+    print("🚀 Массовая загрузка клиентов")
+    print("=" * 60)
+    test_load_many_collects_errors()
+    test_misaligned_lines_are_rejected()
+    test_invalid_utf8_line_is_an_error()
+    test_iter_from_jsonl_strict()
+    test_load_many_trusted_and_json()
+    test_dump_many_round_trip()
+    print("=" * 60)
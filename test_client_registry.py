@@ -0,0 +1,137 @@
+import threading
+
+from client import Client
+from client_ids import IdAllocator
+from client_registry import ClientRegistry
+from short_client import ShortClient
+
+
+def run_threads(target, count: int):
+    threads = [threading.Thread(target=target, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_registry_operations():
+    """Тест основных операций реестра."""
+    print("🧪 Тестирование ClientRegistry:")
+
+    registry = ClientRegistry(shards=5, allocator=IdAllocator())
+    ivanov = registry.register("Иванов", "Иван", phone="+79161234567")
+    petrov = registry.register("Петров", "Петр")
+    assert (ivanov.client_id, petrov.client_id) == (1, 2)
+    assert registry.get(1) is ivanov and 3 not in registry
+
+    registry.add(Client(10, "Сидоров", "Алексей"))
+    assert registry.register("Козлов", "Олег").client_id == 11
+    try:
+        registry.add(Client(10, "Сидоров", "Алексей"))
+    except ValueError as error:
+        print(f"✅ Повторный ID: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+    renamed = Client(1, "Иванов", "Иван", email="ivanov@mail.ru")
+    assert registry.update(renamed, expected=ivanov) is ivanov
+    try:
+        registry.update(Client(1, "Иванов", "Иван"), expected=ivanov)
+    except ValueError as error:
+        print(f"✅ Устаревший снимок: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+    assert registry.remove(2) is petrov
+    assert len(registry) == 3
+    assert sorted(client.client_id for client in registry.snapshot()) == [1, 10, 11]
+    print(f"✅ Клиентов в реестре: {len(registry)}")
+
+
+def test_register_does_not_overwrite_added_client():
+    """Тест: register не перезаписывает клиента, добавленного через add с тем же ID."""
+    print("\n🧪 Тестирование гонки register и add:")
+
+    class LateReserveAllocator(IdAllocator):
+        """Счетчик, до которого reserve еще не дошел (как в гонке потоков)."""
+
+        def reserve(self, client_id: int):
+            pass
+
+    registry = ClientRegistry(allocator=LateReserveAllocator())
+    added = Client(1, "Сидоров", "Алексей")
+    registry.add(added)
+    registered = registry.register("Иванов", "Иван")
+    assert registry.get(1) is added
+    assert registered.client_id == 2 and registry.get(2) is registered
+    print(f"✅ Занятый ID пропущен: {registered!r}")
+
+
+def test_default_ids_are_unique():
+    """Тест: конструкторы без client_id не выдают повторяющиеся ID."""
+    print("\n🧪 Тестирование выдачи ID по умолчанию:")
+
+    first = Client.from_name_and_phone("Иванов", "Иван", "+79161234567")
+    second = Client.from_name_and_phone("Петров", "Петр", "+79161234568")
+    third = ShortClient.from_full_name_string("Сидоров Алексей")
+    parsed = list(ShortClient.parse_names(["Козлов Олег", "Орлова Анна"]))
+    fourth = Client.from_name_and_phone("Павлов", "Павел", "+79161234569")
+    all_ids = [first.client_id, second.client_id, third.client_id,
+               parsed[0].client_id, parsed[1].client_id, fourth.client_id]
+    assert all_ids == sorted(set(all_ids))
+    print(f"✅ ID: {all_ids}")
+
+
+def test_concurrent_stress():
+    """Нагрузочный тест: параллельная регистрация, чтение, изменение и удаление."""
+    print("\n🧪 Нагрузочное тестирование ClientRegistry:")
+
+    registry = ClientRegistry(shards=8, allocator=IdAllocator())
+    per_thread = 500
+    registered = [[] for _ in range(8)]
+    failures = []
+
+    def worker(number: int):
+        try:
+            for step in range(per_thread):
+                client = registry.register("Иванов", "Иван", phone=f"+7916{number:02d}{step:05d}")
+                registered[number].append(client.client_id)
+                assert registry.get(client.client_id) is client
+                if step % 5 == 0:
+                    registry.update(Client(client.client_id, "Петров", "Петр"), expected=client)
+                if step % 10 == 0:
+                    registry.remove(client.client_id)
+        except Exception as error:
+            failures.append(error)
+
+    run_threads(worker, 8)
+    assert not failures, failures
+
+    all_ids = [client_id for ids in registered for client_id in ids]
+    assert len(set(all_ids)) == len(all_ids) == 8 * per_thread
+    assert len(registry) == 8 * per_thread * 9 // 10
+    print(f"✅ {len(all_ids)} уникальных ID, в реестре {len(registry)}")
+
+    # Одновременное добавление одного ID: успешно ровно одно
+    added = []
+
+    def add_same(number: int):
+        try:
+            registry.add(Client(100_000, "Козлов", "Олег"))
+            added.append(number)
+        except ValueError:
+            pass
+
+    run_threads(add_same, 8)
+    assert len(added) == 1
+    print("✅ Один и тот же ID добавлен ровно один раз")
+
+
+if __name__ == "__main__":
+    print("🚀 Потокобезопасный реестр клиентов")
+    print("=" * 60)
+    test_registry_operations()
+    test_register_does_not_overwrite_added_client()
+    test_default_ids_are_unique()
+    test_concurrent_stress()
+    print("=" * 60)
@@ -0,0 +1,120 @@
+import io
+import json
+
+from client import Client
+from client_repository import ClientRepository
+
+
+def make_repository() -> ClientRepository:
+    return ClientRepository([
+        Client(1, "Иванов", "Иван", phone="+7 (916) 123-45-67", email="Ivanov@Mail.ru"),
+        Client(2, "Иванова", "Мария", phone="89161112233"),
+        Client(3, "Петров", "Петр", email="petrov@mail.ru")
+    ])
+
+
+def test_lookups():
+    """Тест поиска по индексам."""
+    print("🧪 Тестирование поиска в ClientRepository:")
+
+    repository = make_repository()
+    print(f"✅ По телефону: {repository.find_by_phone('8 916 123 45 67')}")
+    print(f"✅ По email: {repository.find_by_email('IVANOV@mail.ru')}")
+    print(f"✅ По префиксу 'ива': {repository.search_last_name('ива')}")
+
+    assert repository.get(2).first_name == "Мария"
+    assert repository.find_by_phone('8 916 123 45 67').client_id == 1
+    assert repository.find_by_phone('+79161112233').client_id == 2
+    assert repository.find_by_email('IVANOV@mail.ru').client_id == 1
+    assert [client.client_id for client in repository.search_last_name('Ива')] == [1, 2]
+    assert len(repository.search_last_name('ива', limit=1)) == 1
+
+
+def test_uniqueness():
+    """Тест уникальности ID, телефона и email."""
+    print("\n🧪 Тестирование уникальности:")
+
+    repository = make_repository()
+    for client in (Client(1, "Сидоров", "Алексей"),
+                   Client(4, "Сидоров", "Алексей", phone="+79161234567"),
+                   Client(4, "Сидоров", "Алексей", email="PETROV@mail.ru")):
+        try:
+            repository.add(client)
+        except ValueError as e:
+            print(f"✅ Ошибка: {e}")
+        else:
+            assert False, "Ожидалась ошибка ValueError"
+    assert len(repository) == 3
+
+
+def test_update_and_remove():
+    """Тест согласованности индексов при изменении."""
+    print("\n🧪 Тестирование обновления и удаления:")
+
+    repository = make_repository()
+    repository.update(Client(1, "Смирнов", "Иван", phone="+79990000000"))
+    assert repository.find_by_phone("+79161234567") is None
+    assert repository.find_by_email("ivanov@mail.ru") is None
+    assert repository.find_by_phone("89990000000").last_name == "Смирнов"
+    assert [client.client_id for client in repository.search_last_name('Ива')] == [2]
+
+    removed = repository.remove(2)
+    print(f"✅ Удален: {removed}")
+    assert 2 not in repository
+    assert repository.find_by_phone("89161112233") is None
+    assert repository.search_last_name('Ива') == []
+
+    # Изменение без смены фамилии и вставки вперемешку с поиском
+    repository.update(Client(1, "Смирнов", "Иван", email="smirnov@mail.ru"))
+    assert repository.search_last_name('Смир')[0].email == "smirnov@mail.ru"
+    repository.add(Client(10, "Абрамов", "Петр"))
+    assert [client.client_id for client in repository.search_last_name('А')] == [10]
+    repository.add(Client(5, "Смирнов", "Олег"))
+    assert [client.client_id for client in repository.search_last_name('смирнов')] == [1, 5]
+
+
+def test_export_changes():
+    """Тест выгрузки изменений по курсору."""
+    print("\n🧪 Тестирование журнала изменений:")
+
+    repository = make_repository()
+    cursor = repository.export_changes(io.StringIO())
+    assert cursor == 3
+
+    repository.update(Client(1, "Иванов", "Иван", phone="+79161234567", email="new@mail.ru"))
+    repository.update(Client(1, "Иванов", "Иван", phone="+79161234567", email="new@mail.ru"))
+    repository.remove(2)
+    repository.add(Client(4, "Сидоров", "Алексей"))
+    repository.add(Client(5, "Временный", "Клиент"))
+    repository.remove(5)
+
+    buffer = io.StringIO()
+    next_cursor = repository.export_changes(buffer, since=cursor)
+    changes = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    for change in changes:
+        print(f"✅ {change['op']}: {change['client_id']} {change['fields']}")
+
+    assert next_cursor == 8
+    assert [(change["op"], change["client_id"]) for change in changes] == [
+        ("update", 1), ("delete", 2), ("insert", 4)]
+    assert changes[0]["fields"] == ["phone", "email"]
+    assert changes[0]["client"]["email"] == "new@mail.ru"
+
+    repository.discard_changes(next_cursor)
+    assert repository.changes(next_cursor) == []
+    try:
+        repository.changes(cursor)
+    except ValueError as e:
+        print(f"✅ Ошибка: {e}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+
+if __name__ == "__main__":
+    print("🚀 Хранилище клиентов с индексами")
+    print("=" * 60)
+    test_lookups()
+    test_uniqueness()
+    test_update_and_remove()
+    test_export_changes()
+    print("=" * 60)
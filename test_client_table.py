@@ -0,0 +1,52 @@
+from client import Client
+from client_table import ClientTable
+
+
+def test_slots():
+    """Тест отсутствия __dict__ у клиентов."""
+    print("🧪 Тестирование __slots__:")
+
+    client = Client(1, "Иванов", "Иван", "Иванович", "+79161234567")
+    print(f"✅ У Client нет __dict__: {not hasattr(client, '__dict__')}")
+    assert not hasattr(client, '__dict__')
+
+
+def test_table_round_trip():
+    """Тест хранения клиентов в ClientTable."""
+    print("\n🧪 Тестирование ClientTable:")
+
+    clients = [
+        Client(1, "Иванов", "Иван", "Иванович", "+79161234567", "ivanov@mail.ru", "2024-01-15"),
+        Client(2, "Петров", "Петр"),
+        Client(3, "Иванова", "Мария", email="мария@почта.рф")
+    ]
+    table = ClientTable(clients)
+
+    print(f"✅ Клиентов в таблице: {len(table)}")
+    print(f"✅ Последний клиент: {table[-1]}")
+    assert len(table) == 3
+    assert list(table) == clients
+    assert table[-1].email == "мария@почта.рф"
+    assert table[1].phone is None
+
+
+def test_table_errors():
+    """Тест ошибок ClientTable."""
+    print("\n🧪 Тестирование ошибок ClientTable:")
+
+    table = ClientTable()
+    try:
+        table[0]
+    except IndexError as e:
+        print(f"✅ Пустая таблица: {e}")
+    else:
+        assert False, "Ожидалась ошибка IndexError"
+
+
+if __name__ == "__main__":
+    print("🚀 Компактное хранение клиентов")
+    print("=" * 60)
+    test_slots()
+    test_table_round_trip()
+    test_table_errors()
+    print("=" * 60)
@@ -0,0 +1,68 @@
+from client import Client
+from dedup import find_duplicates, is_same_person
+
+
+def test_find_duplicates():
+    """Тест поиска и объединения дубликатов."""
+    print("🧪 Тестирование поиска дубликатов:")
+
+    clients = [
+        Client(1, "Иванов", "Иван", phone="+7 (916) 123-45-67", registration_date="2023-05-01"),
+        Client(7, "ИВАНОВ", "иван", "Иванович", phone="89161234567", email="Ivanov@Mail.ru",
+               registration_date="2022-01-10"),
+        Client(9, "Иванов", "Иван", email="ivanov@mail.ru"),
+        # Родственница с тем же телефоном - не дубликат
+        Client(3, "Иванова", "Мария", phone="+79161234567"),
+        Client(4, "Петров", "Петр", phone="+79161234567"),
+        Client(5, "Сидоров", "Алексей", "Николаевич", email="s@mail.ru"),
+        Client(6, "Сидоров", "Алексей", "Петрович", email="S@mail.ru")
+    ]
+    clusters = find_duplicates(clients)
+    for cluster in clusters:
+        print(f"✅ {cluster}")
+
+    assert len(clusters) == 1
+    cluster = clusters[0]
+    assert sorted(client.client_id for client in cluster.clients) == [1, 7, 9]
+    assert cluster.merged == Client(7, "ИВАНОВ", "иван", "Иванович", "89161234567",
+                                    "Ivanov@Mail.ru", "2022-01-10")
+
+
+def test_different_surnames_are_not_merged():
+    """Тест: общий телефон и имя при разных фамилиях - не дубликаты."""
+    print("\n🧪 Тестирование сравнения фамилий:")
+
+    ivanov = Client(1, "Иванов", "Иван", phone="+79161234567")
+    ivanenko = Client(2, "Иваненко", "Иван", phone="89161234567")
+    assert not is_same_person(ivanov, ivanenko)
+    assert find_duplicates([ivanov, ivanenko]) == []
+    # Женская форма фамилии и 'ё' допускаются
+    assert is_same_person(Client(3, "Королёва", "Анна"), Client(4, "королева", "Анна"))
+    assert is_same_person(Client(5, "Вишневская", "Ольга"), Client(6, "Вишневский", "Ольга"))
+    print("✅ Иванов и Иваненко не объединены, формы фамилии учитываются")
+
+
+def test_conflicting_patronymics_are_not_chained():
+    """Тест: клиент без отчества не связывает клиентов с разными отчествами."""
+    print("\n🧪 Тестирование цепочек через клиента без отчества:")
+
+    clients = [
+        Client(1, "Иванов", "Иван", "Петрович", phone="+79161234567"),
+        Client(2, "Иванов", "Иван", phone="+79161234567", email="ivanov@mail.ru"),
+        Client(3, "Иванов", "Иван", "Сергеевич", email="ivanov@mail.ru"),
+    ]
+    clusters = find_duplicates(clients)
+    for cluster in clusters:
+        print(f"✅ {cluster}")
+    assert len(clusters) == 1
+    patronymics = {client.patronymic for client in clusters[0].clients}
+    assert patronymics in ({"Петрович", None}, {"Сергеевич", None})
+
+
+if __name__ == "__main__":
+    print("🚀 Поиск дубликатов клиентов")
+    print("=" * 60)
+    test_find_duplicates()
+    test_different_surnames_are_not_merged()
+    test_conflicting_patronymics_are_not_chained()
+    print("=" * 60)
@@ -0,0 +1,41 @@
+import instrumentation
+from client import Client
+
+
+def test_counters():
+    """Тест счетчиков вызовов, ошибок и времени."""
+    print("🧪 Тестирование инструментирования:")
+
+    original_init = Client.__dict__["__init__"]
+    instrumentation.reset()
+    with instrumentation.instrumented():
+        client = Client.from_json('{"client_id": 1, "last_name": "Иванов", "first_name": "Иван"}')
+        client.to_json()
+        try:
+            Client(1, "Иванов", "Иван", phone="позвонить")
+        except ValueError:
+            pass
+
+    metrics = instrumentation.snapshot()
+    for name, values in metrics.items():
+        print(f"✅ {name}: {values}")
+
+    assert not instrumentation.is_enabled()
+    assert Client.__dict__["__init__"] is original_init
+    assert metrics["Client.from_json"]["calls"] == 1
+    assert metrics["Client.from_dict"]["calls"] == 1
+    assert metrics["Client.to_dict"]["calls"] == 1
+    assert metrics["Client.__init__"] == {"calls": 2, "failures": 1,
+                                          "seconds": metrics["Client.__init__"]["seconds"]}
+    assert metrics["validate.phone"]["failures"] == 1
+    assert 'barbershop_calls_total{name="validate.last_name"} 2' in instrumentation.to_prometheus()
+
+    Client(2, "Петров", "Петр")
+    assert instrumentation.snapshot()["Client.__init__"]["calls"] == 2
+
+
+if __name__ == "__main__":
+    print("🚀 Инструментирование горячих путей")
+    print("=" * 60)
+    test_counters()
+    print("=" * 60)
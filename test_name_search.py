@@ -0,0 +1,85 @@
+from client import Client
+from name_search import NameSearchIndex
+from short_client import ShortClient
+
+
+def make_index() -> NameSearchIndex:
+    return NameSearchIndex([
+        ShortClient(1, "Иванов", "Иван", "Петрович"),
+        Client(2, "Иванова", "Мария"),
+        ShortClient(3, "Петров", "Иван"),
+        ShortClient(4, "Римский-Корсаков", "Николай"),
+        ShortClient(5, "Ивонов", "Пётр")
+    ])
+
+
+def ids(clients: list) -> list:
+    return [client.client_id for client in clients]
+
+
+def test_prefix_search():
+    """Тест поиска по префиксу с ранжированием."""
+    print("🧪 Тестирование поиска по префиксу:")
+
+    index = make_index()
+    print(f"✅ 'Ива': {[str(client) for client in index.search('Ива')]}")
+    assert ids(index.search("Ива", max_typos=0)) == [1, 2, 3]
+    assert ids(index.search("иван", max_typos=0)) == [1, 3, 2]
+    assert ids(index.search("корс")) == [4]
+    assert ids(index.search("Иван Пет", max_typos=0)) == [3, 1]
+    assert index.search("   ") == []
+
+
+def test_typo_search():
+    """Тест поиска с опечатками."""
+    print("\n🧪 Тестирование поиска с опечатками:")
+
+    index = make_index()
+    print(f"✅ 'Иваной': {[str(client) for client in index.search('Иваной')]}")
+    assert ids(index.search("Ивонов"))[0] == 5
+    assert 1 in ids(index.search("Иваной"))
+    assert ids(index.search("Ивонов", limit=1)) == [5]
+
+
+def test_incremental_updates():
+    """Тест добавления и удаления клиентов."""
+    print("\n🧪 Тестирование обновления индекса:")
+
+    index = make_index()
+    index.add(ShortClient(6, "Иваненко", "Олег"))
+    index.remove(1)
+    print(f"✅ После изменений: {[str(client) for client in index.search('Иван', max_typos=0)]}")
+    assert ids(index.search("Иван", max_typos=0)) == [3, 2, 6]
+    assert len(index) == 5
+
+    # Повторяющиеся части составного имени
+    index.add(ShortClient(7, "Ким-Ким", "Ким"))
+    index.add(ShortClient(7, "Ким-Ким", "Ким"))
+    assert ids(index.search("ким ким")) == [7]
+    index.remove(7)
+    assert index.search("ким") == []
+    print("✅ 'Ким-Ким' добавлен повторно и удален")
+
+
+def test_short_words_are_bounded():
+    """Тест: запрос из коротких слов не перебирает все сочетания токенов."""
+    print("\n🧪 Тестирование запросов из коротких слов:")
+
+    surnames = [f"А{chr(0x430 + a)}{chr(0x430 + b)}ов" for a in range(32) for b in range(32)]
+    index = NameSearchIndex(ShortClient(number, surname, "Алексей", "Антонович")
+                            for number, surname in enumerate(surnames, start=1))
+    index.add(ShortClient(5000, "Орлов", "Олег", "Олегович"))
+    found = index.search("а а а")
+    assert found and all(client.first_name == "Алексей" for client in found)
+    assert index.search("о о о о") == []
+    print(f"✅ 'а а а': {[str(client) for client in found[:3]]}")
+
+
+if __name__ == "__main__":
+    print("🚀 Поиск клиентов по ФИО")
+    print("=" * 60)
+    test_prefix_search()
+    test_typo_search()
+    test_incremental_updates()
+    test_short_words_are_bounded()
+    print("=" * 60)
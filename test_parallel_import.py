@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+
+from client import Client
+from parallel_import import parallel_import
+
+
+def test_parallel_import_keeps_order():
+    """Тест параллельного импорта с сохранением порядка и ошибок."""
+    print("🧪 Тестирование parallel_import:")
+
+    lines = []
+    for client_id in range(1, 201):
+        if client_id % 50 == 0:
+            lines.append('{"client_id": 0, "last_name": "Иванов", "first_name": "Иван"}')
+        else:
+            lines.append(json.dumps({"client_id": client_id, "last_name": "Иванов",
+                                     "first_name": "Иван"}, ensure_ascii=False))
+    lines.insert(10, "")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.jsonl")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+        expected = Client.load_many(path)
+        for workers in (1, 3):
+            clients, errors = parallel_import(path, workers=workers)
+            print(f"✅ Процессов: {workers}, клиентов: {len(clients)}, ошибок: {len(errors)}")
+            assert (clients, errors) == expected
+            assert [line for line, _ in errors] == [51, 101, 151, 201]
+
+
+def test_invalid_utf8_and_workers():
+    """Тест: строка не в UTF-8 - ошибка, как в load_many; workers=0 отклоняется."""
+    print("\n🧪 Тестирование строки не в UTF-8 и числа процессов:")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.jsonl")
+        with open(path, "wb") as file:
+            file.write('{"client_id": 1, "last_name": "Иванов", "first_name": "Иван"}\n'.encode("utf-8"))
+            file.write(b'{"client_id": 2, "last_name": "\xff\xfeab", "first_name": "Petr"}\n')
+
+        expected = Client.load_many(path)
+        for workers in (1, 2):
+            clients, errors = parallel_import(path, workers=workers)
+            assert (clients, errors) == expected
+            assert [client.client_id for client in clients] == [1] and errors[0][0] == 2
+        print(f"✅ Ошибка: {errors[0]}")
+
+        try:
+            parallel_import(path, workers=0)
+        except ValueError as error:
+            print(f"✅ workers=0: {error}")
+        else:
+            assert False, "Ожидалась ошибка ValueError"
+
+
+if __name__ == "__main__":
+    print("🚀 Параллельный импорт клиентов")
+    print("=" * 60)
+    test_parallel_import_keeps_order()
+    test_invalid_utf8_and_workers()
+    print("=" * 60)
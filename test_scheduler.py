@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from appointment import Appointment
+from scheduler import Scheduler
+
+
+def at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2024, 3, day, hour, minute)
+
+
+def make_scheduler() -> Scheduler:
+    scheduler = Scheduler()
+    scheduler.add_barber(1, branch_id=1)
+    scheduler.add_barber(2, branch_id=1)
+    scheduler.add_barber(3, branch_id=2)
+    scheduler.book(Appointment(1, 10, 1, 1, at(1, 10), at(1, 11)))
+    scheduler.book(Appointment(2, 11, 1, 1, at(1, 12), at(1, 13)))
+    scheduler.book(Appointment(3, 10, 2, 1, at(1, 10), at(1, 20, 30)))
+    return scheduler
+
+
+def test_conflicts():
+    """Тест обнаружения пересечений."""
+    print("🧪 Тестирование пересечений записей:")
+
+    scheduler = make_scheduler()
+    try:
+        scheduler.book(Appointment(4, 12, 1, 1, at(1, 10, 30), at(1, 11, 30)))
+    except ValueError as e:
+        print(f"✅ Ошибка: {e}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+    scheduler.book(Appointment(4, 12, 1, 1, at(1, 11), at(1, 12)))
+    assert [a.appointment_id for a in scheduler.conflicts(1, at(1, 9), at(1, 12, 30))] == [1, 4, 2]
+    assert [a.appointment_id for a in scheduler.appointments_for_client(10)] == [1, 3]
+
+
+def test_free_slots():
+    """Тест поиска свободных окон."""
+    print("\n🧪 Тестирование свободных окон:")
+
+    scheduler = make_scheduler()
+    slots = scheduler.find_free_slots(at(1, 0), at(2, 0), timedelta(hours=1), branch_id=1)
+    for start, end, barber_id in slots:
+        print(f"✅ Мастер {barber_id}: {start:%H:%M}-{end:%H:%M}")
+    assert slots == [(at(1, 11), at(1, 12), 1), (at(1, 13), at(1, 21), 1)]
+
+    slots = scheduler.find_free_slots(at(1, 12), at(3, 0), timedelta(minutes=30), limit=4)
+    assert slots == [(at(1, 12), at(1, 21), 3), (at(1, 13), at(1, 21), 1),
+                     (at(1, 20, 30), at(1, 21), 2), (at(2, 10), at(2, 21), 1)]
+
+
+def test_reschedule_many():
+    """Тест атомарного переноса записей."""
+    print("\n🧪 Тестирование переноса записей:")
+
+    scheduler = make_scheduler()
+    moved = scheduler.reschedule_many([(1, at(2, 10)), (2, at(2, 11), 3)])
+    print(f"✅ Перенесено: {moved}")
+    assert scheduler.get(2).barber_id == 3 and scheduler.get(2).branch_id == 2
+    assert scheduler.conflicts(1, at(1, 0), at(2, 0)) == []
+
+    try:
+        scheduler.reschedule_many([(1, at(3, 10)), (3, at(2, 11, 30), 3)])
+    except ValueError as e:
+        print(f"✅ Ошибка: {e}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+    assert scheduler.get(1).start == at(2, 10)
+    assert scheduler.get(3).barber_id == 2
+
+
+if __name__ == "__main__":
+    print("🚀 Расписание мастеров")
+    print("=" * 60)
+    test_conflicts()
+    test_free_slots()
+    test_reschedule_many()
+    print("=" * 60)
@@ -1,5 +1,7 @@
+import io
+
 from client import Client
-from short_client import ShortClient
+from short_client import ShortClient, project_short
 
 
 def test_short_client_creation():
@@ -27,11 +29,83 @@ def test_from_client_conversion():
     print(f"✅ Краткая версия: {short_client}")
     print(f"✅ Только ФИО: {short_client.get_full_name()}")
 
+    assert type(short_client) is ShortClient
+    assert short_client == ShortClient(1, "Иванов", "Иван", "Иванович")
+    assert short_client.last_name is full_client.last_name
+    assert hash(short_client) == hash(full_client)
+
+
+def test_project_short():
+    """Тест ленивой проекции списка Client в ShortClient."""
+    print("\n🧪 Тестирование project_short:")
+
+    clients = [Client(1, "Иванов", "Иван", "Иванович"),
+               Client(2, "Петрова", "Анна", phone="+79161234567"),
+               Client(3, "Сидоров", "Алексей")]
+    projection = project_short(clients)
+    assert len(projection) == 3
+    assert projection[1] == ShortClient(2, "Петрова", "Анна")
+    assert [short.client_id for short in projection[1:]] == [2, 3]
+    assert all(type(short) is ShortClient for short in projection.to_list())
+    print(f"✅ {projection}: {[str(short) for short in projection]}")
+
+    # Клиент добавлен после создания проекции - представление его видит
+    clients.append(Client(4, "Козлов", "Олег"))
+    assert projection[-1].last_name == "Козлов"
+    print("✅ Проекция отражает изменения исходного списка")
+
+    try:
+        project_short(["Иванов Иван"])[0]
+    except ValueError as error:
+        print(f"✅ Не клиент: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
+
+def test_parse_names():
+    """Тест потокового разбора строк ФИО."""
+    print("\n🧪 Тестирование ShortClient.parse_names:")
+
+    source = io.StringIO("Иванов Иван Иванович\n"
+                         "  Петрова   Анна  \n"
+                         "\n"
+                         "Петров - Водкин Кузьма Сергеевич\n"
+                         "Мамедов Рашид Алиевич оглы\n"
+                         "И Иван\n"
+                         "Сидоров\n"
+                         "Римская-Корсакова Надежда Николаевна\n")
+    errors = []
+    clients = ShortClient.parse_names(source, id_start=100, errors=errors)
+    assert not errors, "Разбор должен быть ленивым"
+
+    clients = list(clients)
+    assert [client.client_id for client in clients] == [100, 101, 102, 103, 104]
+    assert clients[1] == ShortClient(101, "Петрова", "Анна")
+    assert clients[2].last_name == "Петров-Водкин"
+    assert clients[3].patronymic == "Алиевич оглы"
+    assert clients[4].last_name == "Римская-Корсакова"
+    assert [line for line, _ in errors] == [6, 7]
+    print(f"✅ Разобрано: {[str(client) for client in clients]}")
+    print(f"✅ Ошибки: {errors}")
+
+    client = next(Client.parse_names(["Козлов Олег Павлович"]))
+    assert isinstance(client, Client) and client.phone is None
+    print(f"✅ Разбор в Client: {client!r}")
+
+    try:
+        ShortClient.from_full_name_string("Иванов Иван Иванович Петрович")
+    except ValueError as error:
+        print(f"✅ Лишние части: {error}")
+    else:
+        assert False, "Ожидалась ошибка ValueError"
+
 
 if __name__ == "__main__":
     print("🚀 Задание 8 - Класс краткого представления клиента")
     print("=" * 60)
     test_short_client_creation()
     test_from_client_conversion()
+    test_project_short()
+    test_parse_names()
     print("=" * 60)
     print("🎉 Задание 8 завершено!")
\ No newline at end of file
@@ -0,0 +1,63 @@
+from client import Client
+
+
+def test_values_are_stripped():
+    """Тест очистки значений от пробелов."""
+    print("🧪 Тестирование очистки значений:")
+
+    client = Client(1, " Иванов ", " Иван ", " Иванович ", " +7 (916) 123-45-67 ",
+                    " ivanov@mail.ru ", " 2024-01-15 ")
+    print(f"✅ {client.to_dict()}")
+    assert client.to_dict() == {
+        "client_id": 1, "last_name": "Иванов", "first_name": "Иван", "patronymic": "Иванович",
+        "phone": "+7 (916) 123-45-67", "email": "ivanov@mail.ru", "registration_date": "2024-01-15"
+    }
+
+
+def test_invalid_values():
+    """Тест сообщений об ошибках валидации."""
+    print("\n🧪 Тестирование ошибок валидации:")
+
+    cases = [
+        (dict(client_id=0), "ID клиента должен быть положительным целым числом"),
+        (dict(last_name="И"), "Фамилия должна содержать минимум 2 символов"),
+        (dict(first_name="  "), "Имя не может быть пустой"),
+        (dict(patronymic=""), "Отчество не может быть пустой"),
+        (dict(phone="позвонить"), "Телефон имеет неверный формат"),
+        (dict(phone="((((("), "Телефон имеет неверный формат"),
+        (dict(phone="(1) - 2 - 3"), "Телефон имеет неверный формат"),
+        (dict(email="ivanov.mail.ru"), "Email должен содержать символ @"),
+        (dict(email="ivanov@mail"), "Email должен содержать домен с точкой"),
+        (dict(registration_date="2024-02-30"),
+         "Дата регистрации должна быть корректной датой в формате ГГГГ-ММ-ДД"),
+        (dict(registration_date="15.01.2024"),
+         "Дата регистрации должна быть корректной датой в формате ГГГГ-ММ-ДД"),
+    ]
+    for override, expected in cases:
+        data = {"client_id": 1, "last_name": "Иванов", "first_name": "Иван", **override}
+        try:
+            Client.from_dict(data)
+        except ValueError as e:
+            print(f"✅ {override}: {e}")
+            assert str(e) == expected
+        else:
+            assert False, f"Ожидалась ошибка для {override}"
+
+
+def test_trusted_construction():
+    """Тест создания без повторной валидации."""
+    print("\n🧪 Тестирование from_dict(trusted=True):")
+
+    data = {"client_id": 1, "last_name": "Иванов", "first_name": "Иван", "email": "ivanov@mail.ru"}
+    client = Client.from_dict(data, trusted=True)
+    print(f"✅ {client!r}")
+    assert client == Client.from_dict(data)
+
+
+if __name__ == "__main__":
+    print("🚀 Валидация полей клиента")
+    print("=" * 60)
+    test_values_are_stripped()
+    test_invalid_values()
+    test_trusted_construction()
+    print("=" * 60)
@@ -0,0 +1,99 @@
+"""
+Правила валидации полей клиента.
+Каждое правило - функция, которая проверяет значение, один раз очищает
+его от пробелов и возвращает готовое к сохранению значение.
+Регулярные выражения компилируются один раз при создании правила.
+"""
+import re
+from datetime import date
+
+# Опережающая проверка требует не меньше 5 цифр, чтобы не проходили строки вроде "((((("
+PHONE_PATTERN = re.compile(r'(?=(?:\D*\d){5})\+?[\d(][\d\s()\-]{4,19}')
+EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+def positive_int(field_name: str):
+    """Правило для положительного целого числа."""
+    def rule(value):
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"{field_name} должен быть положительным целым числом")
+        return value
+    return rule
+
+
+def required_string(field_name: str, min_length: int = 1):
+    """Правило для обязательной строки."""
+    def rule(value):
+        stripped = value.strip() if isinstance(value, str) else None
+        if not stripped:
+            raise ValueError(f"{field_name} не может быть пустой")
+        if len(stripped) < min_length:
+            raise ValueError(f"{field_name} должна содержать минимум {min_length} символов")
+        return stripped
+    return rule
+
+
+def optional_string(field_name: str):
+    """Правило для опциональной строки."""
+    def rule(value):
+        if value is None:
+            return None
+        stripped = value.strip() if isinstance(value, str) else None
+        if not stripped:
+            raise ValueError(f"{field_name} не может быть пустой")
+        return stripped
+    return rule
+
+
+def phone(field_name: str = "Телефон"):
+    """
+    Правило для телефона: цифры, +, пробелы, скобки и дефисы
+    (от 5 до 20 символов, из них не меньше 5 цифр).
+    """
+    def rule(value):
+        if value is None:
+            return None
+        stripped = value.strip() if isinstance(value, str) else None
+        if not stripped:
+            raise ValueError(f"{field_name} не может быть пустой")
+        if PHONE_PATTERN.fullmatch(stripped) is None:
+            raise ValueError(f"{field_name} имеет неверный формат")
+        return stripped
+    return rule
+
+
+def email(field_name: str = "Email"):
+    """Правило для email. Пустая строка допускается и сохраняется как None."""
+    def rule(value):
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise ValueError(f"{field_name} должен быть строкой")
+        stripped = value.strip()
+        if stripped and EMAIL_PATTERN.fullmatch(stripped) is None:
+            if '@' not in stripped:
+                raise ValueError(f"{field_name} должен содержать символ @")
+            if '.' not in stripped.split('@')[-1]:
+                raise ValueError(f"{field_name} должен содержать домен с точкой")
+            raise ValueError(f"{field_name} имеет неверный формат")
+        return stripped or None
+    return rule
+
+
+def iso_date(field_name: str):
+    """Правило для опциональной даты в формате ГГГГ-ММ-ДД."""
+    def rule(value):
+        if value is None:
+            return None
+        stripped = value.strip() if isinstance(value, str) else None
+        if not stripped:
+            raise ValueError(f"{field_name} не может быть пустой")
+        # fromisoformat принимает и другие варианты ISO, поэтому формат проверяется отдельно
+        if len(stripped) != 10 or stripped[4] != '-' or stripped[7] != '-':
+            raise ValueError(f"{field_name} должна быть корректной датой в формате ГГГГ-ММ-ДД")
+        try:
+            date.fromisoformat(stripped)
+        except ValueError:
+            raise ValueError(f"{field_name} должна быть корректной датой в формате ГГГГ-ММ-ДД")
+        return stripped
+    return rule